@@ -1,21 +1,97 @@
 # app/utils/ai.py
 
 import httpx
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Union, Iterable, AsyncIterator, Awaitable, Callable, Tuple
 import json
 import asyncio
 import re
+import time
 from collections import Counter
+from functools import lru_cache
 
 from ..config import settings
+from .llm_cache import get_response_cache, make_cache_key, should_cache
+from .jd_profiles import JDProfile, get_jd_profile_registry, jd_hash
+from .rate_limit import get_rate_limiter
+from .hedging import HedgePolicy, get_hedge_policy, get_latency_tracker
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .json_stream import JSONObjectStream
+from .parser import TIER1_CONFIDENCE_THRESHOLD, parse_sections, split_into_chunks
+from .parse_metrics import FAILED, HYBRID, LLM, RULES, get_parse_metrics
+from .telemetry import error_class, get_telemetry
+from .corpus_stats import RESUME_STOP_WORDS, SCORING_MODES, get_corpus_stats, tokenize_resume
+from .skill_matcher import SkillMatcher, get_skill_matcher
+from .jd_keywords import JD_KEYWORD_MODES, extract_jd_keywords_local
+from .bullet_metrics import BEST_EFFORT, FALLBACK, FIRST, REGENERATED, SPECULATIVE, get_bullet_metrics
+from .quality_model import (
+    METRIC_PATTERN, QUALITY_SCORING_MODES, STRONG_VERBS,
+    extract_quality_features, get_quality_model, log_llm_scores
+)
 
 # --- Configuration ---
 API_URL = "https://openrouter.ai/api/v1/chat/completions"
+REQUEST_TIMEOUT = 120.0
 
 class OpenRouterError(RuntimeError):
     """Custom exception for AI API errors."""
     pass
 
+# --- Shared HTTP client ---
+# One pooled client is reused by every OpenRouter call so that connections
+# (and their TLS sessions) are kept alive between requests instead of being
+# re-established for each prompt.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Creates the pooled client from the connection settings."""
+    limits = httpx.Limits(
+        max_connections=getattr(settings, "OPENROUTER_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=getattr(settings, "OPENROUTER_MAX_KEEPALIVE_CONNECTIONS", 10),
+        keepalive_expiry=getattr(settings, "OPENROUTER_KEEPALIVE_EXPIRY", 30.0),
+    )
+    timeout = httpx.Timeout(getattr(settings, "OPENROUTER_TIMEOUT", REQUEST_TIMEOUT))
+    http2 = bool(getattr(settings, "OPENROUTER_HTTP2", False))
+    try:
+        return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2)
+    except ImportError:
+        # HTTP/2 needs the optional "h2" package (pip install httpx[http2])
+        print("HTTP/2 requested but the 'h2' package is not installed. Using HTTP/1.1.")
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared pooled client, creating it on first use.
+    A client is bound to the event loop it was created on, so a new one is
+    built if the caller is running on a different loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = _build_http_client()
+        _http_client_loop = loop
+    return _http_client
+
+
+async def startup_http_client() -> httpx.AsyncClient:
+    """Application startup hook: opens the shared client eagerly."""
+    return get_http_client()
+
+
+async def shutdown_http_client() -> None:
+    """Application shutdown hook: closes pooled connections."""
+    global _http_client, _http_client_loop
+    client = _http_client
+    _http_client = None
+    _http_client_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+# Generated bullets scoring below this (assess_bullet_quality) are regenerated
+BULLET_QUALITY_THRESHOLD = 0.6
+
 # Section-specific configurations for optimal bullet generation
 SECTION_CONFIGS = {
     "experience": {
@@ -56,16 +132,29 @@ SECTION_CONFIGS = {
     }
 }
 
+def _require_api_key() -> str:
+    """
+    The OpenRouter API key. Callers that consult a circuit breaker check it
+    first, so a missing key never holds a half-open probe slot.
+    """
+    api_key = settings.OPENROUTER_API_KEY
+    if not api_key:
+        raise OpenRouterError("OPENROUTER_API_KEY environment variable is not set.")
+    return api_key
+
+
 async def _call_openrouter(
     messages: List[Dict[str, str]],
     model: str,
     response_format: Optional[Dict[str, str]] = None,
     temperature: float = 0.1,
+    task: Optional[str] = None,
 ) -> str:
-    """Internal function to make a call to the OpenRouter API."""
-    api_key = settings.OPENROUTER_API_KEY
-    if not api_key:
-        raise OpenRouterError("OPENROUTER_API_KEY environment variable is not set.")
+    """
+    Internal function to make a call to the OpenRouter API.
+    `task` tags the call in telemetry.
+    """
+    api_key = _require_api_key()
 
     headers = {"Authorization": f"Bearer {api_key}"}
     payload: Dict[str, Any] = {
@@ -76,90 +165,616 @@ async def _call_openrouter(
     }
     if response_format:
         payload["response_format"] = response_format
-
-    async with httpx.AsyncClient() as client:
+    if getattr(settings, "OPENROUTER_USAGE_ACCOUNTING", False):
+        payload["usage"] = {"include": True}
+
+    client = get_http_client()
+    breaker = get_circuit_breaker(model)
+    telemetry = get_telemetry()
+    is_fallback = model != settings.OPENROUTER_MODEL
+    started = time.perf_counter()
+    attempt_seconds = 0.0
+
+    async def post() -> httpx.Response:
+        # Provider latency of one attempt, without limiter queueing or backoff
+        nonlocal attempt_seconds
+        attempt_started = time.perf_counter()
         try:
-            response = await client.post(API_URL, headers=headers, json=payload, timeout=120.0)
-            response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 429:
-                raise OpenRouterError("You have exceeded your daily limit for free models. Please try again tomorrow or add credits to your OpenRouter account.")
-            raise OpenRouterError(f"API request failed with status {exc.response.status_code}: {exc.response.text}")
-        except httpx.TimeoutException:
-            raise OpenRouterError(f"API request timed out for model {model}.")
-        except Exception as e:
-            raise OpenRouterError(f"An unexpected error occurred during the API call: {e}")
+            return await client.post(API_URL, headers=headers, json=payload)
+        finally:
+            attempt_seconds = time.perf_counter() - attempt_started
+
+    try:
+        # The limiter paces requests and retries 429/5xx responses with backoff
+        response = await get_rate_limiter().send(post)
+        response.raise_for_status()
+        data = response.json()
+        content = data["choices"][0]["message"]["content"]
+        get_latency_tracker().record(model, attempt_seconds)
+        breaker.record_success(attempt_seconds)
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, usage=data.get("usage"))
+        return content
+    except asyncio.CancelledError as e:
+        breaker.release_probe()
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, error=error_class(e))
+        raise
+    except Exception as e:
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, error=error_class(e))
+        raise _to_openrouter_error(e, model, breaker)
+
+
+def _to_openrouter_error(exc: Exception, model: str, breaker: CircuitBreaker) -> OpenRouterError:
+    """Records a failed call on the model's breaker and converts it to an OpenRouterError."""
+    if isinstance(exc, OpenRouterError):
+        breaker.record_failure()
+        return exc
+    if isinstance(exc, httpx.HTTPStatusError):
+        # Only throttling and server-side errors say anything about model health
+        if exc.response.status_code == 429 or exc.response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.release_probe()
+        if exc.response.status_code == 429:
+            return OpenRouterError(f"OpenRouter rate limit exceeded for model {model} after retrying. If this persists you may have hit the daily limit for free models; add credits to your OpenRouter account.")
+        return OpenRouterError(f"API request failed with status {exc.response.status_code}: {exc.response.text}")
+    breaker.record_failure()
+    if isinstance(exc, httpx.TimeoutException):
+        return OpenRouterError(f"API request timed out for model {model}.")
+    return OpenRouterError(f"An unexpected error occurred during the API call: {exc}")
+
+
+def _parse_sse_line(line: str, usage: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Extracts the text delta from one line of an OpenRouter SSE stream.
+    Returns None for comments, keep-alives and chunks without content.
+    The usage block sent with the final chunk is copied into `usage`.
+    """
+    if not line.startswith("data:"):
+        return None  # Blank separators and ": OPENROUTER PROCESSING" comments
+    data = line[len("data:"):].strip()
+    if not data or data == "[DONE]":
+        return None
+    chunk = json.loads(data)
+    if "error" in chunk:
+        raise OpenRouterError(f"Stream error from provider: {chunk['error']}")
+    if usage is not None and chunk.get("usage"):
+        usage.update(chunk["usage"])
+    choices = chunk.get("choices") or [{}]
+    return (choices[0].get("delta") or {}).get("content") or None
+
+
+async def _stream_openrouter(
+    messages: List[Dict[str, str]],
+    model: str,
+    response_format: Optional[Dict[str, str]] = None,
+    temperature: float = 0.1,
+    task: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """Streaming counterpart of _call_openrouter: yields text deltas as they arrive."""
+    api_key = _require_api_key()
 
-async def chat_json(messages: List[Dict[str, str]], temperature: float = 0.1) -> Dict[str, Any]:
-    """Sends a request to the OpenRouter API expecting a JSON response with fallback logic."""
+    headers = {"Authorization": f"Bearer {api_key}"}
+    payload: Dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": 4096,
+        "stream": True,
+    }
+    if response_format:
+        payload["response_format"] = response_format
+    if getattr(settings, "OPENROUTER_USAGE_ACCOUNTING", False):
+        payload["usage"] = {"include": True}
+
+    client = get_http_client()
+    limiter = get_rate_limiter()
+    breaker = get_circuit_breaker(model)
+    telemetry = get_telemetry()
+    is_fallback = model != settings.OPENROUTER_MODEL
+    usage: Dict[str, Any] = {}
+    started = time.perf_counter()
+    attempt = 0
     try:
-        response_text = await _call_openrouter(
-            messages,
-            model=settings.OPENROUTER_MODEL,
-            response_format={"type": "json_object"},
-            temperature=temperature,
+        while True:
+            async with limiter.slot() as outcome:
+                # Provider latency excludes limiter queueing and retry backoff
+                attempt_started = time.perf_counter()
+                async with client.stream("POST", API_URL, headers=headers, json=payload) as response:
+                    outcome.record(response)
+                    # Throttling and upstream errors arrive before the first
+                    # byte of the body, so they can still be retried
+                    retry = limiter.should_retry(attempt, outcome)
+                    if not retry:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if line.strip() == "data: [DONE]":
+                                break
+                            delta = _parse_sse_line(line, usage)
+                            if delta:
+                                yield delta
+            if not retry:
+                break
+            attempt += 1
+            limiter.counters["retries"] += 1
+            await asyncio.sleep(limiter.backoff_delay(attempt, outcome.retry_after))
+
+        attempt_seconds = time.perf_counter() - attempt_started
+        get_latency_tracker().record(model, attempt_seconds)
+        breaker.record_success(attempt_seconds)
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, usage=usage)
+    except (asyncio.CancelledError, GeneratorExit):
+        breaker.release_probe()
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, error="cancelled")
+        raise
+    except Exception as e:
+        telemetry.record_call(task, model, time.perf_counter() - started, fallback=is_fallback, error=error_class(e))
+        raise _to_openrouter_error(e, model, breaker)
+
+async def _call_with_fallback(
+    messages: List[Dict[str, str]],
+    temperature: float,
+    response_format: Optional[Dict[str, str]] = None,
+    hedge: Optional[bool] = None,
+    task: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Calls the primary model and falls back to OPENROUTER_FALLBACK_MODEL.
+    With hedging enabled the fallback is raced against a slow primary
+    instead of waiting for the primary to fail.
+    Returns the response text and the model that produced it.
+    """
+    _require_api_key()
+    primary = settings.OPENROUTER_MODEL
+    fallback = settings.OPENROUTER_FALLBACK_MODEL
+
+    async def call(model: str) -> Tuple[str, str]:
+        content = await _call_openrouter(
+            messages, model=model, response_format=response_format, temperature=temperature, task=task
         )
+        return content, model
+
+    if not fallback:
+        # Nothing to route around to: the primary's own calls probe its breaker
+        get_circuit_breaker(primary).refresh_state()
+    elif not get_circuit_breaker(primary).allow_request():
+        # Primary is known to be failing: go straight to the fallback
+        try:
+            return await call(fallback)
+        except OpenRouterError as fallback_e:
+            raise OpenRouterError(f"Primary model circuit is open and fallback failed. Last error: {fallback_e}")
+
+    policy = get_hedge_policy()
+    if fallback and (policy.enabled if hedge is None else hedge):
+        return await _hedged_call(call, primary, fallback, policy)
+
+    try:
+        return await call(primary)
     except OpenRouterError as e:
-        if not settings.OPENROUTER_FALLBACK_MODEL:
+        if not fallback:
             raise e  # Re-raise the original error if no fallback is configured
-        
-        print(f"Primary model failed: {e}. Retrying with fallback model: {settings.OPENROUTER_FALLBACK_MODEL}")
+
+        print(f"Primary model failed: {e}. Retrying with fallback model: {fallback}")
         try:
-            response_text = await _call_openrouter(
-                messages,
-                model=settings.OPENROUTER_FALLBACK_MODEL,
-                response_format={"type": "json_object"},
-                temperature=temperature,
-            )
+            return await call(fallback)
         except OpenRouterError as fallback_e:
             raise OpenRouterError(f"Primary and fallback models failed. Last error: {fallback_e}")
 
+
+async def _hedged_call(
+    call: Callable[[str], Awaitable[Tuple[str, str]]],
+    primary: str,
+    fallback: str,
+    policy: HedgePolicy,
+) -> Tuple[str, str]:
+    """
+    Starts the primary model; if it has not answered within the hedge delay,
+    starts the fallback too and returns whichever succeeds first. The loser
+    is cancelled.
+    """
+    policy.counters["calls"] += 1
+    tracker = get_latency_tracker()
+    delay = policy.delay_for(primary, tracker)
+    started = time.perf_counter()
+    primary_task = asyncio.ensure_future(call(primary))
+    fallback_task = None
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=delay)
+        if done:
+            try:
+                return primary_task.result()
+            except OpenRouterError as e:
+                # Failed fast rather than slow: plain sequential fallback
+                print(f"Primary model failed: {e}. Retrying with fallback model: {fallback}")
+                try:
+                    return await call(fallback)
+                except OpenRouterError as fallback_e:
+                    policy.counters["both_failed"] += 1
+                    raise OpenRouterError(f"Primary and fallback models failed. Last error: {fallback_e}")
+
+        policy.counters["hedged"] += 1
+        fallback_task = asyncio.ensure_future(call(fallback))
+        pending = {primary_task, fallback_task}
+        last_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    policy.counters["hedge_wins" if task is fallback_task else "primary_wins"] += 1
+                    return task.result()
+                last_error = task.exception()
+
+        policy.counters["both_failed"] += 1
+        raise OpenRouterError(f"Primary and fallback models failed. Last error: {last_error}")
+    finally:
+        if not primary_task.done():
+            # Record how long the cancelled primary had taken so far; dropping
+            # it would bias the latency window (and the hedge delay) low
+            tracker.record(primary, time.perf_counter() - started)
+            primary_task.cancel()
+        if fallback_task is not None and not fallback_task.done():
+            fallback_task.cancel()
+
+
+async def chat_json(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.1,
+    task: Optional[str] = None,
+    cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    Sends a request to the OpenRouter API expecting a JSON response with fallback logic.
+    `task` names the caller for the cache policy; `cache` overrides that policy.
+    `hedge` overrides the OPENROUTER_HEDGING setting for this call.
+    """
+    result, _ = await _chat_json(messages, temperature, task, cache, hedge)
+    return result
+
+
+async def _chat_json(
+    messages: List[Dict[str, str]],
+    temperature: float,
+    task: Optional[str],
+    cache: Optional[bool],
+    hedge: Optional[bool],
+) -> Tuple[Dict[str, Any], bool]:
+    """chat_json that also reports whether the answer came from the response cache."""
+    cache_key = None
+    if should_cache(task, temperature, cache):
+        cache_key = make_cache_key(messages, settings.OPENROUTER_MODEL, temperature, {"type": "json_object"})
+        cached = await get_response_cache().get(cache_key)
+        if cached is not None:
+            get_telemetry().record_cache_hit(task)
+            return json.loads(cached, strict=False), True
+
+    response_text, model = await _call_with_fallback(
+        messages,
+        temperature=temperature,
+        response_format={"type": "json_object"},
+        hedge=hedge,
+        task=task,
+    )
+
     try:
-        return json.loads(response_text, strict=False)
+        result = json.loads(response_text, strict=False)
     except json.JSONDecodeError:
         raise OpenRouterError(f"Failed to parse JSON from AI response. Raw response: {response_text}")
 
-async def chat_text(messages: List[Dict[str, str]], temperature: float = 0.5) -> str:
-    """Sends a request to the OpenRouter API expecting a plain text response with fallback logic."""
-    try:
-        response_text = await _call_openrouter(
-            messages,
-            model=settings.OPENROUTER_MODEL,
-            temperature=temperature,
-        )
-    except OpenRouterError as e:
-        if not settings.OPENROUTER_FALLBACK_MODEL:
-            raise e # Re-raise the original error if no fallback is configured
+    # The key names the primary model, so a fallback answer must not be stored under it
+    if cache_key and model == settings.OPENROUTER_MODEL:
+        await get_response_cache().set(cache_key, response_text)
+    return result, False
 
-        print(f"Primary model failed: {e}. Retrying with fallback model: {settings.OPENROUTER_FALLBACK_MODEL}")
+async def chat_text(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.5,
+    task: Optional[str] = None,
+    cache: Optional[bool] = None,
+    hedge: Optional[bool] = None,
+) -> str:
+    """
+    Sends a request to the OpenRouter API expecting a plain text response with fallback logic.
+    `task` names the caller for the cache policy; `cache` overrides that policy.
+    `hedge` overrides the OPENROUTER_HEDGING setting for this call.
+    """
+    cache_key = None
+    if should_cache(task, temperature, cache):
+        cache_key = make_cache_key(messages, settings.OPENROUTER_MODEL, temperature)
+        cached = await get_response_cache().get(cache_key)
+        if cached is not None:
+            get_telemetry().record_cache_hit(task)
+            return cached
+
+    response_text, model = await _call_with_fallback(messages, temperature=temperature, hedge=hedge, task=task)
+    response_text = response_text.strip()
+    if cache_key and model == settings.OPENROUTER_MODEL:
+        await get_response_cache().set(cache_key, response_text)
+    return response_text
+
+async def chat_text_stream(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.5,
+    task: Optional[str] = None,
+    cache: Optional[bool] = None,
+    response_format: Optional[Dict[str, str]] = None,
+) -> AsyncIterator[str]:
+    """
+    Streaming counterpart of chat_text: yields text deltas as they arrive.
+    Falls back to OPENROUTER_FALLBACK_MODEL only if the primary fails before
+    producing any output; a failure mid-stream is raised to the caller.
+    Pass response_format={"type": "json_object"} to stream a JSON document.
+    """
+    cache_key = None
+    if should_cache(task, temperature, cache):
+        cache_key = make_cache_key(messages, settings.OPENROUTER_MODEL, temperature, response_format)
+        cached = await get_response_cache().get(cache_key)
+        if cached is not None:
+            get_telemetry().record_cache_hit(task)
+            yield cached
+            return
+
+    _require_api_key()
+    primary = settings.OPENROUTER_MODEL
+    fallback = settings.OPENROUTER_FALLBACK_MODEL
+    models = [primary, fallback] if fallback else [primary]
+    if not fallback:
+        get_circuit_breaker(primary).refresh_state()
+    elif not get_circuit_breaker(primary).allow_request():
+        models = [fallback]
+
+    last_error: Optional[OpenRouterError] = None
+    for model in models:
+        parts: List[str] = []
+        stream = _stream_openrouter(
+            messages, model=model, response_format=response_format, temperature=temperature, task=task
+        )
         try:
-            response_text = await _call_openrouter(
-                messages,
-                model=settings.OPENROUTER_FALLBACK_MODEL,
-                temperature=temperature,
-            )
-        except OpenRouterError as fallback_e:
-            raise OpenRouterError(f"Primary and fallback models failed. Last error: {fallback_e}")
+            async for delta in stream:
+                parts.append(delta)
+                yield delta
+        except OpenRouterError as e:
+            if parts:
+                raise
+            last_error = e
+            if model != models[-1]:
+                print(f"Primary model failed: {e}. Retrying with fallback model: {fallback}")
+            continue
+        finally:
+            await stream.aclose()
+
+        if cache_key and model == primary:
+            await get_response_cache().set(cache_key, "".join(parts).strip())
+        return
 
-    return response_text.strip()
+    if len(models) > 1:
+        raise OpenRouterError(f"Primary and fallback models failed. Last error: {last_error}")
+    raise last_error
 
 # --- UNIVERSAL AI PARSING TASK ---
 
 
-async def parse_resume_to_json_async(text: str) -> Dict[str, Any]:
+async def parse_resume_to_json_async(text: str, chunked: Optional[bool] = None) -> Dict[str, Any]:
     """
     Universal AI parser with advanced structure detection and validation.
     Handles PDFs, DOCX, plain text, and unstructured formats.
+    Resumes longer than PARSE_CHUNK_CHARS are parsed section by section in
+    parallel; `chunked` forces that on or off.
+    """
+    try:
+        result = await _ai_parse_fields(text, chunked=chunked)
+        
+        # Validation layer
+        validated_result = validate_parsed_resume(result)
+        return validated_result
+        
+    except Exception as e:
+        print(f"AI parsing error: {str(e)}")
+        return {"error": f"Failed to parse resume: {str(e)}"}
+
+
+async def _ai_parse_fields(
+    text: str,
+    fields: Optional[List[str]] = None,
+    chunked: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Asks the LLM for `fields` (default: the whole schema) and returns the raw,
+    unvalidated result.
+
+    In chunked mode the resume is split at section boundaries and each chunk
+    is parsed concurrently against only its section's sub-schema, so latency
+    and output size are bounded by the largest chunk. Requested fields that
+    no detected section covers are asked of the whole text in one extra call.
+    Chunks that fail are retried once; fields still missing a chunk after
+    that are left out of the result, and only if every chunk fails is the
+    error raised.
+    """
+    max_chars = getattr(settings, "PARSE_CHUNK_CHARS", 6000)
+    if chunked is None:
+        chunked = len(text) > max_chars
+    chunks = split_into_chunks(text, max_chars, fields) if chunked else []
+
+    if len(chunks) < 2:
+        prompt = build_resume_parse_prompt(text, fields)
+        return await chat_json([{"role": "user", "content": prompt}], temperature=0.0, task="parse_resume")
+
+    def parse_chunk(chunk_fields: List[str], chunk: str) -> Awaitable[Dict[str, Any]]:
+        return chat_json(
+            [{"role": "user", "content": build_resume_parse_prompt(chunk, chunk_fields)}],
+            temperature=0.0,
+            task="parse_resume"
+        )
+
+    results = list(await asyncio.gather(*(parse_chunk(*c) for c in chunks), return_exceptions=True))
+    failed = [i for i, result in enumerate(results) if isinstance(result, Exception)]
+    if len(failed) == len(chunks):
+        raise results[0]
+    if failed:
+        print(f"{len(failed)} of {len(chunks)} resume chunks failed; retrying them")
+        retried = await asyncio.gather(*(parse_chunk(*chunks[i]) for i in failed), return_exceptions=True)
+        for i, result in zip(failed, retried):
+            results[i] = result
+
+    # A field split over several chunks is dropped entirely if any of them failed
+    lost = {
+        f for (chunk_fields, _), result in zip(chunks, results)
+        if isinstance(result, Exception) for f in chunk_fields
+    }
+    parsed = [
+        ([f for f in chunk_fields if f not in lost], result)
+        for (chunk_fields, _), result in zip(chunks, results) if not isinstance(result, Exception)
+    ]
+    if lost:
+        print(f"Resume chunk parsing failed for: {', '.join(sorted(lost))}")
+    return merge_chunk_results([chunk_fields for chunk_fields, _ in parsed], [result for _, result in parsed])
+
+
+def merge_chunk_results(chunk_fields: List[List[str]], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merges per-chunk parse results in document order: list fields are
+    concatenated (skills de-duplicated), string fields keep the first
+    non-empty value.
+    """
+    merged: Dict[str, Any] = {}
+    for fields, result in zip(chunk_fields, results):
+        for field in fields:
+            value = result.get(field)
+            if isinstance(RESUME_SCHEMA[field], list):
+                if isinstance(value, list):
+                    merged.setdefault(field, []).extend(value)
+            elif isinstance(value, str) and value.strip() and not merged.get(field):
+                merged[field] = value
+
+    if "skills" in merged:
+        seen = set()
+        skills = []
+        for skill in merged["skills"]:
+            key = str(skill).strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                skills.append(skill)
+        merged["skills"] = skills
+    return merged
+
+
+async def parse_resume_stream(text: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of parse_resume_to_json_async.
+
+    The model's JSON is parsed incrementally while it streams, so contact
+    fields can be shown before experience has finished generating. Yields:
+        {"type": "field", "key", "value"}           a top-level field is complete
+        {"type": "item", "key", "index", "value"}   one experience/education/... entry is complete
+        {"type": "done", "data": dict}              full result after validate_parsed_resume
+    or a final {"type": "error", "error": str} if parsing fails.
+    """
+    prompt = build_resume_parse_prompt(text)
+    parser = JSONObjectStream()
+    try:
+        async for delta in chat_text_stream(
+            [{"role": "user", "content": prompt}],
+            temperature=0.0,
+            task="parse_resume",
+            response_format={"type": "json_object"}
+        ):
+            for event in parser.feed(delta):
+                yield event
+
+        if not parser.done:
+            raise OpenRouterError(f"Incomplete JSON in AI response. Raw response: {parser.text}")
+        yield {"type": "done", "data": validate_parsed_resume(parser.result)}
+
+    except Exception as e:
+        print(f"AI parsing error: {str(e)}")
+        yield {"type": "error", "error": f"Failed to parse resume: {str(e)}"}
+
+
+async def parse_resume(text: str) -> Dict[str, Any]:
+    """
+    Tiered resume parsing. The rule-based parser runs first; only the fields
+    it could not fill with TIER1_CONFIDENCE_THRESHOLD confidence are asked of
+    the LLM, and the two results are merged into the validate_parsed_resume
+    schema. If the rules found no name or email the whole resume goes to the LLM.
+    """
+    metrics = get_parse_metrics()
+    started = time.perf_counter()
+    rules = parse_sections(text)
+    metrics.record_rules(time.perf_counter() - started)
+
+    confidence = rules.pop("confidence")
+    if rules["name"] and rules["email"]:
+        escalate = [field for field in RESUME_SCHEMA if confidence.get(field, 0.0) < TIER1_CONFIDENCE_THRESHOLD]
+    else:
+        escalate = list(RESUME_SCHEMA)
+
+    if not escalate:
+        metrics.record_result(RULES, time.perf_counter() - started, len(RESUME_SCHEMA), 0)
+        return validate_parsed_resume(rules)
+
+    llm_started = time.perf_counter()
+    try:
+        ai_result = await _ai_parse_fields(text, escalate)
+    except Exception as e:
+        metrics.record_llm(time.perf_counter() - llm_started, escalate, failed=True)
+        print(f"AI parsing error: {str(e)}")
+        rule_fields = len(RESUME_SCHEMA) - len(escalate)
+        if rules["name"] and rules["email"]:
+            # Degrade to what the rules found rather than failing the upload
+            metrics.record_result(RULES, time.perf_counter() - started, rule_fields, 0, len(escalate))
+            return validate_parsed_resume(rules)
+        metrics.record_result(FAILED, time.perf_counter() - started, 0, 0, len(escalate))
+        return {"error": f"Failed to parse resume: {str(e)}"}
+    metrics.record_llm(time.perf_counter() - llm_started, escalate)
+
+    merged = dict(rules)
+    answered = [field for field in escalate if field in ai_result]
+    for field in answered:
+        merged[field] = ai_result[field]
+
+    tier = LLM if len(escalate) == len(RESUME_SCHEMA) else HYBRID
+    metrics.record_result(
+        tier,
+        time.perf_counter() - started,
+        len(RESUME_SCHEMA) - len(escalate),
+        len(answered),
+        len(escalate) - len(answered),
+    )
+    return validate_parsed_resume(merged)
+
+
+# Output schema of the resume parser; validate_parsed_resume enforces it.
+RESUME_SCHEMA: Dict[str, Any] = {
+    "name": "",
+    "title": "",
+    "location": "",
+    "email": "",
+    "phone": "",
+    "website": "",
+    "summary": "",
+    "skills": [],
+    "experience": [{"role": "", "company": "", "period": "", "details": ""}],
+    "education": [{"degree": "", "institution": "", "period": ""}],
+    "projects": [{"name": "", "details": "", "link": ""}],
+    "certifications": [{"name": "", "issuer": "", "link": ""}],
+}
+
+
+def build_resume_parse_prompt(text: str, fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Normalizes resume text and builds the parsing prompt. `fields` limits
+    the schema to those top-level keys; by default the full schema is asked for.
     """
-    
     # Preprocessing: Clean and normalize text
     text = text.strip()
     text = re.sub(r'\n{3,}', '\n\n', text)  # Reduce excessive newlines
     text = re.sub(r' {2,}', ' ', text)  # Reduce excessive spaces
+
+    wanted = list(fields) if fields is not None else list(RESUME_SCHEMA)
+    schema = json.dumps({key: RESUME_SCHEMA[key] for key in wanted}, indent=2)
     
-    prompt = f"""You are an elite resume parsing AI with 99.9% accuracy. Parse the following resume into STRICT JSON format.
+    return f"""You are an elite resume parsing AI with 99.9% accuracy. Parse the following resume into STRICT JSON format.
 
 **PARSING RULES (CRITICAL - FOLLOW EXACTLY):**
 
@@ -193,45 +808,7 @@ async def parse_resume_to_json_async(text: str) -> Dict[str, Any]:
 
 **EXACT JSON SCHEMA (OUTPUT ONLY THIS - NO EXTRA TEXT):**
 ```json
-{{
-  "name": "",
-  "title": "",
-  "location": "",
-  "email": "",
-  "phone": "",
-  "website": "",
-  "summary": "",
-  "skills": [],
-  "experience": [
-    {{
-      "role": "",
-      "company": "",
-      "period": "",
-      "details": ""
-    }}
-  ],
-  "education": [
-    {{
-      "degree": "",
-      "institution": "",
-      "period": ""
-    }}
-  ],
-  "projects": [
-    {{
-      "name": "",
-      "details": "",
-      "link": ""
-    }}
-  ],
-  "certifications": [
-    {{
-      "name": "",
-      "issuer": "",
-      "link": ""
-    }}
-  ]
-}}
+{schema}
 ```
 
 **RESUME TEXT:**
@@ -240,17 +817,6 @@ async def parse_resume_to_json_async(text: str) -> Dict[str, Any]:
 ---
 
 **YOUR RESPONSE (JSON ONLY - NO MARKDOWN, NO EXPLANATION):**"""
-    
-    try:
-        result = await chat_json([{"role": "user", "content": prompt}], temperature=0.0)
-        
-        # Validation layer
-        validated_result = validate_parsed_resume(result)
-        return validated_result
-        
-    except Exception as e:
-        print(f"AI parsing error: {str(e)}")
-        return {"error": f"Failed to parse resume: {str(e)}"}
 
 
 def validate_parsed_resume(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -332,15 +898,36 @@ def validate_parsed_resume(data: Dict[str, Any]) -> Dict[str, Any]:
 
 # --- OTHER AI TASKS ---
 
-async def calculate_keyword_match_score(resume_text: str, job_description: str) -> Dict[str, Any]:
+async def calculate_keyword_match_score(
+    resume_text: str,
+    job_description: Union[str, JDProfile],
+    mode: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Hybrid keyword matching algorithm: AI for job description, rules for resume.
+    Accepts raw JD text or a precomputed JDProfile.
     Returns match percentage and missing keywords.
+
+    `mode` (default KEYWORD_SCORING_MODE, "flat"): "flat" counts every JD
+    keyword equally; "tfidf" and "bm25" weight keywords by their idf in the
+    resume corpus (see corpus_stats) and rank missing keywords by weight.
     """
+    mode = mode or getattr(settings, "KEYWORD_SCORING_MODE", "flat")
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown keyword scoring mode: {mode}")
     
     # Extract keywords using the appropriate method for each text
-    job_keywords = await extract_keywords_from_job_description(job_description)
-    resume_keywords = extract_keywords_from_resume(resume_text)
+    if isinstance(job_description, JDProfile):
+        profile = job_description
+    else:
+        profile = await get_jd_profile(job_description)
+    job_keywords = profile.keywords
+
+    if mode != "flat":
+        return get_corpus_stats().score_text(resume_text, job_keywords, mode, profile.weights)
+
+    # Canonical skill names let aliases match ("k8s" for "kubernetes")
+    resume_keywords = extract_keywords_from_resume(resume_text) | get_skill_matcher().skills(resume_text)
     
     # Find matching and missing keywords
     matched_keywords = job_keywords.intersection(resume_keywords)
@@ -361,11 +948,109 @@ async def calculate_keyword_match_score(resume_text: str, job_description: str)
     }
 
 
-async def extract_keywords_from_job_description(text: str) -> Set[str]:
+async def get_jd_profile(job_description: str) -> JDProfile:
+    """
+    Returns the keyword profile for a job description. Keywords are extracted
+    the first time a JD text is seen and reused from the registry afterwards.
+    """
+    return await get_jd_profile_registry().get_or_create(job_description, _build_jd_profile)
+
+
+async def _build_jd_profile(job_description: str) -> JDProfile:
+    """Extracts keywords for a new JD profile, noting which extractor produced them."""
+    mode = getattr(settings, "JD_KEYWORD_MODE", "llm")
+    keywords, weights, source = await _extract_jd_keywords(job_description, mode)
+    return JDProfile(
+        jd_hash=jd_hash(job_description, mode),
+        text=job_description,
+        keywords=keywords,
+        weights=weights,
+        source=source
+    )
+
+
+async def extract_keywords_from_job_description(text: str, mode: Optional[str] = None) -> Set[str]:
     """
-    Uses AI to extract relevant keywords from a job description.
+    Extracts relevant keywords from a job description.
     Focuses on identifying key skills, technologies, and qualifications.
     """
+    keywords, _, _ = await _extract_jd_keywords(text, mode)
+    return keywords
+
+
+async def _extract_jd_keywords(
+    text: str,
+    mode: Optional[str] = None
+) -> Tuple[Set[str], Dict[str, float], str]:
+    """
+    Runs the JD keyword extractor selected by `mode` (default
+    JD_KEYWORD_MODE, "llm") and returns (keywords, weights, source):
+    - "llm": one LLM call; weights are left at 1.0.
+    - "local": the offline extractor; weights are its relative scores.
+    - "refine": the offline extractor's candidates, filtered and completed by the LLM.
+    If the LLM call fails the offline result is used with source "fallback".
+    """
+    mode = mode or getattr(settings, "JD_KEYWORD_MODE", "llm")
+    if mode not in JD_KEYWORD_MODES:
+        raise ValueError(f"Unknown JD keyword mode {mode!r}; expected one of {JD_KEYWORD_MODES}")
+
+    local = extract_jd_keywords_local(text) if mode != "llm" else None
+    if mode == "local":
+        return set(local), local, "local"
+    try:
+        if mode == "refine":
+            keywords = await _refine_jd_keywords_ai(text, list(local))
+            return keywords, {kw: local.get(kw, 1.0) for kw in keywords}, "refined"
+        return await _extract_jd_keywords_ai(text), {}, "ai"
+    except Exception as e:
+        print(f"AI keyword extraction failed: {str(e)}. Falling back to basic extraction.")
+        local = local if local is not None else extract_jd_keywords_local(text)
+        return set(local), local, "fallback"
+
+
+def _extract_jd_keywords_basic(text: str) -> Set[str]:
+    """Offline JD keywords, used when no LLM call should (or could) be made."""
+    return set(extract_jd_keywords_local(text))
+
+
+async def _refine_jd_keywords_ai(text: str, candidates: List[str]) -> Set[str]:
+    """
+    Asks the LLM to vet the offline extractor's candidates: a shorter
+    prompt and much smaller output than extracting from scratch. Raises on failure.
+    """
+    if not text or not text.strip():
+        return set()
+
+    prompt = f"""You are an expert ATS and recruitment analyst. An automatic extractor proposed these keywords for the job description below.
+
+**JOB DESCRIPTION:**
+---
+{text[:4000]}
+---
+
+**CANDIDATE KEYWORDS:**
+{json.dumps(candidates)}
+
+**INSTRUCTIONS:**
+1.  Keep the candidates that are real requirements an ATS would screen for (skills, technologies, qualifications, key responsibilities).
+2.  Drop generic or meaningless candidates.
+3.  Add at most 5 critical keywords from the job description that the candidates miss.
+4.  Return lowercase keywords, keeping candidate spellings unchanged.
+
+**OUTPUT FORMAT:**
+Return a single JSON object with one key, "keywords", which is an array of strings.
+
+**YOUR RESPONSE (JSON ONLY):**
+"""
+    result = await chat_json([{"role": "user", "content": prompt}], temperature=0.0, task="jd_keywords")
+    return {
+        kw.lower().strip() for kw in result.get("keywords", [])
+        if isinstance(kw, str) and 2 < len(kw.strip()) < 50
+    }
+
+
+async def _extract_jd_keywords_ai(text: str) -> Set[str]:
+    """Single AI call that extracts and normalizes JD keywords. Raises on failure."""
     if not text or not text.strip():
         return set()
 
@@ -399,28 +1084,18 @@ Return a single JSON object with one key, "keywords", which is an array of strin
 
 **YOUR RESPONSE (JSON ONLY):**
 """
-    try:
-        result = await chat_json([{"role": "user", "content": prompt}], temperature=0.0)
-        keywords = result.get("keywords", [])
-        
-        # Further clean and normalize
-        cleaned_keywords = set()
-        for kw in keywords:
-            kw_lower = kw.lower().strip()
-            # Basic validation
-            if len(kw_lower) > 2 and len(kw_lower) < 50:
-                cleaned_keywords.add(kw_lower)
-        
-        return cleaned_keywords
-        
-    except Exception as e:
-        print(f"AI keyword extraction failed: {str(e)}. Falling back to basic extraction.")
-        # Fallback to a simplified version of the original rule-based extractor
-        text_lower = text.lower()
-        text_lower = re.sub(r'[^\w\s\.]', ' ', text_lower)
-        words = text_lower.split()
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'in', 'on', 'for', 'with', 'is', 'of'}
-        return {word for word in words if len(word) > 2 and word not in stop_words and not word.isdigit()}
+    result = await chat_json([{"role": "user", "content": prompt}], temperature=0.0, task="jd_keywords")
+    keywords = result.get("keywords", [])
+    
+    # Further clean and normalize
+    cleaned_keywords = set()
+    for kw in keywords:
+        kw_lower = kw.lower().strip()
+        # Basic validation
+        if len(kw_lower) > 2 and len(kw_lower) < 50:
+            cleaned_keywords.add(kw_lower)
+    
+    return cleaned_keywords
 
 
 def extract_keywords_from_resume(text: str) -> Set[str]:
@@ -428,15 +1103,8 @@ def extract_keywords_from_resume(text: str) -> Set[str]:
     Rule-based keyword extraction for resumes. It's faster and sufficient
     for matching against AI-extracted job keywords.
     """
-    text = text.lower()
-    text = re.sub(r'[^\w\s\.]', ' ', text)
-    words = text.split()
-    
-    # A smaller, more targeted stop word list is fine here
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
-        'with', 'by', 'as', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-    }
+    words = tokenize_resume(text)
+    stop_words = RESUME_STOP_WORDS
     
     keywords = {
         word for word in words 
@@ -550,13 +1218,71 @@ def calculate_resume_completeness_score(parsed_resume: Dict[str, Any]) -> Dict[s
     }
 
 
+Phase = Tuple[Callable[[Dict[str, Any]], Awaitable[Any]], List[str]]
+
+
+async def run_phases(phases: Dict[str, Phase]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Minimal dependency-aware scheduler for multi-step analyses.
+
+    `phases` maps a phase name to (coroutine function, dependency names).
+    Each phase starts as soon as its dependencies have finished and receives
+    the shared results dict. Independent phases run concurrently. Returns the
+    results by phase name and per-phase wall-clock timings in milliseconds
+    (plus "total"). If any phase fails, the others are cancelled and the
+    error is raised.
+    """
+    for name, (_, deps) in phases.items():
+        unknown = [dep for dep in deps if dep not in phases]
+        if unknown:
+            raise ValueError(f"Phase '{name}' depends on unknown phases: {unknown}")
+
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    tasks: Dict[str, asyncio.Task] = {}
+    started = time.perf_counter()
+
+    async def run(name: str) -> None:
+        func, deps = phases[name]
+        if deps:
+            await asyncio.gather(*(tasks[dep] for dep in deps))
+        phase_start = time.perf_counter()
+        results[name] = await func(results)
+        timings[name] = round((time.perf_counter() - phase_start) * 1000, 1)
+
+    # Resolve creation order so every dependency has a task before its dependents
+    pending = dict(phases)
+    while pending:
+        ready = [name for name, (_, deps) in pending.items() if all(dep in tasks for dep in deps)]
+        if not ready:
+            raise ValueError(f"Circular phase dependencies: {sorted(pending)}")
+        for name in ready:
+            tasks[name] = asyncio.ensure_future(run(name))
+            del pending[name]
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+    return results, timings
+
+
 async def analyze_resume_async(
     resume_text: str, 
-    job_description: str,
-    parsed_resume: Dict[str, Any] = None
+    job_description: Union[str, JDProfile],
+    parsed_resume: Dict[str, Any] = None,
+    quality_mode: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     HYBRID ATS SCORING: Combines rule-based + AI analysis.
+    `job_description` may be raw JD text or a JDProfile from get_jd_profile(),
+    which skips keyword extraction when scoring many resumes against one JD.
+    `quality_mode` is passed to get_ai_quality_score; "local" makes the whole
+    analysis LLM-free once the JD profile exists.
     
     Scoring Breakdown:
     - 40% Keyword Match (Rule-based)
@@ -568,10 +1294,17 @@ async def analyze_resume_async(
             "atsScore": float,
             "missingKeywords": list,
             "scoreBreakdown": dict,
-            "recommendations": list
+            "recommendations": list,
+            "phaseTimings": dict  # wall-clock ms per phase and "total"
         }
     """
     
+    if isinstance(job_description, JDProfile):
+        jd_profile = job_description
+        job_description = jd_profile.text
+    else:
+        jd_profile = None
+
     if not job_description or not job_description.strip():
         return {
             "atsScore": 0,
@@ -580,22 +1313,34 @@ async def analyze_resume_async(
             "recommendations": ["Add a job description to calculate ATS score"]
         }
     
-    try:
+    async def keyword_phase(results: Dict[str, Any]) -> Dict[str, Any]:
         # PHASE 1: Hybrid Keyword Matching (40 points)
-        keyword_analysis = await calculate_keyword_match_score(resume_text, job_description)
-        keyword_score = (keyword_analysis["match_percentage"] / 100) * 40
-        
+        return await calculate_keyword_match_score(resume_text, jd_profile or job_description)
+
+    async def completeness_phase(results: Dict[str, Any]) -> float:
         # PHASE 2: Resume Completeness Check (30 points)
-        completeness_score = 0
         if parsed_resume:
             completeness_analysis = calculate_resume_completeness_score(parsed_resume)
-            completeness_score = (completeness_analysis["percentage"] / 100) * 30
-        else:
-            # Fallback: Basic completeness check
-            completeness_score = 15 if len(resume_text) > 500 else 10
-        
+            return (completeness_analysis["percentage"] / 100) * 30
+        # Fallback: Basic completeness check
+        return 15 if len(resume_text) > 500 else 10
+
+    async def ai_quality_phase(results: Dict[str, Any]) -> float:
         # PHASE 3: AI Qualitative Analysis (30 points)
-        ai_score = await get_ai_quality_score(resume_text, job_description)
+        jd_keywords = jd_profile.keywords if jd_profile else None
+        return await get_ai_quality_score(resume_text, job_description, quality_mode, jd_keywords)
+
+    try:
+        # The phases are independent, so the two LLM calls run concurrently
+        results, phase_timings = await run_phases({
+            "keywords": (keyword_phase, []),
+            "completeness": (completeness_phase, []),
+            "aiQuality": (ai_quality_phase, []),
+        })
+        keyword_analysis = results["keywords"]
+        keyword_score = (keyword_analysis["match_percentage"] / 100) * 40
+        completeness_score = results["completeness"]
+        ai_score = results["aiQuality"]
         
         # Calculate Final ATS Score
         final_score = round(keyword_score + completeness_score + ai_score, 1)
@@ -622,7 +1367,8 @@ async def analyze_resume_async(
                     "total": keyword_analysis["total_job_keywords"]
                 }
             },
-            "recommendations": recommendations
+            "recommendations": recommendations,
+            "phaseTimings": phase_timings
         }
         
     except Exception as e:
@@ -635,40 +1381,378 @@ async def analyze_resume_async(
         }
 
 
-async def get_ai_quality_score(resume_text: str, job_description: str) -> float:
+async def analyze_resumes_batch(
+    resumes: Iterable[Union[str, Dict[str, Any]]],
+    job_description: Union[str, JDProfile],
+    concurrency: int = 8,
+    quality_mode: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Scores many resumes against one job description, streaming results.
+
+    Each resume is either raw text or a dict with "text" and optional "id"
+    and "parsed_resume". JD keywords are extracted once up front, then up to
+    `concurrency` resumes are analyzed at a time. Records are yielded in
+    completion order:
+        {"type": "result", "index", "id", "result", "elapsedMs"}
+        {"type": "error", "index", "id", "error", "elapsedMs"}
+    followed by one {"type": "summary", ...} record with overall timings.
+    With quality_mode="local" screening makes no per-resume LLM calls.
+    """
+    batch_start = time.perf_counter()
+
+    if isinstance(job_description, JDProfile):
+        jd_profile = job_description
+    else:
+        jd_profile = await get_jd_profile(job_description)
+    jd_ms = (time.perf_counter() - batch_start) * 1000
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def score_one(index: int, resume: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if isinstance(resume, dict):
+            resume_id = resume.get("id", index)
+            resume_text = resume.get("text") or ""
+            parsed_resume = resume.get("parsed_resume")
+        else:
+            resume_id, resume_text, parsed_resume = index, resume, None
+
+        async with semaphore:
+            item_start = time.perf_counter()
+            try:
+                result = await analyze_resume_async(resume_text, jd_profile, parsed_resume, quality_mode)
+                record = {"type": "result", "index": index, "id": resume_id, "result": result}
+            except Exception as e:
+                record = {"type": "error", "index": index, "id": resume_id, "error": str(e)}
+            record["elapsedMs"] = round((time.perf_counter() - item_start) * 1000, 1)
+            return record
+
+    tasks = [asyncio.ensure_future(score_one(i, r)) for i, r in enumerate(resumes)]
+    item_times = []
+    failed = 0
+    first_result_ms = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            record = await next_done
+            item_times.append(record["elapsedMs"])
+            if record["type"] == "error":
+                failed += 1
+            if first_result_ms is None:
+                first_result_ms = round((time.perf_counter() - batch_start) * 1000, 1)
+            yield record
+    finally:
+        # The consumer may stop early; don't leave work running in the background
+        for task in tasks:
+            task.cancel()
+
+    item_times.sort()
+    total_ms = (time.perf_counter() - batch_start) * 1000
+    yield {
+        "type": "summary",
+        "total": len(tasks),
+        "succeeded": len(tasks) - failed,
+        "failed": failed,
+        "concurrency": concurrency,
+        "jdKeywords": len(jd_profile.keywords),
+        "jdExtractionMs": round(jd_ms, 1),
+        "firstResultMs": first_result_ms,
+        "totalMs": round(total_ms, 1),
+        "avgItemMs": round(sum(item_times) / len(item_times), 1) if item_times else 0,
+        "p95ItemMs": item_times[int(0.95 * (len(item_times) - 1))] if item_times else 0,
+        "resumesPerSec": round(len(tasks) / (total_ms / 1000), 2) if total_ms else 0
+    }
+
+
+async def get_ai_quality_score(
+    resume_text: str,
+    job_description: str,
+    mode: Optional[str] = None,
+    jd_keywords: Optional[Set[str]] = None
+) -> float:
+    """
+    Uses AI to assess qualitative factors like relevance and presentation.
+    Returns a score out of 30 points.
+
+    `mode` (default QUALITY_SCORING_MODE, "llm") selects the scorer: "llm"
+    asks the model, "batch" asks it too but shares one prompt with other
+    resumes scored against the same JD at about the same time (see
+    QualityScoreBatcher), and "local" uses the feature-based QualityModel
+    with no network call. The local model is also the fallback when the LLM
+    call fails. `jd_keywords` saves re-extracting keywords for the local model.
+    """
+    mode = mode or getattr(settings, "QUALITY_SCORING_MODE", "llm")
+    if mode not in QUALITY_SCORING_MODES:
+        raise ValueError(f"Unknown quality scoring mode {mode!r}; expected one of {QUALITY_SCORING_MODES}")
+
+    def features() -> List[float]:
+        keywords = jd_keywords if jd_keywords is not None else _extract_jd_keywords_basic(job_description)
+        return extract_quality_features(resume_text, keywords)
+
+    if mode == "local":
+        return get_quality_model().predict(features())
+    if mode == "batch":
+        return await get_quality_batcher().score(resume_text, job_description, features())
+    return await _llm_quality_score(resume_text, job_description, features)
+
+
+async def _llm_quality_score(
+    resume_text: str,
+    job_description: str,
+    features: Callable[[], List[float]]
+) -> float:
+    """
+    One LLM quality score call; the local model answers if it fails.
+    `features` is only called when the fallback or the score log needs them.
+    """
+    prompt = f"""You are an ATS (Applicant Tracking System) analyzer. Evaluate how well this resume matches the job description.
+
+**JOB DESCRIPTION:**
+{job_description[:1000]}
+
+**RESUME:**
+{resume_text[:2000]}
+
+**EVALUATION CRITERIA:**
+1. Relevance of experience to the job requirements (0-10 points)
+2. Quality of achievement descriptions and metrics (0-10 points)
+3. Professional presentation and clarity (0-10 points)
+
+**RESPOND WITH ONLY A JSON OBJECT:**
+{{
+  "relevance_score": <0-10>,
+  "quality_score": <0-10>,
+  "presentation_score": <0-10>,
+  "total": <0-30>
+}}
+"""
+
+    try:
+        result, cached = await _chat_json(
+            [{"role": "user", "content": prompt}], 0.1, task="quality_score", cache=None, hedge=None
+        )
+        score = float(result["total"])
+    except Exception as e:
+        print(f"AI quality score error: {str(e)}. Falling back to the local model.")
+        return get_quality_model().predict(features())
+    # A cached answer was logged when it was fresh; logging it again would
+    # weight re-run resumes more heavily in the calibration set
+    if not cached and getattr(settings, "QUALITY_SCORE_LOG_PATH", None):
+        await log_llm_scores([(features(), score)])
+    return score
+
+
+# Prompt tokens each packed resume costs beyond its text (tags, id), plus the
+# completion tokens of its score object
+QUALITY_BATCH_ITEM_TOKENS = 40
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: about four characters per token for English text."""
+    return len(text) // 4 + 1
+
+
+def build_quality_batch_prompt(job_description: str, resumes: List[Tuple[str, str]]) -> str:
+    """Quality scoring prompt for several (id, text) resumes sharing one JD."""
+    blocks = "\n\n".join(f'<resume id="{resume_id}">\n{text[:2000]}\n</resume>' for resume_id, text in resumes)
+    return f"""You are an ATS (Applicant Tracking System) analyzer. Evaluate how well each resume below matches the job description.
+
+**JOB DESCRIPTION:**
+{job_description[:1000]}
+
+**RESUMES:**
+{blocks}
+
+**EVALUATION CRITERIA (score every resume independently):**
+1. Relevance of experience to the job requirements (0-10 points)
+2. Quality of achievement descriptions and metrics (0-10 points)
+3. Professional presentation and clarity (0-10 points)
+
+**RESPOND WITH ONLY A JSON OBJECT, one entry per resume id:**
+{{
+  "scores": [
+    {{"id": "<resume id>", "relevance_score": <0-10>, "quality_score": <0-10>, "presentation_score": <0-10>, "total": <0-30>}}
+  ]
+}}
+"""
+
+
+def pack_quality_batches(
+    resumes: List[str],
+    job_description: str,
+    token_budget: Optional[int] = None,
+    max_batch: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Groups resume indexes into batches whose estimated prompt plus output
+    size stays within `token_budget` (QUALITY_BATCH_TOKEN_BUDGET), at most
+    `max_batch` (QUALITY_BATCH_MAX_SIZE) resumes each. Short resumes pack
+    more per call; a single resume over budget still gets its own batch.
+    """
+    token_budget = token_budget or getattr(settings, "QUALITY_BATCH_TOKEN_BUDGET", 6000)
+    max_batch = max_batch or getattr(settings, "QUALITY_BATCH_MAX_SIZE", 8)
+    overhead = estimate_tokens(build_quality_batch_prompt(job_description, []))
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = overhead
+    for index, text in enumerate(resumes):
+        cost = estimate_tokens(text[:2000]) + QUALITY_BATCH_ITEM_TOKENS
+        if current and (used + cost > token_budget or len(current) >= max_batch):
+            batches.append(current)
+            current, used = [], overhead
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _parse_quality_batch(result: Any, ids: Set[str]) -> Dict[str, float]:
+    """Valid totals by resume id; malformed or unknown entries are skipped."""
+    scores: Dict[str, float] = {}
+    items = result.get("scores") if isinstance(result, dict) else None
+    if not isinstance(items, list):
+        return scores
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        resume_id = str(item.get("id"))
+        try:
+            total = float(item["total"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if resume_id in ids and 0.0 <= total <= 30.0:
+            scores[resume_id] = total
+    return scores
+
+
+async def _score_quality_batch(job_description: str, items: List[Tuple[str, List[float]]]) -> List[float]:
+    """
+    Scores (resume_text, features) items in one LLM call. Items missing or
+    malformed in the response are scored one by one with _llm_quality_score.
+    """
+    ids = [f"r{i + 1}" for i in range(len(items))]
+    prompt = build_quality_batch_prompt(job_description, [(resume_id, text) for resume_id, (text, _) in zip(ids, items)])
+    cached = False
+    try:
+        result, cached = await _chat_json(
+            [{"role": "user", "content": prompt}], 0.1, task="quality_score_batch", cache=None, hedge=None
+        )
+        scores = _parse_quality_batch(result, set(ids))
+    except Exception as e:
+        print(f"Batched quality score error: {str(e)}. Scoring {len(items)} resumes one by one.")
+        scores = {}
+
+    if not cached:
+        await log_llm_scores(
+            (features, scores[resume_id]) for resume_id, (_, features) in zip(ids, items) if resume_id in scores
+        )
+    missing = [i for i, resume_id in enumerate(ids) if resume_id not in scores]
+    retried = await asyncio.gather(*(
+        _llm_quality_score(items[i][0], job_description, lambda features=items[i][1]: features) for i in missing
+    ))
+    results = [scores.get(resume_id, 0.0) for resume_id in ids]
+    for i, score in zip(missing, retried):
+        results[i] = score
+    return results
+
+
+async def get_ai_quality_scores_batch(
+    resumes: List[str],
+    job_description: str,
+    jd_keywords: Optional[Set[str]] = None,
+    token_budget: Optional[int] = None,
+    max_batch: Optional[int] = None
+) -> List[float]:
     """
-    Uses AI to assess qualitative factors like relevance and presentation.
-    Returns a score out of 30 points.
+    Quality scores (0-30) for many resumes against one JD, in input order.
+    Resumes are packed into as few prompts as the token budget allows and
+    the batches run concurrently.
+    """
+    if jd_keywords is None:
+        jd_keywords = _extract_jd_keywords_basic(job_description)
+    items = [(text, extract_quality_features(text, jd_keywords)) for text in resumes]
+    batches = pack_quality_batches(resumes, job_description, token_budget, max_batch)
+    batch_scores = await asyncio.gather(*(
+        _score_quality_batch(job_description, [items[i] for i in batch]) for batch in batches
+    ))
+    scores = [0.0] * len(resumes)
+    for batch, results in zip(batches, batch_scores):
+        for i, score in zip(batch, results):
+            scores[i] = score
+    return scores
+
+
+class QualityScoreBatcher:
+    """
+    Coalesces concurrent batch-mode get_ai_quality_score calls that share a
+    job description into packed prompts, so per-resume callers such as
+    analyze_resumes_batch get batching without changing shape. A batch is
+    sent when the next resume would overflow the token budget or max size,
+    or `max_wait` seconds after its first resume arrived.
     """
-    
-    prompt = f"""You are an ATS (Applicant Tracking System) analyzer. Evaluate how well this resume matches the job description.
 
-**JOB DESCRIPTION:**
-{job_description[:1000]}
+    def __init__(
+        self,
+        max_wait: float = 0.05,
+        token_budget: Optional[int] = None,
+        max_batch: Optional[int] = None
+    ):
+        self.max_wait = max_wait
+        self.token_budget = token_budget
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[Tuple[str, List[float], asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.counters = {"resumes": 0, "batches": 0}
+
+    async def score(self, resume_text: str, job_description: str, features: List[float]) -> float:
+        loop = asyncio.get_running_loop()
+        queue = self._pending.get(job_description, [])
+        if queue:
+            texts = [text for text, _, _ in queue] + [resume_text]
+            if len(pack_quality_batches(texts, job_description, self.token_budget, self.max_batch)) > 1:
+                self._flush(job_description)
+        future = loop.create_future()
+        queue = self._pending.setdefault(job_description, [])
+        queue.append((resume_text, features, future))
+        if len(queue) == 1:
+            self._timers[job_description] = loop.call_later(self.max_wait, self._flush, job_description)
+        return await future
+
+    def _flush(self, job_description: str) -> None:
+        timer = self._timers.pop(job_description, None)
+        if timer:
+            timer.cancel()
+        queue = self._pending.pop(job_description, [])
+        if queue:
+            task = asyncio.ensure_future(self._run(job_description, queue))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job_description: str, queue: List[Tuple[str, List[float], asyncio.Future]]) -> None:
+        self.counters["resumes"] += len(queue)
+        self.counters["batches"] += 1
+        try:
+            scores = await _score_quality_batch(job_description, [(text, features) for text, features, _ in queue])
+        except Exception as e:
+            for _, _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), score in zip(queue, scores):
+            if not future.done():
+                future.set_result(score)
 
-**RESUME:**
-{resume_text[:2000]}
 
-**EVALUATION CRITERIA:**
-1. Relevance of experience to the job requirements (0-10 points)
-2. Quality of achievement descriptions and metrics (0-10 points)
-3. Professional presentation and clarity (0-10 points)
+_quality_batcher: Optional[QualityScoreBatcher] = None
 
-**RESPOND WITH ONLY A JSON OBJECT:**
-{{
-  "relevance_score": <0-10>,
-  "quality_score": <0-10>,
-  "presentation_score": <0-10>,
-  "total": <0-30>
-}}
-"""
 
-    try:
-        result = await chat_json([{"role": "user", "content": prompt}], temperature=0.1)
-        return float(result.get("total", 15))  # Default to middle score
-    except Exception as e:
-        print(f"AI quality score error: {str(e)}")
-        return 15.0  # Default fallback
+def get_quality_batcher() -> QualityScoreBatcher:
+    global _quality_batcher
+    if _quality_batcher is None:
+        _quality_batcher = QualityScoreBatcher(max_wait=getattr(settings, "QUALITY_BATCH_MAX_WAIT", 0.05))
+    return _quality_batcher
 
 
 def generate_recommendations(
@@ -727,163 +1811,305 @@ def generate_recommendations(
     return recommendations[:5]  # Return top 5 recommendations
 
 async def generate_bullet_points_async(
-
     text: str, 
-
     missing_keywords: List[str] = None,
-
-    section_type: str = "experience"
-
+    section_type: str = "experience",
+    candidates: Optional[int] = None
 ) -> str:
-
     """
-
     ENHANCED: Generates perfectly formatted, context-aware bullet points.
-
     
-
     Features:
-
     - Adaptive bullet count based on section type
-
     - Quality validation (metrics, action verbs, length)
-
     - Strategic keyword integration
-
     - Professional formatting
 
+    `candidates` (default BULLET_CANDIDATES, 1) above 1 generates that many
+    candidates concurrently and keeps the first to clear the quality bar
+    instead of regenerating serially; see _generate_bullets_best_of_n.
     """
-
     
-
     # Get configuration for this section type
-
     config = SECTION_CONFIGS.get(section_type, SECTION_CONFIGS["experience"])
-
+    candidates = candidates or getattr(settings, "BULLET_CANDIDATES", 1)
+    metrics = get_bullet_metrics()
+    started = time.perf_counter()
     
-
     # Build advanced prompt with section-specific instructions
-
     prompt = build_bullet_prompt(text, missing_keywords, config, section_type)
-
+    if candidates > 1:
+        return await _generate_bullets_best_of_n(prompt, text, missing_keywords, config, section_type, candidates)
     
-
+    answered = False
     try:
-
         # Generate bullets
-
         result = await chat_text(
-
             [{"role": "user", "content": prompt}], 
-
-            temperature=0.35  # Balanced creativity
-
+            temperature=0.35,  # Balanced creativity
+            task="bullets"
         )
-
+        answered = True
         
-
         # Validate and format output
-
         validated_bullets = validate_and_format_bullets(
-
             result, 
-
             config,
-
             missing_keywords
-
         )
-
         
-
         # Quality check - if bullets are too weak, regenerate
-
         quality_score = assess_bullet_quality(validated_bullets, config)
-
         
-
-        if quality_score < 0.6 and section_type == "experience":
-
+        if quality_score < BULLET_QUALITY_THRESHOLD and section_type == "experience":
             print(f"Bullet quality too low ({quality_score:.2f}), regenerating...")
-
-            return await regenerate_with_emphasis(text, missing_keywords, config)
-
+            metrics.record_candidates(issued=2, scored=1, failed=0, cancelled=0)
+            regenerated = await regenerate_with_emphasis(text, missing_keywords, config)
+            metrics.record_result(REGENERATED, time.perf_counter() - started)
+            return regenerated
         
-
+        metrics.record_candidates(issued=1, scored=1, failed=0, cancelled=0)
+        metrics.record_result(FIRST, time.perf_counter() - started, accepted_at=1)
         return validated_bullets
-
         
-
     except Exception as e:
-
         print(f"Bullet generation error: {str(e)}")
-
+        if not answered:
+            # The one candidate failed before it could be scored
+            metrics.record_candidates(issued=1, scored=0, failed=1, cancelled=0)
+        metrics.record_result(FALLBACK, time.perf_counter() - started)
         return generate_fallback_bullets(text, config)
 
 
-
-
-
-def build_bullet_prompt(
-
+async def _generate_bullets_best_of_n(
+    prompt: str,
     text: str,
-
-    missing_keywords: List[str],
-
+    missing_keywords: Optional[List[str]],
     config: Dict[str, Any],
-
-    section_type: str
-
+    section_type: str,
+    candidates: int
 ) -> str:
-
     """
+    Speculative bullet generation: issues `candidates` generations at once,
+    validates and scores each as it arrives, and returns the first that
+    clears BULLET_QUALITY_THRESHOLD (any successful one for non-experience
+    sections, matching the serial path), cancelling the rest. If none
+    clears it the best scoring candidate is used; if all fail, the fallback
+    template. Worst-case latency is one call instead of two, for up to
+    `candidates` times the tokens.
+    """
+    metrics = get_bullet_metrics()
+    started = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(chat_text([{"role": "user", "content": prompt}], temperature=0.35, task="bullets"))
+        for _ in range(candidates)
+    ]
+    best: Optional[Tuple[float, str]] = None
+    scored = failed = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception as e:
+                failed += 1
+                print(f"Bullet candidate error: {str(e)}")
+                continue
+            scored += 1
+            validated_bullets = validate_and_format_bullets(result, config, missing_keywords)
+            quality_score = assess_bullet_quality(validated_bullets, config)
+            if quality_score >= BULLET_QUALITY_THRESHOLD or section_type != "experience":
+                metrics.record_candidates(candidates, scored, failed, candidates - scored - failed)
+                metrics.record_result(SPECULATIVE, time.perf_counter() - started, accepted_at=scored)
+                return validated_bullets
+            if best is None or quality_score > best[0]:
+                best = (quality_score, validated_bullets)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    metrics.record_candidates(candidates, scored, failed, 0)
+    if best is None:
+        metrics.record_result(FALLBACK, time.perf_counter() - started)
+        return generate_fallback_bullets(text, config)
+    print(f"No bullet candidate cleared the quality bar; using the best ({best[0]:.2f})")
+    metrics.record_result(BEST_EFFORT, time.perf_counter() - started)
+    return best[1]
 
-    Builds an advanced, section-specific prompt for bullet generation.
 
+async def generate_bullet_points_stream(
+    text: str,
+    missing_keywords: List[str] = None,
+    section_type: str = "experience"
+) -> AsyncIterator[Dict[str, Any]]:
     """
+    Streaming variant of generate_bullet_points_async.
 
-    
-
-    # Keyword integration instructions
+    Yields {"type": "delta", "text": str} events as tokens arrive, then one
+    {"type": "done", "text": str} event with the bullets after
+    validate_and_format_bullets. If the streamed bullets fail the quality
+    check they are regenerated and the done event has "regenerated": True.
+    """
+    config = SECTION_CONFIGS.get(section_type, SECTION_CONFIGS["experience"])
+    parts: List[str] = []
+    try:
+        prompt = build_bullet_prompt(text, missing_keywords, config, section_type)
+        async for delta in chat_text_stream(
+            [{"role": "user", "content": prompt}],
+            temperature=0.35,
+            task="bullets"
+        ):
+            parts.append(delta)
+            yield {"type": "delta", "text": delta}
+
+        validated_bullets = validate_and_format_bullets("".join(parts), config, missing_keywords)
+        quality_score = assess_bullet_quality(validated_bullets, config)
+        if quality_score < BULLET_QUALITY_THRESHOLD and section_type == "experience":
+            print(f"Bullet quality too low ({quality_score:.2f}), regenerating...")
+            regenerated = await regenerate_with_emphasis(text, missing_keywords, config)
+            yield {"type": "done", "text": regenerated, "regenerated": True}
+            return
 
-    keyword_instruction = ""
+        yield {"type": "done", "text": validated_bullets}
 
-    if missing_keywords and len(missing_keywords) > 0:
+    except Exception as e:
+        print(f"Bullet generation error: {str(e)}")
+        yield {"type": "done", "text": generate_fallback_bullets(text, config), "error": str(e)}
 
-        priority_keywords = missing_keywords[:5]
 
-        quoted_keywords = ', '.join([f'"{kw}"' for kw in priority_keywords])
-        keyword_instruction = f"""
+async def generate_resume_bullets_async(
+    sections: List[Dict[str, Any]],
+    missing_keywords: List[str] = None
+) -> Dict[str, str]:
+    """
+    Generates bullets for several resume sections in one JSON-mode request.
+
+    Each section is {"id": str, "text": str, "section_type": str} with a
+    SECTION_CONFIGS type (default "experience"). The shared instructions are
+    sent once instead of once per section. Every section's bullets are then
+    validated against its own config: sections missing from the response
+    go through generate_bullet_points_async, and experience sections that
+    fail the quality check through regenerate_with_emphasis, concurrently.
+    Returns formatted bullets keyed by section id, in input order.
+    """
+    if not sections:
+        return {}
+    ids = [str(section["id"]) for section in sections]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Section ids must be unique")
+    configs = [SECTION_CONFIGS.get(s.get("section_type", "experience"), SECTION_CONFIGS["experience"]) for s in sections]
 
-**🎯 KEYWORD INTEGRATION (CRITICAL):**
+    try:
+        result = await chat_json(
+            [{"role": "user", "content": build_multi_section_bullet_prompt(sections, missing_keywords)}],
+            temperature=0.35,
+            task="bullets_multi"
+        )
+        generated = result.get("bullets") if isinstance(result, dict) else None
+        if not isinstance(generated, dict):
+            generated = {}
+    except Exception as e:
+        print(f"Multi-section bullet generation error: {str(e)}. Generating sections one by one.")
+        generated = {}
+
+    bullets: Dict[str, str] = {}
+    retries: Dict[str, Awaitable[str]] = {}
+    for section_id, section, config in zip(ids, sections, configs):
+        raw = generated.get(section_id)
+        if isinstance(raw, str):
+            raw = raw.split("\n")
+        lines = [str(line) for line in raw if str(line).strip()] if isinstance(raw, list) else []
+        section_type = section.get("section_type", "experience")
+        if not lines:
+            retries[section_id] = generate_bullet_points_async(section["text"], missing_keywords, section_type)
+            continue
+        validated = validate_and_format_bullets("\n".join(f"- {line}" for line in lines), config, missing_keywords)
+        quality_score = assess_bullet_quality(validated, config)
+        if quality_score < BULLET_QUALITY_THRESHOLD and section_type == "experience":
+            retries[section_id] = regenerate_with_emphasis(section["text"], missing_keywords, config)
+        else:
+            bullets[section_id] = validated
 
-Naturally incorporate AT LEAST 3 of these high-value keywords:
+    if retries:
+        print(f"Regenerating {len(retries)}/{len(sections)} sections separately")
+        for section_id, text in zip(retries, await asyncio.gather(*retries.values(), return_exceptions=True)):
+            if isinstance(text, Exception):
+                print(f"Bullet regeneration error: {str(text)}")
+                index = ids.index(section_id)
+                text = generate_fallback_bullets(sections[index]["text"], configs[index])
+            bullets[section_id] = text
+    return {section_id: bullets[section_id] for section_id in ids}
 
-{quoted_keywords}
 
+def build_multi_section_bullet_prompt(
+    sections: List[Dict[str, Any]],
+    missing_keywords: List[str] = None
+) -> str:
+    """
+    One prompt for several sections: keyword and formatting rules once, the
+    style guide once per section type present, then each section's context
+    with its own bullet count and length.
+    """
+    section_types = []
+    for section in sections:
+        section_type = section.get("section_type", "experience")
+        if section_type not in section_types:
+            section_types.append(section_type)
 
+    keyword_instruction = ""
+    if missing_keywords:
+        quoted_keywords = ', '.join(f'"{kw}"' for kw in missing_keywords[:5])
+        keyword_instruction = f"""
+**KEYWORD INTEGRATION (CRITICAL):**
+Across all sections, naturally incorporate these high-value keywords where they fit the context: {quoted_keywords}
+Use exact keyword matches; don't force them.
+"""
 
-Rules:
+    # The style guides are compacted to their non-blank lines
+    style_guides = "\n\n".join(
+        f"**{section_type.upper()} SECTIONS:**\n" + "\n".join(
+            line.strip() for line in
+            BULLET_STYLE_INSTRUCTIONS.get(section_type, BULLET_STYLE_INSTRUCTIONS["experience"]).splitlines()
+            if line.strip()
+        )
+        for section_type in section_types
+    )
+    section_blocks = "\n\n".join(
+        f'<section id="{section["id"]}" type="{section.get("section_type", "experience")}" '
+        f'bullets="{config["min_bullets"]}-{config["max_bullets"]}" '
+        f'words="{config["min_words_per_bullet"]}-{config["max_words_per_bullet"]}">\n'
+        f'{section["text"]}\n</section>'
+        for section, config in (
+            (section, SECTION_CONFIGS.get(section.get("section_type", "experience"), SECTION_CONFIGS["experience"]))
+            for section in sections
+        )
+    )
 
-- Use exact keyword matches where possible
+    return f"""You are an elite resume writer creating ATS-optimized bullet points for several resume sections at once.
+{keyword_instruction}
+{style_guides}
 
-- Integrate them contextually (don't force)
+**FORMATTING REQUIREMENTS (every section):**
+- Generate the number of bullets given in the section's "bullets" attribute
+- Keep each bullet within the section's "words" range
+- Start each with a strong action verb (avoid weak verbs like "helped", "assisted", "worked on")
+- Use past tense for previous roles, present tense for current roles
+- Include numbers/metrics wherever possible
 
-- Prioritize the first 3 keywords
+**SECTIONS:**
+{section_blocks}
 
+**OUTPUT FORMAT:**
+Return ONLY a JSON object mapping every section id to its array of bullet strings (no hyphens):
+{{"bullets": {{"<section id>": ["<bullet>", "<bullet>"]}}}}
 """
 
 
-
-        # Section-specific instructions
-
+# Section-specific style instructions shared by the bullet prompts
+BULLET_STYLE_INSTRUCTIONS = {
 
 
-        style_instructions = {
 
-
-
-            "experience": f"""
+    "experience": f"""
 
 
 
@@ -939,7 +2165,7 @@ Rules:
 
 
 
-            "summary": f"""
+    "summary": f"""
 
 
 
@@ -987,7 +2213,7 @@ Rules:
 
 
 
-            "projects": f"""
+    "projects": f"""
 
 
 
@@ -1035,7 +2261,57 @@ Rules:
 
 
 
-        }
+}
+
+
+def build_bullet_prompt(
+
+    text: str,
+
+    missing_keywords: List[str],
+
+    config: Dict[str, Any],
+
+    section_type: str
+
+) -> str:
+
+    """
+
+    Builds an advanced, section-specific prompt for bullet generation.
+
+    """
+
+    
+
+    # Keyword integration instructions
+
+    keyword_instruction = ""
+
+    if missing_keywords and len(missing_keywords) > 0:
+
+        priority_keywords = missing_keywords[:5]
+
+        quoted_keywords = ', '.join([f'"{kw}"' for kw in priority_keywords])
+        keyword_instruction = f"""
+
+**🎯 KEYWORD INTEGRATION (CRITICAL):**
+
+Naturally incorporate AT LEAST 3 of these high-value keywords:
+
+{quoted_keywords}
+
+
+
+Rules:
+
+- Use exact keyword matches where possible
+
+- Integrate them contextually (don't force)
+
+- Prioritize the first 3 keywords
+
+"""
 
 
 
@@ -1053,7 +2329,7 @@ Rules:
 
 
 
-{style_instructions.get(section_type, style_instructions["experience"])}
+{BULLET_STYLE_INSTRUCTIONS.get(section_type, BULLET_STYLE_INSTRUCTIONS["experience"])}
 
 
 
@@ -1245,29 +2521,9 @@ def starts_with_strong_verb(text: str) -> bool:
 
     """
 
-    strong_verbs = {
-
-        'achieved', 'architected', 'automated', 'built', 'created', 'delivered',
-
-        'deployed', 'designed', 'developed', 'drove', 'enabled', 'engineered',
-
-        'enhanced', 'established', 'executed', 'generated', 'implemented',
-
-        'improved', 'increased', 'launched', 'led', 'managed', 'optimized',
-
-        'orchestrated', 'pioneered', 'reduced', 'resolved', 'scaled',
-
-        'spearheaded', 'streamlined', 'transformed', 'accelerated', 'collaborated',
-
-        'coordinated', 'directed', 'facilitated', 'mentored', 'supervised'
-
-    }
-
-    
-
     first_word = text.split()[0].lower() if text.split() else ""
 
-    return first_word in strong_verbs
+    return first_word in STRONG_VERBS
 
 
 
@@ -1309,9 +2565,7 @@ def assess_bullet_quality(bullets: str, config: Dict[str, Any]) -> float:
 
     if config.get('requires_metrics', False):
 
-        metric_pattern = r'\d+[%$KMB+]|\d+\+|\d+x|\d+ [a-z]+'
-
-        metric_count = sum(1 for b in bullet_list if re.search(metric_pattern, b))
+        metric_count = sum(1 for b in bullet_list if re.search(METRIC_PATTERN, b))
 
         score += (metric_count / len(bullet_list)) * 0.4
 
@@ -1385,7 +2639,7 @@ GENERATE NOW:"""
 
 
 
-    result = await chat_text([{"role": "user", "content": prompt}], temperature=0.3)
+    result = await chat_text([{"role": "user", "content": prompt}], temperature=0.3, task="bullets_regenerate")
 
     return validate_and_format_bullets(result, config, missing_keywords)
 
@@ -1407,26 +2661,28 @@ def generate_fallback_bullets(text: str, config: Dict[str, Any]) -> str:
 - Contributed to project success through consistent high-quality work"""
 
 def count_keyword_usage(text: str, keywords: List[str]) -> int:
+    """
+    Counts how many keywords from the list appear in the text as whole words.
+    Like a substring check per keyword, a keyword listed twice counts twice
+    and one nested in another ("python" in "python developer") still counts.
+    """
+    if not keywords:
+        return 0
+    matcher = _keyword_matcher(tuple(sorted({kw.lower().strip() for kw in keywords if kw.strip()})))
+    found = {hit.alias for hit in matcher.find(text, overlapping=True)}
+    return sum(1 for kw in keywords if kw.lower().strip() in found)
 
-    """Counts how many keywords from the list appear in the text."""
-
-    text_lower = text.lower()
-
-    count = 0
-
-    for keyword in keywords:
-
-        if keyword.lower() in text_lower:
-
-            count += 1
 
-    return count
+@lru_cache(maxsize=256)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> SkillMatcher:
+    return SkillMatcher({kw: [kw] for kw in keywords})
 
 
 async def rewrite_text_async(
     text: str, 
     tone: str = "impactful",
-    missing_keywords: List[str] = None
+    missing_keywords: List[str] = None,
+    cache: Optional[bool] = None
 ) -> str:
     """
     Rewrites text with improved tone and optional keyword integration.
@@ -1435,11 +2691,61 @@ async def rewrite_text_async(
         text: Original text to rewrite
         tone: Desired tone (impactful, professional, technical)
         missing_keywords: Optional keywords to integrate
+        cache: Set to True to cache the rewrite (not cached by default)
     
     Returns:
         Rewritten text
     """
     
+    prompt = build_rewrite_prompt(text, tone, missing_keywords)
+
+    try:
+        result = await chat_text(
+            [{"role": "user", "content": prompt}], 
+            temperature=0.4,
+            task="rewrite",
+            cache=cache
+        )
+        return finalize_rewrite(result, text)
+        
+    except Exception as e:
+        print(f"Rewrite error: {str(e)}")
+        return text  # Return original if rewrite fails
+
+
+async def rewrite_text_stream(
+    text: str,
+    tone: str = "impactful",
+    missing_keywords: List[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of rewrite_text_async for interactive editing.
+
+    Yields {"type": "delta", "text": str} events as tokens arrive, then one
+    {"type": "done", "text": str} event carrying the validated rewrite (the
+    same truncation as rewrite_text_async). On failure the done event
+    carries the original text and an "error" message.
+    """
+    prompt = build_rewrite_prompt(text, tone, missing_keywords)
+    parts: List[str] = []
+    try:
+        async for delta in chat_text_stream(
+            [{"role": "user", "content": prompt}],
+            temperature=0.4,
+            task="rewrite"
+        ):
+            parts.append(delta)
+            yield {"type": "delta", "text": delta}
+    except Exception as e:
+        print(f"Rewrite error: {str(e)}")
+        yield {"type": "done", "text": text, "error": str(e)}
+        return
+
+    yield {"type": "done", "text": finalize_rewrite("".join(parts), text)}
+
+
+def build_rewrite_prompt(text: str, tone: str, missing_keywords: List[str] = None) -> str:
+    """Builds the rewrite prompt shared by the blocking and streaming rewriters."""
     keyword_instruction = ""
     if missing_keywords and len(missing_keywords) > 0:
         top_keywords = missing_keywords[:3]
@@ -1449,7 +2755,7 @@ async def rewrite_text_async(
 (Only add them if they fit naturally - do not force them)
 """
     
-    prompt = f"""You are an expert resume editor. Rewrite the following text to make it more {tone}, professional, and impactful.
+    return f"""You are an expert resume editor. Rewrite the following text to make it more {tone}, professional, and impactful.
 
 **ORIGINAL TEXT:**
 {text}
@@ -1470,25 +2776,18 @@ If the text has multiple bullet points, maintain that structure.
 
 **YOUR RESPONSE:**"""
 
-    try:
-        result = await chat_text(
-            [{"role": "user", "content": prompt}], 
-            temperature=0.4
-        )
-        
-        # Clean up the result
-        result = result.strip()
-        
-        # If the result is too long, truncate intelligently
-        if len(result) > len(text) * 2:
-            # Take first few sentences
-            sentences = result.split('. ')
-            result = '. '.join(sentences[:3])
-            if not result.endswith('.'):
-                result += '.'
-        
-        return result
-        
-    except Exception as e:
-        print(f"Rewrite error: {str(e)}")
-        return text  # Return original if rewrite fails
\ No newline at end of file
+
+def finalize_rewrite(result: str, original: str) -> str:
+    """Cleans up a model rewrite and truncates it if it ballooned past the original."""
+    # Clean up the result
+    result = result.strip()
+    
+    # If the result is too long, truncate intelligently
+    if len(result) > len(original) * 2:
+        # Take first few sentences
+        sentences = result.split('. ')
+        result = '. '.join(sentences[:3])
+        if not result.endswith('.'):
+            result += '.'
+    
+    return result
@@ -0,0 +1 @@
+# app/utils/benchmarks/__init__.py
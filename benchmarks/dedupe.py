@@ -0,0 +1,100 @@
+# app/utils/benchmarks/dedupe.py
+"""
+Measures the MinHash/LSH dedupe index on a synthetic bulk upload: the
+sample resumes plus many lightly edited copies and unrelated resumes.
+Reports signature and lookup latency and duplicate precision/recall
+against exact Jaccard similarity.
+
+    python -m app.utils.benchmarks.dedupe --resumes 5000 --threshold 0.85
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from ..dedupe import DedupeIndex, jaccard, shingles
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+VOCABULARY = (
+    "python java aws docker kubernetes react sql led built designed improved migrated reduced "
+    "pipelines services platform team customers latency reliability analytics dashboards api "
+    "engineer developer manager intern university bachelor master project award certified"
+).split()
+
+
+def _edit(text: str, rng: random.Random, edits: int) -> str:
+    """A copy with a few words replaced, dropped or inserted."""
+    words = text.split()
+    for _ in range(edits):
+        i = rng.randrange(len(words))
+        op = rng.random()
+        if op < 0.4:
+            words[i] = rng.choice(VOCABULARY)
+        elif op < 0.7 and len(words) > 1:
+            del words[i]
+        else:
+            words.insert(i, rng.choice(VOCABULARY))
+    return " ".join(words)
+
+
+def _random_resume(rng: random.Random) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(150, 400)))
+
+
+def main(resumes: int, threshold: float, edits: int, seed: int) -> None:
+    rng = random.Random(seed)
+    samples: List[str] = [p.read_text(encoding="utf-8") for p in sorted(SAMPLES_DIR.glob("*.txt"))]
+    corpus = [_random_resume(rng) for _ in range(resumes)] + samples
+    queries = [_edit(rng.choice(samples), rng, rng.randint(0, edits)) for _ in range(200)]
+    queries += [_random_resume(rng) for _ in range(200)]
+
+    index = DedupeIndex(threshold=threshold)
+    start = time.perf_counter()
+    signatures = [index.signature(text) for text in corpus]
+    signature_ms = (time.perf_counter() - start) / len(corpus) * 1000
+    for i, (text, signature) in enumerate(zip(corpus, signatures)):
+        index.add(i, text, signature=signature)
+
+    query_signatures = [index.signature(text) for text in queries]
+    start = time.perf_counter()
+    found = [index.find(text, signature) for text, signature in zip(queries, query_signatures)]
+    lookup_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+    # Ground truth: exact Jaccard against the source samples
+    sample_shingles = [shingles(text) for text in samples]
+    true_pos = false_pos = false_neg = 0
+    for text, match in zip(queries, found):
+        query_shingles = shingles(text)
+        is_duplicate = any(jaccard(query_shingles, s) >= threshold for s in sample_shingles)
+        if match and is_duplicate:
+            true_pos += 1
+        elif match:
+            false_pos += 1
+        elif is_duplicate:
+            false_neg += 1
+
+    print(json.dumps({
+        "indexed": len(index),
+        "threshold": threshold,
+        "bands": index.bands,
+        "rows": index.rows,
+        "signature_ms": round(signature_ms, 2),
+        "lookup_us": round(lookup_us, 1),
+        "duplicates_flagged": true_pos + false_pos,
+        "precision": round(true_pos / (true_pos + false_pos), 3) if true_pos + false_pos else None,
+        "recall": round(true_pos / (true_pos + false_neg), 3) if true_pos + false_neg else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="MinHash/LSH dedupe benchmark")
+    cli.add_argument("--resumes", type=int, default=5000, help="Unrelated resumes in the index")
+    cli.add_argument("--threshold", type=float, default=0.85)
+    cli.add_argument("--edits", type=int, default=6, help="Max word edits per duplicate")
+    cli.add_argument("--seed", type=int, default=3)
+    args = cli.parse_args()
+    main(args.resumes, args.threshold, args.edits, args.seed)
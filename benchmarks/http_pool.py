@@ -0,0 +1,82 @@
+# app/utils/benchmarks/http_pool.py
+"""
+Compares a fresh httpx client per call (the old behaviour of _call_openrouter)
+with the shared pooled client, against a local stub server.
+
+    python -m app.utils.benchmarks.http_pool --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from .. import ai, rate_limit
+from ..rate_limit import AdaptiveRateLimiter
+from .stub_openrouter import StubOpenRouter
+
+MESSAGES = [{"role": "user", "content": "Benchmark prompt"}]
+
+
+async def _per_call(url: str) -> None:
+    payload = {"model": "stub", "messages": MESSAGES, "temperature": 0.1, "max_tokens": 16}
+    async with httpx.AsyncClient() as client:
+        response = await client.post(url, json=payload, timeout=ai.REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+
+async def _pooled(url: str) -> None:
+    await ai._call_openrouter(MESSAGES, model="stub")
+
+
+async def _run(label: str, call, url: str, total: int, concurrency: int, stub: StubOpenRouter) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    connections_before = stub.connections
+
+    async def one():
+        async with semaphore:
+            await call(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": label,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(total / elapsed, 1),
+        "tcp_connections": stub.connections - connections_before,
+    }
+
+
+async def main(total: int, concurrency: int, latency: float) -> None:
+    async with StubOpenRouter(latency=latency) as stub:
+        ai.API_URL = stub.url
+        if not ai.settings.OPENROUTER_API_KEY:
+            ai.settings.OPENROUTER_API_KEY = "stub"
+        # Measure the client, not the limiter: no rate cap, and no queueing
+        # below the benchmark's own concurrency
+        rate_limit._rate_limiter = AdaptiveRateLimiter(
+            initial_concurrency=concurrency,
+            max_concurrency=concurrency,
+        )
+
+        results = [await _run("per_call", _per_call, stub.url, total, concurrency, stub)]
+        await ai.startup_http_client()
+        try:
+            results.append(await _run("pooled", _pooled, stub.url, total, concurrency, stub))
+        finally:
+            await ai.shutdown_http_client()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub response delay in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency))
@@ -0,0 +1,110 @@
+# app/utils/benchmarks/jd_keywords.py
+"""
+Compares the offline JD keyword extractor with LLM-extracted keywords on a
+directory of job descriptions and reports their overlap and extraction time.
+
+    # Call the LLM (needs OPENROUTER_API_KEY) and keep its output for later runs
+    python -m app.utils.benchmarks.jd_keywords --llm --save-reference jd_reference.json
+
+    # Offline, against previously saved LLM keywords
+    python -m app.utils.benchmarks.jd_keywords --reference jd_reference.json
+
+Overlap is reported exactly and after mapping both sides to canonical
+skill names ("k8s" and "kubernetes" agree), which is how resumes are matched.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+from .. import ai
+from ..jd_keywords import extract_jd_keywords_local
+from ..skill_matcher import get_skill_matcher
+
+JDS_DIR = Path(__file__).parent / "samples" / "jds"
+
+
+def _canonical(keywords: Set[str]) -> Set[str]:
+    matcher = get_skill_matcher()
+    canonical = set()
+    for kw in keywords:
+        skills = matcher.skills(kw)
+        canonical |= skills if skills else {kw}
+    return canonical
+
+
+def _overlap(local: Set[str], reference: Set[str]) -> Dict[str, float]:
+    common = local & reference
+    return {
+        "precision": round(len(common) / len(local), 3) if local else 0.0,
+        "recall": round(len(common) / len(reference), 3) if reference else 0.0,
+        "jaccard": round(len(common) / len(local | reference), 3) if local | reference else 0.0,
+    }
+
+
+async def _llm_reference(texts: Dict[str, str]) -> Dict[str, List[str]]:
+    await ai.startup_http_client()
+    try:
+        return {
+            name: sorted(await ai._extract_jd_keywords_ai(text))
+            for name, text in texts.items()
+        }
+    finally:
+        await ai.shutdown_http_client()
+
+
+def main(args: argparse.Namespace) -> None:
+    texts = {path.name: path.read_text(encoding="utf-8") for path in sorted(args.dir.glob("*.txt"))}
+    if not texts:
+        raise SystemExit(f"No .txt job descriptions found in {args.dir}")
+
+    if args.llm:
+        reference = asyncio.run(_llm_reference(texts))
+        if args.save_reference:
+            args.save_reference.write_text(json.dumps(reference, indent=2) + "\n", encoding="utf-8")
+    elif args.reference:
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+    else:
+        reference = {}
+
+    per_jd = []
+    elapsed = 0.0
+    for name, text in texts.items():
+        start = time.perf_counter()
+        local = extract_jd_keywords_local(text, top_n=args.top_n)
+        elapsed += time.perf_counter() - start
+        record = {"file": name, "local": list(local)}
+        if name in reference:
+            llm = set(reference[name])
+            record["llm"] = sorted(llm)
+            record["exact"] = _overlap(set(local), llm)
+            record["canonical"] = _overlap(_canonical(set(local)), _canonical(llm))
+        per_jd.append(record)
+
+    compared = [r for r in per_jd if "llm" in r]
+    summary = {
+        "job_descriptions": len(texts),
+        "compared_with_llm": len(compared),
+        "local_ms_per_jd": round(elapsed / len(texts) * 1000, 2),
+    }
+    for kind in ("exact", "canonical"):
+        if compared:
+            summary[kind] = {
+                metric: round(sum(r[kind][metric] for r in compared) / len(compared), 3)
+                for metric in ("precision", "recall", "jaccard")
+            }
+    print(json.dumps({"summary": summary, "job_descriptions": per_jd if args.verbose else None}, indent=2))
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="Offline vs LLM JD keyword overlap")
+    cli.add_argument("--dir", type=Path, default=JDS_DIR)
+    cli.add_argument("--top-n", type=int, default=25)
+    cli.add_argument("--llm", action="store_true", help="Extract reference keywords with the LLM")
+    cli.add_argument("--reference", type=Path, help="JSON {file: [keywords]} saved by --save-reference")
+    cli.add_argument("--save-reference", type=Path, help="Write the LLM keywords here for offline runs")
+    cli.add_argument("--verbose", action="store_true", help="Include per-JD keyword lists")
+    main(cli.parse_args())
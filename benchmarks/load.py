@@ -0,0 +1,212 @@
+# app/utils/benchmarks/load.py
+"""
+End-to-end load benchmark of the ai.py entry points against a local
+OpenRouter stand-in, so throughput can be measured without spending credits.
+
+    python -m app.utils.benchmarks.load --scenario all --requests 200 --concurrency 20 \\
+        --latency 0.2 --jitter 0.3 --error-rate 0.02 --throttle-rate 0.05 --output load.json
+
+Prints (and optionally writes) one JSON document with requests/sec,
+p50/p95/p99 latency and retry/throttle/fallback counts per scenario.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from .. import ai, rate_limit
+from ..rate_limit import AdaptiveRateLimiter
+from ..telemetry import get_telemetry
+from .stub_openrouter import StubOpenRouter
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+We are looking for a backend engineer with 5+ years of experience in Python, FastAPI or Django,
+PostgreSQL and AWS. You will design REST APIs and microservices, run them on Docker and
+Kubernetes, and mentor other engineers. Experience with Redis, CI/CD and agile teams is a plus."""
+
+BULLET_INPUT = "Worked on backend services for payments and helped the team with deployments and monitoring."
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _fallback_calls() -> int:
+    return sum(task["fallback_calls"] for task in get_telemetry().snapshot()["tasks"].values())
+
+
+def _load_resumes() -> List[str]:
+    resumes = [path.read_text(encoding="utf-8") for path in sorted(SAMPLES_DIR.glob("*.txt"))]
+    return resumes or ["Jane Doe\njane@example.com\n\nSKILLS\nPython, AWS"]
+
+
+def _scenarios(
+    resumes: List[str],
+    quality_mode: str,
+    bullet_candidates: int,
+) -> Dict[str, Callable[[int], Awaitable[Any]]]:
+    # The request index is appended so no two requests share a prompt
+    async def analyze(i: int) -> Any:
+        return await ai.analyze_resume_async(
+            f"{resumes[i % len(resumes)]}\n{i}", JOB_DESCRIPTION, quality_mode=quality_mode
+        )
+
+    async def parse(i: int) -> Any:
+        result = await ai.parse_resume_to_json_async(f"{resumes[i % len(resumes)]}\n{i}")
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return result
+
+    async def bullets(i: int) -> Any:
+        return await ai.generate_bullet_points_async(
+            f"{BULLET_INPUT} ({i})", ["kubernetes", "python"], candidates=bullet_candidates
+        )
+
+    async def sections(i: int) -> Any:
+        # A whole-resume rewrite: summary, two roles and a project in one request
+        return await ai.generate_resume_bullets_async([
+            {"id": "summary", "text": f"Backend engineer, 6 years ({i})", "section_type": "summary"},
+            {"id": "exp1", "text": f"{BULLET_INPUT} ({i})", "section_type": "experience"},
+            {"id": "exp2", "text": f"Maintained internal dashboards and reports ({i})", "section_type": "experience"},
+            {"id": "proj1", "text": f"Side project: a resume parser in Python ({i})", "section_type": "projects"},
+        ], ["kubernetes", "python"])
+
+    return {"analyze": analyze, "parse": parse, "bullets": bullets, "sections": sections}
+
+
+async def _run_scenario(
+    name: str,
+    call: Callable[[int], Awaitable[Any]],
+    total: int,
+    concurrency: int,
+    stub: StubOpenRouter,
+) -> Dict[str, Any]:
+    limiter = rate_limit.get_rate_limiter()
+    limiter_before = dict(limiter.counters)
+    stub_before = stub.requests
+    injected_before = dict(stub.injected)
+    fallback_before = _fallback_calls()
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(i)
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                return
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    counters = {key: limiter.counters[key] - limiter_before.get(key, 0) for key in limiter.counters}
+    return {
+        "scenario": name,
+        "requests": total,
+        "ok": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(total / elapsed, 2),
+        "latency_ms": {
+            "p50": round(_percentile(ordered, 50) * 1000, 1),
+            "p95": round(_percentile(ordered, 95) * 1000, 1),
+            "p99": round(_percentile(ordered, 99) * 1000, 1),
+            "max": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+        },
+        "llm_requests": stub.requests - stub_before,
+        "retries": counters["retries"],
+        "throttled": counters["throttled"],
+        "gave_up": counters["gave_up"],
+        "fallback_calls": _fallback_calls() - fallback_before,
+        "injected": {key: stub.injected[key] - injected_before[key] for key in stub.injected},
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    stub = StubOpenRouter(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    async with stub:
+        ai.API_URL = stub.url
+        ai.settings.OPENROUTER_API_KEY = ai.settings.OPENROUTER_API_KEY or "stub"
+        # Measure the code path, not the cache
+        ai.settings.LLM_CACHE_ENABLED = False
+        rate_limit._rate_limiter = AdaptiveRateLimiter(
+            rate=args.rate,
+            burst=max(1, int(args.rate)),
+            initial_concurrency=args.concurrency,
+            max_concurrency=max(args.concurrency, 32),
+        )
+        await ai.startup_http_client()
+        try:
+            scenarios = _scenarios(_load_resumes(), args.quality_mode, args.bullet_candidates)
+            names = list(scenarios) if args.scenario == "all" else [args.scenario]
+            results = [
+                await _run_scenario(name, scenarios[name], args.requests, args.concurrency, stub)
+                for name in names
+            ]
+        finally:
+            await ai.shutdown_http_client()
+
+    return {
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "throttle_rate": args.throttle_rate,
+            "retry_after": args.retry_after,
+            "rate": args.rate,
+            "quality_mode": args.quality_mode,
+            "bullet_candidates": args.bullet_candidates,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="Load benchmark of ai.py against a local OpenRouter stub")
+    cli.add_argument("--scenario", choices=["analyze", "parse", "bullets", "sections", "all"], default="all")
+    cli.add_argument("--requests", type=int, default=200)
+    cli.add_argument("--concurrency", type=int, default=20)
+    cli.add_argument("--latency", type=float, default=0.05, help="Base stub latency in seconds")
+    cli.add_argument("--jitter", type=float, default=0.0, help="Extra uniform random latency in seconds")
+    cli.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub responses that are 503")
+    cli.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of stub responses that are 429")
+    cli.add_argument("--retry-after", type=float, default=0.0, help="Retry-After seconds sent with injected 429s")
+    cli.add_argument("--rate", type=float, default=1000.0, help="Rate limiter requests/sec")
+    cli.add_argument("--quality-mode", choices=["llm", "batch", "local"], default="llm",
+                     help="Quality scoring mode of the analyze scenario")
+    cli.add_argument("--bullet-candidates", type=int, default=1,
+                     help="Concurrent bullet candidates in the bullets scenario (best-of-N when > 1)")
+    cli.add_argument("--seed", type=int, default=1)
+    cli.add_argument("--output", type=Path, help="Also write the JSON report to this file")
+    args = cli.parse_args()
+
+    report = asyncio.run(main(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
@@ -0,0 +1,97 @@
+# app/utils/benchmarks/skill_matcher.py
+"""
+Compares the Aho-Corasick skill matcher with the per-alias regex loop used by
+utils/jd-matcher.js and the old per-keyword substring scan, on a synthetic
+taxonomy with thousands of aliases.
+
+    python -m app.utils.benchmarks.skill_matcher --skills 2000 --aliases 4 --text-kb 20
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+
+from ..skill_matcher import SKILL_TAXONOMY, SkillMatcher, build_taxonomy
+
+
+def _synthetic_taxonomy(skills: int, aliases: int, rng: random.Random) -> dict:
+    raw = {skill: list(names) for skill, names in SKILL_TAXONOMY.items()}
+    syllables = ["ka", "lo", "mi", "ne", "ru", "ta", "vo", "zen", "qu", "dex", "ion", "py"]
+    while len(raw) < skills:
+        name = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        raw[name] = [name] + [f"{name}{suffix}" for suffix in ("js", " framework", "db", " cloud", "x")[:aliases - 1]]
+    return build_taxonomy(raw)
+
+
+def _synthetic_text(taxonomy: dict, kilobytes: int, rng: random.Random) -> str:
+    filler = "delivered scalable services with the team and improved reliability across platforms".split()
+    aliases = [alias for names in taxonomy.values() for alias in names]
+    words = []
+    while sum(len(w) + 1 for w in words) < kilobytes * 1024:
+        words.append(rng.choice(aliases) if rng.random() < 0.1 else rng.choice(filler))
+    return " ".join(words)
+
+
+def _regex_loop(taxonomy: dict, text: str) -> set:
+    # Equivalent of extractSkillsLevel1 in utils/jd-matcher.js
+    lower = text.lower()
+    found = set()
+    for skill, aliases in taxonomy.items():
+        for alias in aliases:
+            if re.search(r"\b%s\b" % re.escape(alias), lower):
+                found.add(skill)
+                break
+    return found
+
+
+def _substring_loop(taxonomy: dict, text: str) -> set:
+    # Old count_keyword_usage: one substring scan per keyword
+    lower = text.lower()
+    return {skill for skill, aliases in taxonomy.items() if any(alias in lower for alias in aliases)}
+
+
+def _time(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(skills: int, aliases: int, text_kb: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    taxonomy = _synthetic_taxonomy(skills, aliases, rng)
+    text = _synthetic_text(taxonomy, text_kb, rng)
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(taxonomy)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    automaton = matcher.skills(text)
+    regex = _regex_loop(taxonomy, text)
+    report = {
+        "skills": len(taxonomy),
+        "aliases": matcher.alias_count,
+        "text_chars": len(text),
+        "build_ms": round(build_ms, 1),
+        "ms_per_text": {
+            "aho_corasick": round(_time(lambda: matcher.skills(text), repeat), 2),
+            "regex_per_alias": round(_time(lambda: _regex_loop(taxonomy, text), max(1, repeat // 5)), 2),
+            "substring_per_keyword": round(_time(lambda: _substring_loop(taxonomy, text), repeat), 2),
+        },
+        "skills_found": len(automaton),
+        "agrees_with_regex": automaton == regex,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="Skill matcher benchmark")
+    cli.add_argument("--skills", type=int, default=2000)
+    cli.add_argument("--aliases", type=int, default=4, help="Aliases per synthetic skill (max 5)")
+    cli.add_argument("--text-kb", type=int, default=20)
+    cli.add_argument("--repeat", type=int, default=10)
+    cli.add_argument("--seed", type=int, default=7)
+    args = cli.parse_args()
+    main(args.skills, args.aliases, args.text_kb, args.repeat, args.seed)
@@ -0,0 +1,65 @@
+# app/utils/benchmarks/tier1_coverage.py
+"""
+Runs the rule-based tier 1 parser over a directory of plain-text resumes
+and reports how many would skip the LLM entirely, plus mean per-field
+confidence and parse time.
+
+    python -m app.utils.benchmarks.tier1_coverage --dir path/to/resumes
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from .. import parser
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+
+def main(directory: Path, verbose: bool) -> None:
+    files = sorted(directory.glob("*.txt"))
+    if not files:
+        raise SystemExit(f"No .txt resumes found in {directory}")
+
+    avoided = 0
+    field_totals = {}
+    per_file = []
+    elapsed = 0.0
+    for path in files:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        start = time.perf_counter()
+        result = parser.parse_sections(text)
+        tier1 = bool(result["name"] and result["email"]) and parser.is_confident(result)
+        elapsed += time.perf_counter() - start
+
+        avoided += tier1
+        for field, score in result["confidence"].items():
+            field_totals[field] = field_totals.get(field, 0.0) + score
+        per_file.append({
+            "file": path.name,
+            "tier1": tier1,
+            "low_confidence": sorted(
+                field for field, score in result["confidence"].items()
+                if score < parser.TIER1_CONFIDENCE_THRESHOLD
+            ),
+        })
+
+    report = {
+        "resumes": len(files),
+        "llm_avoided": avoided,
+        "llm_avoidance_rate": round(avoided / len(files), 3),
+        "mean_parse_ms": round(elapsed / len(files) * 1000, 3),
+        "mean_confidence": {field: round(total / len(files), 2) for field, total in field_totals.items()},
+    }
+    if verbose:
+        report["files"] = per_file
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    cli.add_argument("--dir", type=Path, default=SAMPLES_DIR)
+    cli.add_argument("--verbose", action="store_true", help="Include a per-file breakdown")
+    args = cli.parse_args()
+    main(args.dir, args.verbose)
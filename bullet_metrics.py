@@ -0,0 +1,71 @@
+# app/utils/bullet_metrics.py
+
+from typing import Any, Dict, Optional
+
+from .hedging import LatencyTracker
+
+# How a generate_bullet_points_async call was served
+FIRST = "first"              # the first candidate cleared the quality bar
+REGENERATED = "regenerated"  # serial mode: a second call via regenerate_with_emphasis
+SPECULATIVE = "speculative"  # best-of-N mode: a candidate cleared the bar
+BEST_EFFORT = "best_effort"  # best-of-N mode: none cleared it, the best one was used
+FALLBACK = "fallback"        # every call failed, template bullets were used
+
+
+class BulletMetrics:
+    """
+    Acceptance statistics for bullet generation, to tune the number of
+    speculative candidates against latency and token cost.
+    """
+
+    def __init__(self, window: int = 500):
+        self.latencies = LatencyTracker(window=window)
+        self.counters = {
+            "calls": 0,
+            FIRST: 0,
+            REGENERATED: 0,
+            SPECULATIVE: 0,
+            BEST_EFFORT: 0,
+            FALLBACK: 0,
+            "candidates_issued": 0,
+            "candidates_scored": 0,
+            "candidates_failed": 0,
+            "candidates_cancelled": 0,
+        }
+        # Arrival position (1 = first to finish) of the accepted candidate
+        self.accepted_at: Dict[int, int] = {}
+
+    def record_candidates(self, issued: int, scored: int, failed: int, cancelled: int) -> None:
+        self.counters["candidates_issued"] += issued
+        self.counters["candidates_scored"] += scored
+        self.counters["candidates_failed"] += failed
+        self.counters["candidates_cancelled"] += cancelled
+
+    def record_result(self, outcome: str, seconds: float, accepted_at: Optional[int] = None) -> None:
+        self.counters["calls"] += 1
+        self.counters[outcome] += 1
+        if accepted_at is not None:
+            self.accepted_at[accepted_at] = self.accepted_at.get(accepted_at, 0) + 1
+        self.latencies.record(outcome, seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.counters["calls"]
+        accepted = self.counters[FIRST] + self.counters[SPECULATIVE]
+        issued = self.counters["candidates_issued"]
+        return {
+            **self.counters,
+            "acceptance_rate": round(accepted / calls, 3) if calls else 0.0,
+            "candidates_per_call": round(issued / calls, 2) if calls else 0.0,
+            "accepted_at": dict(sorted(self.accepted_at.items())),
+            "latency": self.latencies.stats(),
+        }
+
+
+_bullet_metrics: Optional[BulletMetrics] = None
+
+
+def get_bullet_metrics() -> BulletMetrics:
+    global _bullet_metrics
+    if _bullet_metrics is None:
+        _bullet_metrics = BulletMetrics()
+    return _bullet_metrics
@@ -0,0 +1,183 @@
+# app/utils/circuit_breaker.py
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+from ..config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+StateListener = Callable[[str, str, str, str], None]
+
+
+class CircuitBreaker:
+    """
+    Per-model circuit breaker.
+
+    closed    -> calls flow; outcomes are kept in a rolling window. Once the
+                 window has `min_calls` outcomes and the failure rate or the
+                 slow-call rate reaches its threshold, the breaker opens.
+    open      -> calls are refused for `open_duration` seconds.
+    half_open -> up to `max_probes` probe calls are let through;
+                 `probes_to_close` consecutive healthy probes close the
+                 breaker, any failed probe opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 30.0,
+        slow_rate_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        max_probes: int = 1,
+        probes_to_close: int = 2,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_rate_threshold = slow_rate_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.max_probes = max_probes
+        self.probes_to_close = probes_to_close
+
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._listeners: List[StateListener] = []
+        self.counters = {"successes": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Registers listener(name, old_state, new_state, reason) for state changes."""
+        self._listeners.append(listener)
+
+    def _transition(self, new_state: str, reason: str) -> None:
+        old_state = self.state
+        if old_state == new_state:
+            return
+        self.state = new_state
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+            self.counters["opened"] += 1
+        if new_state != HALF_OPEN:
+            self._probes_in_flight = 0
+        self._probe_successes = 0
+        if new_state == CLOSED:
+            self._outcomes.clear()
+
+        _record_transition(self.name, old_state, new_state, reason)
+        for listener in self._listeners:
+            listener(self.name, old_state, new_state, reason)
+
+    def refresh_state(self) -> str:
+        """
+        Moves an open breaker to half-open once `open_duration` has passed
+        and returns the state. Callers with no alternative model use this
+        instead of allow_request, so each of their calls acts as a probe.
+        """
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._transition(HALF_OPEN, "open duration elapsed")
+        return self.state
+
+    def allow_request(self) -> bool:
+        """True if a call to this model should be attempted now."""
+        self.refresh_state()
+
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and self._probes_in_flight < self.max_probes:
+            self._probes_in_flight += 1
+            return True
+
+        self.counters["rejected"] += 1
+        return False
+
+    def release_probe(self) -> None:
+        """Frees a half-open probe slot whose call ended without an outcome (e.g. cancelled)."""
+        if self.state == HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_success(self, latency: float) -> None:
+        slow = latency >= self.slow_call_threshold
+        self.counters["successes"] += 1
+        if slow:
+            self.counters["slow_calls"] += 1
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        self.counters["failures"] += 1
+        self._record(failed=True, slow=False)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self.state == HALF_OPEN:
+            self.release_probe()
+            if failed or slow:
+                self._transition(OPEN, "probe failed" if failed else "probe was slow")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probes_to_close:
+                self._transition(CLOSED, f"{self._probe_successes} healthy probes")
+            return
+
+        if self.state == OPEN:
+            # Late outcome of a call started before the breaker opened
+            return
+
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) < self.min_calls:
+            return
+        failure_rate = sum(1 for f, _ in self._outcomes if f) / len(self._outcomes)
+        slow_rate = sum(1 for _, s in self._outcomes if s) / len(self._outcomes)
+        if failure_rate >= self.failure_rate_threshold:
+            self._transition(OPEN, f"failure rate {failure_rate:.0%}")
+        elif slow_rate >= self.slow_rate_threshold:
+            self._transition(OPEN, f"slow call rate {slow_rate:.0%}")
+
+    def stats(self) -> Dict[str, Any]:
+        window = len(self._outcomes)
+        return {
+            **self.counters,
+            "state": self.state,
+            "window_calls": window,
+            "failure_rate": round(sum(1 for f, _ in self._outcomes if f) / window, 3) if window else 0.0,
+            "slow_rate": round(sum(1 for _, s in self._outcomes if s) / window, 3) if window else 0.0,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_transitions: Deque[Dict[str, Any]] = deque(maxlen=100)
+
+
+def _record_transition(name: str, old_state: str, new_state: str, reason: str) -> None:
+    print(f"Circuit breaker for {name}: {old_state} -> {new_state} ({reason})")
+    _transitions.append({"model": name, "from": old_state, "to": new_state, "reason": reason, "at": time.time()})
+
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    """Returns the breaker for a model id, created from settings on first use."""
+    breaker = _breakers.get(model)
+    if breaker is None:
+        breaker = _breakers[model] = CircuitBreaker(
+            model,
+            failure_rate_threshold=getattr(settings, "CIRCUIT_FAILURE_RATE", 0.5),
+            slow_call_threshold=getattr(settings, "CIRCUIT_SLOW_CALL_SECONDS", 30.0),
+            slow_rate_threshold=getattr(settings, "CIRCUIT_SLOW_CALL_RATE", 0.5),
+            open_duration=getattr(settings, "CIRCUIT_OPEN_SECONDS", 30.0),
+        )
+    return breaker
+
+
+def get_breaker_states() -> Dict[str, Any]:
+    """Current state of every model's breaker plus recent state changes."""
+    return {
+        "breakers": {name: breaker.stats() for name, breaker in _breakers.items()},
+        "transitions": list(_transitions),
+    }
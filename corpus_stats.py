@@ -0,0 +1,234 @@
+# app/utils/corpus_stats.py
+
+import json
+import math
+import re
+import sqlite3
+from collections import Counter
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..config import settings
+from .skill_matcher import get_skill_matcher
+
+SCORING_MODES = ("flat", "tfidf", "bm25")
+
+# A smaller, more targeted stop word list is fine for resumes
+RESUME_STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
+    'with', 'by', 'as', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+}
+
+
+def tokenize_resume(text: str) -> List[str]:
+    """Lowercased word tokens, as used for resume keyword extraction."""
+    text = text.lower()
+    text = re.sub(r'[^\w\s\.]', ' ', text)
+    return text.split()
+
+
+def term_counts(text: str) -> Counter:
+    """
+    Counts of every keyword term (word or bigram) extract_keywords_from_resume
+    can produce, plus canonical skill names from the skill matcher.
+    """
+    words = tokenize_resume(text)
+    counts = Counter(
+        word for word in words
+        if len(word) > 2 and word not in RESUME_STOP_WORDS and not word.isdigit()
+    )
+    for first, second in zip(words, words[1:]):
+        if first not in RESUME_STOP_WORDS and second not in RESUME_STOP_WORDS:
+            bigram = f"{first} {second}"
+            if len(bigram) > 6:
+                counts[bigram] += 1
+    for skill, count in get_skill_matcher().count(text).items():
+        counts[skill] = max(counts[skill], count)
+    return counts
+
+
+class CorpusStats:
+    """
+    Document frequencies and length norms of the resume corpus, for
+    BM25 / TF-IDF weighted keyword matching.
+
+    Statistics are updated incrementally as resumes are added and removed,
+    so scoring never rescans other resumes. With `db_path` each resume's
+    term counts are also kept in SQLite and reloaded on startup.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, k1: float = 1.2, b: float = 0.75):
+        self.db_path = db_path
+        self.k1 = k1
+        self.b = b
+        self.df: Counter = Counter()
+        self.total_length = 0
+        self._docs: Dict[str, Tuple[int, Counter]] = {}
+        if db_path:
+            self._init_db()
+            self._load()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits (or rolls back) and is closed on exit."""
+        with closing(sqlite3.connect(self.db_path, timeout=10.0)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS corpus_docs (
+                    doc_id TEXT PRIMARY KEY,
+                    length INTEGER NOT NULL,
+                    terms TEXT NOT NULL
+                )"""
+            )
+
+    def _load(self) -> None:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT doc_id, length, terms FROM corpus_docs").fetchall()
+        for doc_id, length, terms in rows:
+            self._insert(doc_id, length, Counter(json.loads(terms)))
+
+    def _insert(self, doc_id: str, length: int, counts: Counter) -> None:
+        self._docs[doc_id] = (length, counts)
+        self.total_length += length
+        self.df.update(counts.keys())
+
+    @property
+    def n_docs(self) -> int:
+        return len(self._docs)
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / len(self._docs) if self._docs else 0.0
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return str(doc_id) in self._docs
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """Adds (or replaces) a resume's statistics."""
+        doc_id = str(doc_id)
+        self.remove(doc_id)
+        counts = term_counts(text)
+        length = len(tokenize_resume(text))
+        self._insert(doc_id, length, counts)
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO corpus_docs (doc_id, length, terms) VALUES (?, ?, ?)",
+                    (doc_id, length, json.dumps(counts)),
+                )
+
+    def remove(self, doc_id: Hashable) -> bool:
+        doc_id = str(doc_id)
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        length, counts = entry
+        self.total_length -= length
+        self.df.subtract(counts.keys())
+        for term in counts:
+            if self.df[term] <= 0:
+                del self.df[term]
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM corpus_docs WHERE doc_id = ?", (doc_id,))
+        return True
+
+    def idf(self, term: str) -> float:
+        """BM25 idf; never negative, and equal for every term on an empty corpus."""
+        n = len(self._docs)
+        df = self.df.get(term, 0)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def term_weight(self, tf: int, length: int, mode: str) -> float:
+        """
+        Per-match factor. tfidf counts any match as 1. bm25 grows with
+        repeats towards k1 + 1, saturating, and discounts matches in resumes
+        longer than average.
+        """
+        if tf <= 0:
+            return 0.0
+        if mode != "bm25":
+            return 1.0
+        avg = self.avg_length or length or 1
+        norm = 1 - self.b + self.b * (length / avg)
+        return tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+    def score(
+        self,
+        keywords: Iterable[str],
+        counts: Counter,
+        length: int,
+        mode: str = "bm25",
+        weights: Optional[Dict[str, float]] = None,
+        max_missing: int = 15,
+    ) -> Dict[str, Any]:
+        """
+        Weighted keyword match of one resume's term counts against JD keywords.
+        Each keyword is weighted by its idf (times its JD weight). The match
+        percentage is weighted keyword coverage, with each keyword's credit
+        capped at one mention in an average-length resume, so it reads the
+        same in every mode. weighted_score is the uncapped sum, for ranking.
+        Missing keywords are ranked by weight, heaviest first.
+        """
+        keywords = set(keywords)
+        weights = weights or {}
+        keyword_weights = {kw: self.idf(kw) * weights.get(kw, 1.0) for kw in keywords}
+        total = sum(keyword_weights.values())
+
+        matched: Set[str] = set()
+        score = 0.0
+        covered = 0.0
+        for kw, weight in keyword_weights.items():
+            factor = self.term_weight(counts.get(kw, 0), length, mode)
+            if factor:
+                matched.add(kw)
+                score += weight * factor
+                # term_weight(1, avg_length) is 1.0 in both modes
+                covered += weight * min(factor, 1.0)
+
+        missing = sorted(keywords - matched, key=lambda kw: (-keyword_weights[kw], kw))
+        return {
+            "match_percentage": round(covered / total * 100, 1) if total else 0.0,
+            "matched_keywords": sorted(matched),
+            "missing_keywords": missing[:max_missing],
+            "total_job_keywords": len(keywords),
+            "total_matched": len(matched),
+            "weighted_score": round(score, 4),
+            "scoring": mode,
+        }
+
+    def score_text(self, text: str, keywords: Iterable[str], mode: str = "bm25",
+                   weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        return self.score(keywords, term_counts(text), len(tokenize_resume(text)), mode, weights)
+
+    def score_document(self, doc_id: Hashable, keywords: Iterable[str], mode: str = "bm25",
+                       weights: Optional[Dict[str, float]] = None) -> Optional[Dict[str, Any]]:
+        """Scores an already added resume from its cached counts; None if unknown."""
+        entry = self._docs.get(str(doc_id))
+        if entry is None:
+            return None
+        length, counts = entry
+        return self.score(keywords, counts, length, mode, weights)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "documents": len(self._docs),
+            "terms": len(self.df),
+            "avg_length": round(self.avg_length, 1),
+        }
+
+
+_corpus_stats: Optional[CorpusStats] = None
+
+
+def get_corpus_stats() -> CorpusStats:
+    """Returns the process-wide corpus statistics, built from settings on first use."""
+    global _corpus_stats
+    if _corpus_stats is None:
+        _corpus_stats = CorpusStats(db_path=getattr(settings, "CORPUS_STATS_PATH", None))
+    return _corpus_stats
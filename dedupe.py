@@ -0,0 +1,319 @@
+# app/utils/dedupe.py
+
+import hashlib
+import json
+import random
+import re
+import sqlite3
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("dedupe needs numpy (pip install numpy)") from e
+
+from ..config import settings
+from .ai import parse_resume
+from .parser import parse_header, split_sections
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Bumped whenever signatures stop being comparable with stored ones
+_SIGNATURE_VERSION = 2
+
+
+def normalize_resume(text: str) -> List[str]:
+    """Lowercased word tokens; formatting, punctuation and spacing don't matter."""
+    return re.findall(r"\w+", text.lower())
+
+
+def content_hash(text: str) -> str:
+    """Exact-duplicate key: identical after normalization means identical hash."""
+    return hashlib.sha256(" ".join(normalize_resume(text)).encode("utf-8")).hexdigest()
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """64-bit hashes of the overlapping `size`-word shingles of a resume."""
+    words = normalize_resume(text)
+    grams = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+    return {int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little") for g in grams}
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def lsh_params(threshold: float, num_perm: int, recall: float = 0.95) -> Tuple[int, int]:
+    """
+    (bands, rows) for LSH over `num_perm` MinHash values. Two signatures
+    become candidates if any band of `rows` values matches; this picks the
+    most selective split that still makes a pair at `threshold` similarity
+    a candidate with probability `recall`.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands < recall:
+            break
+        best = (bands, rows)
+    return best
+
+
+class DuplicateMatch(NamedTuple):
+    doc_id: str
+    similarity: float  # estimated Jaccard similarity of the shingle sets
+    exact: bool
+    parsed: Optional[Dict[str, Any]]
+
+
+class DedupeIndex:
+    """
+    Near-duplicate resume detector for bulk and social-media intake.
+
+    Exact copies are caught by a normalized content hash. Edited copies are
+    caught by MinHash signatures over word shingles, bucketed by LSH bands
+    so a lookup only compares against resumes sharing a band instead of the
+    whole corpus. A stored parse can be attached to each resume so a
+    duplicate can reuse it instead of going to the LLM again. With `db_path`
+    hashes, signatures and parses are kept in SQLite and reloaded on startup.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = random.Random(seed)
+        # a, b < 2**32 on 32-bit shingle hashes keep a * h + b inside uint64
+        perms = [(rng.randrange(1, 1 << 32), rng.randrange(0, 1 << 32)) for _ in range(num_perm)]
+        self._a = np.array([a for a, _ in perms], dtype=np.uint64)[:, None]
+        self._b = np.array([b for _, b in perms], dtype=np.uint64)[:, None]
+        self._hashes: Dict[str, str] = {}  # content hash -> doc_id
+        self._docs: Dict[str, Tuple[str, np.ndarray]] = {}  # doc_id -> (content hash, signature)
+        self._parses: Dict[str, Dict[str, Any]] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(self.bands)]
+        self.counters = {"lookups": 0, "exact": 0, "near": 0}
+        if db_path:
+            self._init_db()
+            self._load()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits (or rolls back) and is closed on exit."""
+        with closing(sqlite3.connect(self.db_path, timeout=10.0)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+
+    def _init_db(self) -> None:
+        config = json.dumps({
+            "num_perm": self.num_perm,
+            "shingle_size": self.shingle_size,
+            "seed": self.seed,
+            "version": _SIGNATURE_VERSION,
+        })
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS dedupe_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS dedupe_docs (
+                    doc_id TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    signature BLOB NOT NULL,
+                    parsed TEXT
+                )"""
+            )
+            row = conn.execute("SELECT value FROM dedupe_meta WHERE key = 'config'").fetchone()
+            if row is None:
+                conn.execute("INSERT INTO dedupe_meta (key, value) VALUES ('config', ?)", (config,))
+            elif row[0] != config:
+                # Signatures from other hash functions can't be compared
+                raise ValueError(f"{self.db_path} was built with {row[0]}, not {config}")
+
+    def _load(self) -> None:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT doc_id, content_hash, signature, parsed FROM dedupe_docs").fetchall()
+        for doc_id, digest, blob, parsed in rows:
+            self._insert(doc_id, digest, np.frombuffer(blob, dtype=np.uint32))
+            if parsed:
+                self._parses[doc_id] = json.loads(parsed)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        raw = signature.tobytes()
+        width = self.rows * signature.itemsize
+        return [raw[band * width:(band + 1) * width] for band in range(self.bands)]
+
+    def _insert(self, doc_id: str, digest: str, signature: np.ndarray) -> None:
+        self._docs[doc_id] = (digest, signature)
+        self._hashes.setdefault(digest, doc_id)
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(key, set()).add(doc_id)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return str(doc_id) in self._docs
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        MinHash signature: per permutation, the minimum hash over all
+        shingles, computed as one (num_perm x shingles) array operation.
+        """
+        hashes = np.fromiter(shingles(text, self.shingle_size), dtype=np.uint64) & np.uint64(_MAX_HASH)
+        permuted = (self._a * hashes + self._b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+        return permuted.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity: the share of equal signature values."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    def find(self, text: str, signature: Optional[np.ndarray] = None) -> Optional[DuplicateMatch]:
+        """The most similar indexed resume at or above the threshold, if any."""
+        self.counters["lookups"] += 1
+        doc_id = self._hashes.get(content_hash(text))
+        if doc_id is not None:
+            self.counters["exact"] += 1
+            return DuplicateMatch(doc_id, 1.0, True, self._parses.get(doc_id))
+
+        if signature is None:
+            signature = self.signature(text)
+        candidates: Set[str] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            candidates |= bucket.get(key, set())
+
+        best: Optional[Tuple[float, str]] = None
+        for candidate in candidates:
+            score = self.similarity(signature, self._docs[candidate][1])
+            if score >= self.threshold and (best is None or (score, candidate) > best):
+                best = (score, candidate)
+        if best is None:
+            return None
+        self.counters["near"] += 1
+        return DuplicateMatch(best[1], round(best[0], 4), False, self._parses.get(best[1]))
+
+    def add(
+        self,
+        doc_id: Hashable,
+        text: str,
+        parsed: Optional[Dict[str, Any]] = None,
+        signature: Optional[np.ndarray] = None,
+    ) -> None:
+        """Indexes (or replaces) a resume, optionally with its parse."""
+        doc_id = str(doc_id)
+        self.remove(doc_id)
+        digest = content_hash(text)
+        if signature is None:
+            signature = self.signature(text)
+        self._insert(doc_id, digest, signature)
+        if parsed is not None:
+            self._parses[doc_id] = parsed
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO dedupe_docs (doc_id, content_hash, signature, parsed) VALUES (?, ?, ?, ?)",
+                    (doc_id, digest, signature.tobytes(), json.dumps(parsed) if parsed is not None else None),
+                )
+
+    def set_parse(self, doc_id: Hashable, parsed: Dict[str, Any]) -> bool:
+        """Attaches a parse to an indexed resume; False if the id is unknown."""
+        doc_id = str(doc_id)
+        if doc_id not in self._docs:
+            return False
+        self._parses[doc_id] = parsed
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("UPDATE dedupe_docs SET parsed = ? WHERE doc_id = ?", (json.dumps(parsed), doc_id))
+        return True
+
+    def remove(self, doc_id: Hashable) -> bool:
+        doc_id = str(doc_id)
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        digest, signature = entry
+        self._parses.pop(doc_id, None)
+        if self._hashes.get(digest) == doc_id:
+            del self._hashes[digest]
+            # Another copy with the same content keeps the exact match alive
+            for other, (other_digest, _) in self._docs.items():
+                if other_digest == digest:
+                    self._hashes[digest] = other
+                    break
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            members = bucket.get(key)
+            if members:
+                members.discard(doc_id)
+                if not members:
+                    del bucket[key]
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM dedupe_docs WHERE doc_id = ?", (doc_id,))
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "resumes": len(self._docs),
+            "parses": len(self._parses),
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows": self.rows,
+            **self.counters,
+        }
+
+
+_dedupe_index: Optional[DedupeIndex] = None
+
+
+def get_dedupe_index() -> DedupeIndex:
+    """Returns the process-wide dedupe index, built from settings on first use."""
+    global _dedupe_index
+    if _dedupe_index is None:
+        _dedupe_index = DedupeIndex(
+            db_path=getattr(settings, "DEDUPE_INDEX_PATH", None),
+            threshold=getattr(settings, "DEDUPE_THRESHOLD", 0.85),
+        )
+    return _dedupe_index
+
+
+async def parse_resume_deduped(
+    resume_id: Hashable,
+    text: str,
+    index: Optional[DedupeIndex] = None,
+) -> Tuple[Dict[str, Any], Optional[DuplicateMatch]]:
+    """
+    Parses a resume unless a duplicate with a stored parse is already
+    indexed. An exact copy reuses the stored parse as-is. A near-duplicate
+    may be a different candidate built from the same template, so only its
+    body is reused: the header and contact fields are parsed from the new
+    text, and if they can't be found the resume is parsed from scratch.
+    Returns the parse and the duplicate match (None for new resumes) so
+    callers can flag the upload. The resume is indexed under `resume_id`
+    either way.
+    """
+    if index is None:
+        index = get_dedupe_index()
+    signature = index.signature(text)
+    match = index.find(text, signature)
+    parsed = None
+    if match is not None and match.parsed is not None:
+        if match.exact:
+            parsed = match.parsed
+        else:
+            header = parse_header(split_sections(text)[0])
+            if header["name"] and header["email"]:
+                parsed = {**match.parsed, **header}
+    if parsed is None:
+        parsed = await parse_resume(text)
+    index.add(resume_id, text, parsed if "error" not in parsed else None, signature)
+    return parsed, match
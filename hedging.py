@@ -0,0 +1,115 @@
+# app/utils/hedging.py
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from ..config import settings
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies (seconds) per model."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        samples = self._samples.get(model)
+        if samples is None:
+            samples = self._samples[model] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def count(self, model: str) -> int:
+        return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, pct: float) -> Optional[float]:
+        samples = self._samples.get(model)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            model: {
+                "samples": len(samples),
+                "p50": round(self.percentile(model, 50), 3),
+                "p95": round(self.percentile(model, 95), 3),
+            }
+            for model, samples in self._samples.items()
+            if samples
+        }
+
+
+class HedgePolicy:
+    """
+    Decides how long to wait on the primary model before racing the
+    fallback, and counts how each race ended.
+
+    The delay is the configured percentile of the primary's recent latency,
+    so only the slowest few percent of calls are hedged. Until enough samples
+    exist a fixed delay is used.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 95.0,
+        default_delay: float = 10.0,
+        min_delay: float = 0.5,
+        max_delay: float = 60.0,
+        min_samples: int = 20,
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.counters = {
+            "calls": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "primary_wins": 0,
+            "both_failed": 0,
+        }
+
+    def delay_for(self, model: str, tracker: LatencyTracker) -> float:
+        if tracker.count(model) < self.min_samples:
+            return self.default_delay
+        delay = tracker.percentile(model, self.percentile)
+        return max(self.min_delay, min(self.max_delay, delay))
+
+    def stats(self) -> Dict[str, Any]:
+        hedged = self.counters["hedged"]
+        return {
+            **self.counters,
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "hedge_rate": round(hedged / self.counters["calls"], 3) if self.counters["calls"] else 0.0,
+            "hedge_win_rate": round(self.counters["hedge_wins"] / hedged, 3) if hedged else 0.0,
+        }
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+_hedge_policy: Optional[HedgePolicy] = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
+
+
+def get_hedge_policy() -> HedgePolicy:
+    """Returns the process-wide hedge policy, built from settings on first use."""
+    global _hedge_policy
+    if _hedge_policy is None:
+        _hedge_policy = HedgePolicy(
+            enabled=bool(getattr(settings, "OPENROUTER_HEDGING", False)),
+            percentile=getattr(settings, "OPENROUTER_HEDGE_PERCENTILE", 95.0),
+            default_delay=getattr(settings, "OPENROUTER_HEDGE_DELAY", 10.0),
+        )
+    return _hedge_policy
@@ -0,0 +1,371 @@
+# app/utils/inverted_index.py
+
+import heapq
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from ..config import settings
+from .ai import extract_keywords_from_resume, get_jd_profile
+from .jd_profiles import JDProfile
+
+MAGIC = b"RIDX0001"
+_HEADER = struct.Struct("<8sQQ")  # magic, term dictionary offset, term dictionary length
+
+
+# --- Posting list compression ---
+
+def encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(buf, pos: int) -> Tuple[int, int]:
+    """Returns (value, position after the varint)."""
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_postings(docnos: List[int], block_size: int = 128) -> bytes:
+    """
+    Encodes a sorted docno list as delta-gap varints in blocks of
+    `block_size`. A skip table (per block: gap of its last docno, byte
+    length) comes first so a cursor can jump over blocks without decoding.
+    """
+    blocks: List[bytes] = []
+    skips = bytearray()
+    encode_varint((len(docnos) + block_size - 1) // block_size, skips)
+    previous = -1
+    for start in range(0, len(docnos), block_size):
+        block = bytearray()
+        block_previous = previous
+        for docno in docnos[start:start + block_size]:
+            encode_varint(docno - block_previous - 1, block)
+            block_previous = docno
+        encode_varint(block_previous - previous - 1, skips)
+        encode_varint(len(block), skips)
+        blocks.append(bytes(block))
+        previous = block_previous
+    return bytes(skips) + b"".join(blocks)
+
+
+def _decode_block(buf, start: int, end: int, previous: int) -> List[int]:
+    docnos = []
+    pos = start
+    while pos < end:
+        gap, pos = decode_varint(buf, pos)
+        previous += gap + 1
+        docnos.append(previous)
+    return docnos
+
+
+def _read_blocks(buf, offset: int) -> List[Tuple[int, Callable[[], List[int]]]]:
+    """Reads a posting list's skip table into (last docno, lazy block decoder) pairs."""
+    count, pos = decode_varint(buf, offset)
+    table = []
+    previous = -1
+    for _ in range(count):
+        gap, pos = decode_varint(buf, pos)
+        length, pos = decode_varint(buf, pos)
+        table.append((previous, previous + gap + 1, length))
+        previous += gap + 1
+    blocks = []
+    for first_base, last, length in table:
+        blocks.append((last, lambda s=pos, e=pos + length, b=first_base: _decode_block(buf, s, e, b)))
+        pos += length
+    return blocks
+
+
+class _Cursor:
+    """Iterates one term's postings block by block, decoding only the blocks it lands in."""
+
+    def __init__(self, term: str, weight: float, blocks: List[Tuple[int, Callable[[], List[int]]]]):
+        self.term = term
+        self.weight = weight
+        self._blocks = blocks
+        self._block = -1
+        self._docs: List[int] = []
+        self._pos = 0
+        self.doc: Optional[int] = None
+        self._load(0)
+
+    def _load(self, block: int) -> None:
+        self._block = block
+        if block >= len(self._blocks):
+            self.doc = None
+            return
+        self._docs = self._blocks[block][1]()
+        self._pos = 0
+        self.doc = self._docs[0] if self._docs else None
+
+    def next(self) -> None:
+        self._pos += 1
+        if self._pos < len(self._docs):
+            self.doc = self._docs[self._pos]
+        else:
+            self._load(self._block + 1)
+
+    def seek(self, target: int) -> None:
+        """Moves to the first posting >= target."""
+        if self.doc is None or self.doc >= target:
+            return
+        block = self._block
+        while block < len(self._blocks) and self._blocks[block][0] < target:
+            block += 1
+        if block != self._block:
+            self._load(block)
+            if self.doc is None:
+                return
+        self._pos = bisect_left(self._docs, target, self._pos)
+        if self._pos < len(self._docs):
+            self.doc = self._docs[self._pos]
+        else:
+            self._load(self._block + 1)
+
+
+class InvertedIndex:
+    """
+    Inverted index from resume keywords (the terms and bigrams of
+    extract_keywords_from_resume) to resumes, for retrieving the best
+    candidates for a JD without scanning the whole pool.
+
+    Saved postings live in one file of delta/varint-compressed blocks that is
+    memory-mapped on load and decoded lazily. Uploads since the last save
+    are held in memory, deletions are tombstones until the next save
+    rewrites the file without them. search() uses WAND so only the posting
+    blocks that can still reach the current top-K are decoded.
+    """
+
+    def __init__(self, path: Optional[str] = None, block_size: int = 128):
+        self.path = path
+        self.block_size = block_size
+        self._doc_ids: Dict[int, Hashable] = {}    # docno -> resume id
+        self._docnos: Dict[Hashable, int] = {}     # resume id -> docno
+        self._next_docno = 0
+        self._deleted: Set[int] = set()
+        self._memory: Dict[str, List[int]] = {}    # postings added since the last save
+        self._terms: Dict[str, Tuple[int, int]] = {}  # term -> (offset, document frequency) in the file
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    # --- Persistence ---
+
+    @classmethod
+    def load(cls, path: str, block_size: int = 128) -> "InvertedIndex":
+        """Opens a saved index, memory-mapping its postings."""
+        index = cls(path, block_size)
+        index._open(path)
+        return index
+
+    def _open(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, dict_offset, dict_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an inverted index file")
+        meta = json.loads(self._mmap[dict_offset:dict_offset + dict_length].decode("utf-8"))
+        self._terms = {term: (offset, df) for term, offset, df in meta["terms"]}
+        self._doc_ids = {docno: resume_id for docno, resume_id in meta["docs"]}
+        self._docnos = {resume_id: docno for docno, resume_id in self._doc_ids.items()}
+        self._next_docno = meta["next_docno"]
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _file_postings(self, term: str) -> List[int]:
+        entry = self._terms.get(term)
+        if entry is None or self._mmap is None:
+            return []
+        return [doc for _, decode in _read_blocks(self._mmap, entry[0]) for doc in decode()]
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Writes the merged index (file postings + memory, minus deletions) to
+        `path` atomically and reopens it memory-mapped.
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the inverted index to")
+
+        postings: Dict[str, List[int]] = {}
+        for term in set(self._terms) | set(self._memory):
+            docs = [d for d in self._file_postings(term) + self._memory.get(term, []) if d not in self._deleted]
+            if docs:
+                postings[term] = docs
+
+        blob = bytearray()
+        terms = []
+        for term in sorted(postings):
+            terms.append([term, _HEADER.size + len(blob), len(postings[term])])
+            blob += encode_postings(postings[term], self.block_size)
+        meta = json.dumps({
+            "terms": terms,
+            "docs": sorted(self._doc_ids.items()),
+            "next_docno": self._next_docno,
+        }).encode("utf-8")
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, _HEADER.size + len(blob), len(meta)))
+            f.write(blob)
+            f.write(meta)
+            f.flush()
+            os.fsync(f.fileno())
+        self.close()
+        os.replace(tmp_path, path)
+
+        self.path = path
+        self._memory = {}
+        self._deleted = set()
+        self._open(path)
+
+    # --- Updates ---
+
+    def add(self, resume_id: Hashable, text: str) -> None:
+        """Indexes a resume's text, replacing any earlier version with the same id."""
+        self.add_keywords(resume_id, extract_keywords_from_resume(text))
+
+    def add_keywords(self, resume_id: Hashable, keywords: Set[str]) -> None:
+        self.delete(resume_id)
+        docno = self._next_docno
+        self._next_docno += 1
+        self._doc_ids[docno] = resume_id
+        self._docnos[resume_id] = docno
+        # Docnos only grow, so appending keeps every posting list sorted
+        for term in keywords:
+            self._memory.setdefault(term, []).append(docno)
+
+    def delete(self, resume_id: Hashable) -> bool:
+        docno = self._docnos.pop(resume_id, None)
+        if docno is None:
+            return False
+        del self._doc_ids[docno]
+        self._deleted.add(docno)
+        return True
+
+    # --- Retrieval ---
+
+    def _cursor(self, term: str, weight: float) -> Optional[_Cursor]:
+        blocks: List[Tuple[int, Callable[[], List[int]]]] = []
+        entry = self._terms.get(term)
+        if entry is not None and self._mmap is not None:
+            blocks = _read_blocks(self._mmap, entry[0])
+        memory = self._memory.get(term)
+        if memory:
+            blocks.append((memory[-1], lambda docs=memory: docs))
+        return _Cursor(term, weight, blocks) if blocks else None
+
+    def search(
+        self,
+        job_keywords: Union[Set[str], JDProfile],
+        top_k: int = 20,
+        max_missing: int = 15,
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-K resumes by (weighted) share of JD keywords matched, in the
+        calculate_keyword_match_score result shape plus the resume "id".
+        """
+        weights = job_keywords.weight if isinstance(job_keywords, JDProfile) else (lambda _: 1.0)
+        keywords = job_keywords.keywords if isinstance(job_keywords, JDProfile) else set(job_keywords)
+        total_weight = sum(weights(keyword) for keyword in keywords)
+        if not keywords or top_k <= 0 or total_weight <= 0:
+            return []
+
+        cursors = [c for c in (self._cursor(term, weights(term)) for term in keywords) if c and c.doc is not None]
+        heap: List[Tuple[float, int, List[str]]] = []  # (score, -docno, matched terms), min-heap
+
+        while cursors:
+            cursors.sort(key=lambda c: c.doc)
+            threshold = heap[0][0] if len(heap) >= top_k else 0.0
+
+            # Pivot: first cursor at which the summed upper bounds can beat the threshold
+            bound = 0.0
+            pivot = None
+            for i, cursor in enumerate(cursors):
+                bound += cursor.weight
+                if bound > threshold:
+                    pivot = i
+                    break
+            if pivot is None:
+                break
+            pivot_doc = cursors[pivot].doc
+
+            if cursors[0].doc == pivot_doc:
+                matched = [c for c in cursors if c.doc == pivot_doc]
+                if pivot_doc not in self._deleted:
+                    score = sum(c.weight for c in matched)
+                    entry = (score, -pivot_doc, [c.term for c in matched])
+                    if len(heap) < top_k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+                for cursor in matched:
+                    cursor.next()
+            else:
+                for cursor in cursors[:pivot]:
+                    cursor.seek(pivot_doc)
+            cursors = [c for c in cursors if c.doc is not None]
+
+        results = []
+        for score, negative_docno, matched_terms in sorted(heap, reverse=True):
+            matched = set(matched_terms)
+            results.append({
+                "id": self._doc_ids[-negative_docno],
+                "match_percentage": round(score / total_weight * 100, 1),
+                "matched_keywords": sorted(matched),
+                "missing_keywords": sorted(keywords - matched)[:max_missing],
+                "total_job_keywords": len(keywords),
+                "total_matched": len(matched),
+            })
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "resumes": len(self._docnos),
+            "file_terms": len(self._terms),
+            "memory_terms": len(self._memory),
+            "pending_deletes": len(self._deleted),
+            "file_bytes": len(self._mmap) if self._mmap is not None else 0,
+        }
+
+
+_inverted_index: Optional[InvertedIndex] = None
+
+
+def get_inverted_index() -> InvertedIndex:
+    """Returns the process-wide index, loaded from INVERTED_INDEX_PATH if it has been saved before."""
+    global _inverted_index
+    if _inverted_index is None:
+        path = getattr(settings, "INVERTED_INDEX_PATH", None)
+        if path and os.path.exists(path):
+            _inverted_index = InvertedIndex.load(path)
+        else:
+            _inverted_index = InvertedIndex(path)
+    return _inverted_index
+
+
+async def search_candidates(
+    job_description: Union[str, JDProfile],
+    top_k: int = 20,
+    index: Optional[InvertedIndex] = None,
+) -> List[Dict[str, Any]]:
+    """Retrieves the top_k indexed resumes for a JD (text or JDProfile)."""
+    profile = job_description if isinstance(job_description, JDProfile) else await get_jd_profile(job_description)
+    return (index or get_inverted_index()).search(profile, top_k=top_k)
@@ -0,0 +1,155 @@
+# app/utils/jd_keywords.py
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+from .corpus_stats import CorpusStats, get_corpus_stats
+from .skill_matcher import get_skill_matcher
+
+JD_KEYWORD_MODES = ("llm", "local", "refine")
+
+# Words that carry no screening signal in a job description, on top of
+# ordinary stop words. Phrases are split wherever one of these appears.
+JD_STOP_WORDS = {
+    'a', 'about', 'above', 'across', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at',
+    'be', 'been', 'being', 'both', 'but', 'by', 'can', 'could', 'do', 'does', 'each', 'etc', 'for',
+    'from', 'has', 'have', 'how', 'if', 'in', 'including', 'into', 'is', 'it', 'its', 'like', 'may',
+    'more', 'most', 'must', 'new', 'not', 'of', 'on', 'one', 'or', 'other', 'our', 'out', 'over',
+    'per', 'plus', 'preferred', 'required', 'such', 'than', 'that', 'the', 'their', 'them', 'there',
+    'these', 'they', 'this', 'those', 'through', 'to', 'up', 'us', 'use', 'using', 'very', 'via', 'was',
+    'we', 'well', 'what', 'when', 'where', 'which', 'while', 'who', 'will', 'with', 'within', 'work',
+    'working', 'would', 'you', 'your', "you'll", "you're", "we're",
+    # Job-ad boilerplate
+    'ability', 'able', 'candidate', 'candidates', 'company', 'excellent', 'experience', 'experienced',
+    'familiarity', 'good', 'great', 'help', 'ideal', 'join', 'knowledge', 'looking', 'opportunity',
+    'proven', 'requirements', 'responsibilities', 'role', 'seeking', 'skills', 'solid', 'strong',
+    'team', 'understanding', 'years', 'year', 'bonus', 'nice', 'least', 'hands', 'hands-on', 'based',
+    'job', 'position', 'day', 'make', 'ensure', 'want', 'need', 'needs', 'get', 'run', 'related', 'field',
+    'behind', 'between', 'under', 'among', 'every', 'used', 'end', 'thousands', 'equivalent', 'such',
+}
+
+# Verbs that open responsibility bullets; a noun phrase doesn't start with
+# one, so they are trimmed from the front of a run ("design rest apis").
+JD_LEADING_VERBS = {
+    'build', 'building', 'collaborate', 'create', 'deliver', 'design', 'designing', 'develop',
+    'developing', 'drive', 'implement', 'improve', 'lead', 'maintain', 'manage', 'mentor', 'operate',
+    'optimize', 'own', 'partner', 'present', 'review', 'run', 'scale', 'support', 'translate', 'write',
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./'-]*[a-z0-9+#]|[a-z0-9]")
+# Qualifications the LLM prompt asks for that phrase chunking would split apart
+_QUALIFICATION_RE = re.compile(
+    r"\b(bachelor'?s|master'?s|phd|b\.?tech|m\.?tech|mba)(?:\s+degree)?\b"
+    r"|\b(\d+)\+?\s*(?:-\s*\d+\s*)?years?\b",
+    re.IGNORECASE,
+)
+
+GAZETTEER_BOOST = 3.0
+PHRASE_BOOST = 1.5
+# Capitalized mid-sentence words are usually product or technology names
+PROPER_NOUN_BOOST = 1.5
+
+
+def _phrases(text: str, max_words: int = 2) -> List[str]:
+    """
+    Candidate noun phrases: maximal runs of non-stop-word tokens inside a
+    clause, split into every 1..max_words word window.
+    """
+    phrases = []
+    for clause in re.split(r"[\n.;:,!?()\[\]|/•*]+(?:\s|$)|\s[-–—]\s|[\n;:,!?()\[\]|•*]", text.lower()):
+        run: List[str] = []
+        for token in _TOKEN_RE.findall(clause) + [""]:
+            if token and token not in JD_STOP_WORDS and len(token) > 1 and re.search(r"[a-z]", token):
+                run.append(token)
+                continue
+            while run and run[0] in JD_LEADING_VERBS:
+                run.pop(0)
+            for size in range(1, max_words + 1):
+                phrases.extend(" ".join(run[i:i + size]) for i in range(len(run) - size + 1))
+            run = []
+    return phrases
+
+
+def _proper_nouns(text: str) -> Set[str]:
+    """Lowercased words written with a capital letter somewhere other than a sentence or bullet start."""
+    found = set()
+    previous = "."
+    for match in re.finditer(r"\S+", text):
+        word = match.group(0)
+        starts_line = match.start() == 0 or "\n" in text[max(0, match.start() - 2):match.start()]
+        if any(c.isupper() for c in word) and not starts_line and previous[-1] not in ".:!?-*•":
+            found.update(_TOKEN_RE.findall(word.lower()))
+        previous = word
+    return found
+
+
+def _qualifications(text: str) -> List[str]:
+    found = []
+    for match in _QUALIFICATION_RE.finditer(text):
+        if match.group(1):
+            degree = match.group(1).lower().replace("'", "").rstrip("s").replace(".", "")
+            found.append(f"{degree}'s degree" if degree in ("bachelor", "master") else degree)
+        else:
+            found.append(f"{match.group(2)}+ years")
+    return found
+
+
+def extract_jd_keywords_local(
+    text: str,
+    top_n: int = 25,
+    corpus: Optional[CorpusStats] = None,
+) -> Dict[str, float]:
+    """
+    Ranks JD keywords without an LLM call. Candidates are canonical skills
+    from the skill taxonomy, noun-phrase-like chunks and degree / years
+    requirements; each is scored by log frequency times its idf in the
+    resume corpus (terms every resume has say little), with taxonomy skills,
+    two-word phrases and capitalized names boosted. Returns the top_n keywords mapped to
+    weights in (0, 1], best first; the ranking is deterministic.
+    """
+    if not text or not text.strip():
+        return {}
+    corpus = corpus if corpus is not None else get_corpus_stats()
+
+    hits = get_skill_matcher().find(text)
+    skills = Counter(hit.skill for hit in hits)
+    # Skill mentions are cut out so phrases don't straddle them ("building machine")
+    rest, last = [], 0
+    for hit in hits:
+        rest.append(text[last:hit.start])
+        last = hit.end
+    rest.append(text[last:])
+    phrases = Counter(_phrases("\n".join(rest)))
+    qualifications = Counter(_qualifications(text))
+    proper_nouns = _proper_nouns(text)
+
+    scores: Dict[str, float] = {}
+    for term, count in (phrases + qualifications + skills).items():
+        if len(term) < 2 or len(term) >= 50:
+            continue
+        score = (1 + math.log(count)) * corpus.idf(term)
+        if term in skills:
+            score *= GAZETTEER_BOOST
+        elif " " in term or term in qualifications:
+            score *= PHRASE_BOOST
+        elif term in proper_nouns:
+            score *= PROPER_NOUN_BOOST
+        scores[term] = score
+
+    # A word that only ever appears inside one phrase adds nothing beyond the phrase
+    in_phrase: Counter = Counter()
+    for phrase, count in phrases.items():
+        if " " in phrase and phrase in scores:
+            for word in phrase.split():
+                in_phrase[word] = max(in_phrase[word], count)
+    ranked = [
+        (term, score) for term, score in scores.items()
+        if term in skills or not phrases[term] or phrases[term] > in_phrase[term]
+    ]
+    ranked = sorted(ranked, key=lambda item: (-item[1], item[0]))[:top_n]
+    if not ranked:
+        return {}
+    best = ranked[0][1] or 1.0
+    return {term: round(score / best, 4) for term, score in ranked}
@@ -0,0 +1,214 @@
+# app/utils/jd_profiles.py
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Set
+
+from ..config import settings
+
+# Bump when the keyword extraction changes so stored profiles are rebuilt.
+EXTRACTOR_VERSION = 2
+
+# Profiles built from the rule-based fallback (LLM unavailable) are kept in
+# memory only, and only briefly, so the next request retries the LLM.
+FALLBACK_TTL = 300.0
+
+
+def normalize_jd_text(text: str) -> str:
+    """Whitespace-insensitive form of a job description used for hashing."""
+    return re.sub(r'\s+', ' ', text or "").strip()
+
+
+def jd_hash(text: str, mode: Optional[str] = None) -> str:
+    """
+    Stable identifier of a job description's content and the keyword mode
+    (default JD_KEYWORD_MODE) its profile is built with, so changing the
+    mode rebuilds profiles instead of serving the old mode's keywords.
+    """
+    mode = mode or getattr(settings, "JD_KEYWORD_MODE", "llm")
+    material = f"v{EXTRACTOR_VERSION}:{mode}:{normalize_jd_text(text)}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class JDProfile:
+    """Precomputed keyword data for one job description."""
+    jd_hash: str
+    text: str
+    keywords: Set[str]
+    weights: Dict[str, float] = field(default_factory=dict)
+    source: str = "ai"
+    created_at: float = field(default_factory=time.time)
+
+    def weight(self, keyword: str) -> float:
+        return self.weights.get(keyword, 1.0)
+
+
+ProfileBuilder = Callable[[str], Awaitable[JDProfile]]
+
+
+class JDProfileRegistry:
+    """
+    Stores JD profiles by content hash: an in-memory LRU in front of an
+    optional SQLite table so profiles survive restarts. Concurrent requests
+    for the same JD share a single build.
+    """
+
+    def __init__(self, max_entries: int = 256, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, JDProfile]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.counters = {"hits": 0, "disk_hits": 0, "builds": 0}
+        if db_path:
+            self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits (or rolls back) and is closed on exit."""
+        with closing(sqlite3.connect(self.db_path, timeout=10.0)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jd_profiles (
+                    jd_hash TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    keywords TEXT NOT NULL,
+                    weights TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )"""
+            )
+
+    def _disk_get(self, key: str) -> Optional[JDProfile]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT text, keywords, weights, source, created_at FROM jd_profiles WHERE jd_hash = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        return JDProfile(
+            jd_hash=key,
+            text=row[0],
+            keywords=set(json.loads(row[1])),
+            weights=json.loads(row[2]),
+            source=row[3],
+            created_at=row[4],
+        )
+
+    def _disk_set(self, profile: JDProfile) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jd_profiles (jd_hash, text, keywords, weights, source, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    profile.jd_hash,
+                    profile.text,
+                    json.dumps(sorted(profile.keywords)),
+                    json.dumps(profile.weights),
+                    profile.source,
+                    profile.created_at,
+                ),
+            )
+
+    def _remember(self, profile: JDProfile) -> None:
+        self._memory[profile.jd_hash] = profile
+        self._memory.move_to_end(profile.jd_hash)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, job_description: str) -> Optional[JDProfile]:
+        """Returns the stored profile for this JD text, if any."""
+        key = jd_hash(job_description)
+        profile = self._memory.get(key)
+        if profile is not None:
+            if profile.source == "fallback" and time.time() - profile.created_at > FALLBACK_TTL:
+                del self._memory[key]
+            else:
+                self._memory.move_to_end(key)
+                self.counters["hits"] += 1
+                return profile
+
+        if self.db_path:
+            profile = await asyncio.to_thread(self._disk_get, key)
+            if profile is not None:
+                self._remember(profile)
+                self.counters["disk_hits"] += 1
+                return profile
+        return None
+
+    async def get_or_create(self, job_description: str, build: ProfileBuilder) -> JDProfile:
+        """Returns the profile for this JD, building it with `build` at most once."""
+        while True:
+            profile = await self.get(job_description)
+            if profile is not None:
+                return profile
+
+            key = jd_hash(job_description)
+            pending = self._pending.get(key)
+            if pending is None:
+                return await self._build(key, job_description, build)
+            # None means the builder was cancelled; the first waiter to wake rebuilds
+            profile = await asyncio.shield(pending)
+            if profile is not None:
+                return profile
+
+    async def _build(self, key: str, job_description: str, build: ProfileBuilder) -> JDProfile:
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            profile = await build(job_description)
+            self.counters["builds"] += 1
+            self._remember(profile)
+            if self.db_path and profile.source != "fallback":
+                await asyncio.to_thread(self._disk_set, profile)
+            future.set_result(profile)
+            return profile
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; release the waiters to rebuild
+            if not future.done():
+                future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    def invalidate(self, job_description: str) -> None:
+        """Drops the stored profile for this JD text."""
+        key = jd_hash(job_description)
+        self._memory.pop(key, None)
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM jd_profiles WHERE jd_hash = ?", (key,))
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.counters, "memory_entries": len(self._memory)}
+
+
+_registry: Optional[JDProfileRegistry] = None
+
+
+def get_jd_profile_registry() -> JDProfileRegistry:
+    """Returns the process-wide JD profile registry, built from settings on first use."""
+    global _registry
+    if _registry is None:
+        _registry = JDProfileRegistry(
+            max_entries=getattr(settings, "JD_PROFILE_MAX_ENTRIES", 256),
+            db_path=getattr(settings, "JD_PROFILE_PATH", None),
+        )
+    return _registry
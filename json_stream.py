@@ -0,0 +1,107 @@
+# app/utils/json_stream.py
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class JSONObjectStream:
+    """
+    Incremental parser for a JSON object that arrives in chunks.
+
+    feed() returns events as soon as they can be decoded:
+        {"type": "field", "key": str, "value": Any}             a top-level field is complete
+        {"type": "item", "key": str, "index": int, "value": Any}  an element of a top-level array is complete
+
+    Text before the opening brace (e.g. a ```json fence) and after the
+    closing brace is ignored. Only one pass is made over the input.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.result: Dict[str, Any] = {}
+        self.done = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._value_start: Optional[int] = None
+        self._array_key: Optional[str] = None
+        self._item_start = 0
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        if self.done:
+            return events
+        self.text += chunk
+        text = self.text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                continue
+
+            if self._depth == 0:
+                if c == "{":
+                    self._depth = 1
+                    self._key_start = i + 1
+                continue
+
+            if c == '"':
+                self._in_string = True
+            elif c in "{[":
+                self._depth += 1
+                if self._depth == 2 and c == "[" and text[self._value_start:i].strip() == "":
+                    self._array_key = self._key
+                    self._item_start = i + 1
+                    self._item_index = 0
+            elif c in "}]":
+                if self._depth == 2 and c == "]" and self._array_key is not None:
+                    self._emit_item(text[self._item_start:i], events)
+                    self._array_key = None
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit_field(text[self._value_start:i] if self._value_start is not None else "", events)
+                    self.done = True
+                    self._pos = i + 1
+                    return events
+            elif c == ",":
+                if self._depth == 1:
+                    self._emit_field(text[self._value_start:i], events)
+                    self._key_start = i + 1
+                elif self._depth == 2 and self._array_key is not None:
+                    self._emit_item(text[self._item_start:i], events)
+                    self._item_start = i + 1
+            elif c == ":" and self._depth == 1:
+                self._key = json.loads(text[self._key_start:i])
+                self._value_start = i + 1
+
+        self._pos = len(text)
+        return events
+
+    def _emit_field(self, raw: str, events: List[Dict[str, Any]]) -> None:
+        raw = raw.strip()
+        if self._key is None or not raw:
+            return
+        value = json.loads(raw, strict=False)
+        self.result[self._key] = value
+        events.append({"type": "field", "key": self._key, "value": value})
+        self._key = None
+        self._value_start = None
+
+    def _emit_item(self, raw: str, events: List[Dict[str, Any]]) -> None:
+        raw = raw.strip()
+        if not raw:
+            return
+        value = json.loads(raw, strict=False)
+        events.append({"type": "item", "key": self._array_key, "index": self._item_index, "value": value})
+        self._item_index += 1
@@ -0,0 +1,176 @@
+# app/utils/keyword_index.py
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Union
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError("keyword_index needs numpy and scipy (pip install numpy scipy)") from e
+
+from .ai import extract_keywords_from_resume, get_jd_profile
+from .jd_profiles import JDProfile
+
+
+class KeywordIndex:
+    """
+    Corpus-wide resume keyword index for ranking many resumes against one JD.
+
+    Each resume becomes a binary row over a shared vocabulary of the terms
+    extract_keywords_from_resume produces, so scoring every resume is a
+    single sparse matrix-vector product. New uploads are appended to a
+    pending buffer and folded into the CSR matrix on the next query;
+    re-adding an id replaces its old row, which is compacted away once
+    enough rows are dead.
+    """
+
+    def __init__(self, compact_ratio: float = 0.25):
+        self.compact_ratio = compact_ratio
+        self.vocabulary: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._ids: List[Hashable] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._alive: List[bool] = []
+        self._matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self._pending: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, resume_id: Hashable) -> bool:
+        return resume_id in self._rows
+
+    def _term_ids(self, terms: Iterable[str]) -> List[int]:
+        ids = []
+        for term in terms:
+            index = self.vocabulary.get(term)
+            if index is None:
+                index = self.vocabulary[term] = len(self._terms)
+                self._terms.append(term)
+            ids.append(index)
+        return sorted(ids)
+
+    def add(self, resume_id: Hashable, text: str) -> None:
+        """Indexes a resume's text, replacing any earlier version with the same id."""
+        self.add_keywords(resume_id, extract_keywords_from_resume(text))
+
+    def add_keywords(self, resume_id: Hashable, keywords: Set[str]) -> None:
+        """Indexes an already extracted keyword set."""
+        self.remove(resume_id)
+        self._rows[resume_id] = len(self._ids)
+        self._ids.append(resume_id)
+        self._alive.append(True)
+        self._pending.append(self._term_ids(keywords))
+
+    def remove(self, resume_id: Hashable) -> bool:
+        row = self._rows.pop(resume_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        return True
+
+    def _flush(self) -> None:
+        """Folds pending rows into the CSR matrix and drops dead rows when worthwhile."""
+        n_terms = len(self._terms)
+        matrix = self._matrix
+        if matrix.shape[1] != n_terms:
+            # New vocabulary only adds empty columns; reuse the CSR arrays
+            matrix = sparse.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], n_terms))
+        if self._pending:
+            indptr = np.zeros(len(self._pending) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(row) for row in self._pending])
+            indices = np.fromiter((i for row in self._pending for i in row), dtype=np.int32, count=int(indptr[-1]))
+            block = sparse.csr_matrix(
+                (np.ones(len(indices), dtype=np.float32), indices, indptr),
+                shape=(len(self._pending), n_terms),
+            )
+            matrix = sparse.vstack([matrix, block], format="csr")
+            self._pending = []
+        self._matrix = matrix
+
+        dead = len(self._alive) - len(self._rows)
+        if dead and dead >= self.compact_ratio * len(self._alive):
+            keep = np.flatnonzero(self._alive)
+            self._matrix = self._matrix[keep]
+            self._ids = [self._ids[row] for row in keep]
+            self._alive = [True] * len(self._ids)
+            self._rows = {resume_id: row for row, resume_id in enumerate(self._ids)}
+
+    def score(
+        self,
+        job_keywords: Union[Set[str], JDProfile],
+        top_k: int = 20,
+        max_missing: int = 15,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scores every indexed resume against a JD keyword set (or JDProfile,
+        whose weights are honoured) and returns the top_k best matches in the
+        calculate_keyword_match_score result shape, plus the resume "id".
+        """
+        weights = job_keywords.weight if isinstance(job_keywords, JDProfile) else (lambda _: 1.0)
+        keywords = job_keywords.keywords if isinstance(job_keywords, JDProfile) else set(job_keywords)
+        self._flush()
+        if not self._rows or not keywords:
+            return []
+
+        query = np.zeros(len(self._terms), dtype=np.float32)
+        for keyword in keywords:
+            column = self.vocabulary.get(keyword)
+            if column is not None:
+                query[column] = weights(keyword)
+        total_weight = sum(weights(keyword) for keyword in keywords)
+
+        scores = self._matrix @ query
+        scores[~np.asarray(self._alive)] = -1.0
+        k = min(top_k, len(self._rows))
+        # argpartition picks arbitrarily among rows tied with the k-th score;
+        # take them all so ties go to the earlier upload, as in InvertedIndex
+        kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        top = np.flatnonzero(scores >= kth)
+        top = top[np.lexsort((top, -scores[top]))][:k]
+
+        query_columns = np.flatnonzero(query)
+        results = []
+        for row in top:
+            start, end = self._matrix.indptr[row], self._matrix.indptr[row + 1]
+            matched_columns = np.intersect1d(self._matrix.indices[start:end], query_columns, assume_unique=True)
+            matched = {self._terms[column] for column in matched_columns}
+            missing = keywords - matched
+            results.append({
+                "id": self._ids[row],
+                "match_percentage": round(float(scores[row]) / total_weight * 100, 1) if total_weight else 0.0,
+                "matched_keywords": sorted(matched),
+                "missing_keywords": sorted(missing)[:max_missing],
+                "total_job_keywords": len(keywords),
+                "total_matched": len(matched),
+            })
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        self._flush()
+        return {
+            "resumes": len(self._rows),
+            "rows": self._matrix.shape[0],
+            "vocabulary": len(self._terms),
+            "nonzeros": int(self._matrix.nnz),
+        }
+
+
+_keyword_index: Optional[KeywordIndex] = None
+
+
+def get_keyword_index() -> KeywordIndex:
+    global _keyword_index
+    if _keyword_index is None:
+        _keyword_index = KeywordIndex()
+    return _keyword_index
+
+
+async def rank_resumes(
+    job_description: Union[str, JDProfile],
+    top_k: int = 20,
+    index: Optional[KeywordIndex] = None,
+) -> List[Dict[str, Any]]:
+    """Ranks every indexed resume against a JD (text or JDProfile); returns the top_k."""
+    profile = job_description if isinstance(job_description, JDProfile) else await get_jd_profile(job_description)
+    return (index if index is not None else get_keyword_index()).score(profile, top_k=top_k)
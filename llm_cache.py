@@ -0,0 +1,236 @@
+# app/utils/llm_cache.py
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config import settings
+
+# Per-task cache policy. True means responses for the task are cached by
+# default, False means they are only cached when the caller asks for it.
+# Tasks that are not listed are cached only when temperature is 0.0.
+CACHE_POLICIES: Dict[str, bool] = {
+    "parse_resume": True,
+    "jd_keywords": True,
+    "quality_score": True,
+    "quality_score_batch": True,
+    "bullets": False,
+    "bullets_regenerate": False,
+    "bullets_multi": False,
+    "rewrite": False,
+}
+
+
+def should_cache(task: Optional[str], temperature: float, cache: Optional[bool] = None) -> bool:
+    """Resolves whether a call is cacheable from the explicit flag, task policy and temperature."""
+    if not getattr(settings, "LLM_CACHE_ENABLED", False):
+        return False
+    if cache is not None:
+        return cache
+    if task in CACHE_POLICIES:
+        return CACHE_POLICIES[task]
+    return temperature == 0.0
+
+
+def make_cache_key(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    response_format: Optional[Dict[str, str]] = None,
+) -> str:
+    """Content address of a request: identical prompts with identical settings share a key."""
+    material = json.dumps(
+        {
+            "messages": messages,
+            "model": model,
+            "temperature": temperature,
+            "response_format": response_format,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for raw model responses.
+
+    Tier 1 is an in-process LRU bounded by entry count and TTL.
+    Tier 2 is an optional SQLite file that several worker processes can
+    share; disk hits are promoted into the memory tier.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 24 * 3600,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 100_000,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._writes_since_prune = 0
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        if db_path:
+            self._init_db()
+
+    # --- SQLite tier ---
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits (or rolls back) and is closed on exit."""
+        with closing(sqlite3.connect(self.db_path, timeout=10.0)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_created ON llm_responses(created_at)")
+
+    # These run on worker threads; they return what happened and the
+    # caller updates self.counters on the event loop.
+
+    def _disk_get(self, key: str) -> Tuple[Optional[Tuple[float, str]], bool]:
+        """(expires_at, value) if stored and live, and whether an expired row was deleted."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT expires_at, value FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and row[0] <= time.time():
+                conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None, True
+            return row, False
+
+    def _disk_set(self, key: str, value: str, expires_at: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, value, time.time(), expires_at),
+            )
+
+    def _disk_prune(self) -> Tuple[int, int]:
+        """Deletes expired rows, then the oldest beyond max_disk_entries; returns both counts."""
+        with self._connect() as conn:
+            expired = conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),)).rowcount
+            overflow = conn.execute(
+                """DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM llm_responses ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_disk_entries,),
+            ).rowcount
+        return max(expired, 0), max(overflow, 0)
+
+    # --- Memory tier ---
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._memory[key]
+            self.counters["expirations"] += 1
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: str, expires_at: float) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    # --- Public API ---
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._memory_get(key)
+        if value is not None:
+            self.counters["memory_hits"] += 1
+            return value
+
+        if self.db_path:
+            row, expired = await asyncio.to_thread(self._disk_get, key)
+            if expired:
+                self.counters["expirations"] += 1
+            if row is not None:
+                expires_at, value = row
+                self._memory_set(key, value, expires_at)
+                self.counters["disk_hits"] += 1
+                return value
+
+        self.counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (ttl if ttl is not None else self.ttl)
+        self._memory_set(key, value, expires_at)
+        self.counters["writes"] += 1
+
+        if self.db_path:
+            await asyncio.to_thread(self._disk_set, key, value, expires_at)
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_EVERY:
+                self._writes_since_prune = 0
+                expired, overflow = await asyncio.to_thread(self._disk_prune)
+                self.counters["expirations"] += expired
+                self.counters["evictions"] += overflow
+
+    def clear(self) -> None:
+        """Empties the memory tier and, if configured, the shared disk tier."""
+        self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_responses")
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+        lookups = hits + self.counters["misses"]
+        return {
+            **self.counters,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "persistent": bool(self.db_path),
+        }
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Returns the process-wide response cache, built from settings on first use."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=getattr(settings, "LLM_CACHE_MAX_ENTRIES", 1024),
+            ttl=getattr(settings, "LLM_CACHE_TTL", 24 * 3600),
+            db_path=getattr(settings, "LLM_CACHE_PATH", None),
+        )
+    return _response_cache
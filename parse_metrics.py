@@ -0,0 +1,79 @@
+# app/utils/parse_metrics.py
+
+from typing import Any, Dict, Iterable, Optional
+
+from .hedging import LatencyTracker
+
+# How a parse_resume call was served
+RULES = "rules"      # tier 1 alone, no LLM call
+HYBRID = "hybrid"    # tier 1 plus an LLM call for the low-confidence fields
+LLM = "llm"          # every field came from the LLM
+FAILED = "failed"    # the LLM was needed for name/email and failed; no parse
+
+
+class ParseMetrics:
+    """Per-tier hit counts and latencies for the tiered resume parser."""
+
+    def __init__(self, window: int = 500):
+        self.latencies = LatencyTracker(window=window)
+        self.counters = {
+            "calls": 0,
+            RULES: 0,
+            HYBRID: 0,
+            LLM: 0,
+            FAILED: 0,
+            "llm_failed": 0,
+            "fields_from_rules": 0,
+            "fields_from_llm": 0,
+            "fields_failed": 0,  # escalated, but the LLM call failed; rule values (if any) were kept
+        }
+        self.escalated_fields: Dict[str, int] = {}
+
+    def record_rules(self, seconds: float) -> None:
+        self.counters["calls"] += 1
+        self.latencies.record("tier1", seconds)
+
+    def record_llm(self, seconds: float, fields: Iterable[str], failed: bool = False) -> None:
+        self.latencies.record("tier2", seconds)
+        if failed:
+            self.counters["llm_failed"] += 1
+        for field in fields:
+            self.escalated_fields[field] = self.escalated_fields.get(field, 0) + 1
+
+    def record_result(
+        self,
+        tier: str,
+        seconds: float,
+        rule_fields: int,
+        llm_fields: int,
+        failed_fields: int = 0,
+    ) -> None:
+        self.counters[tier] += 1
+        self.counters["fields_from_rules"] += rule_fields
+        self.counters["fields_from_llm"] += llm_fields
+        self.counters["fields_failed"] += failed_fields
+        self.latencies.record(tier, seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.counters["calls"]
+        fields = self.counters["fields_from_rules"] + self.counters["fields_from_llm"]
+        return {
+            **self.counters,
+            "rules_hit_rate": round(self.counters[RULES] / calls, 3) if calls else 0.0,
+            "llm_call_rate": round((self.counters[HYBRID] + self.counters[LLM]) / calls, 3) if calls else 0.0,
+            "rules_field_share": round(self.counters["fields_from_rules"] / fields, 3) if fields else 0.0,
+            # Share of fields parsed by either tier; drops while the LLM is failing
+            "field_coverage": round(fields / (fields + self.counters["fields_failed"]), 3) if fields else 0.0,
+            "escalated_fields": dict(self.escalated_fields),
+            "latency": self.latencies.stats(),
+        }
+
+
+_parse_metrics: Optional[ParseMetrics] = None
+
+
+def get_parse_metrics() -> ParseMetrics:
+    global _parse_metrics
+    if _parse_metrics is None:
+        _parse_metrics = ParseMetrics()
+    return _parse_metrics
@@ -1,83 +1,542 @@
 # app/utils/parser.py
 import re
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
+
+# Minimum confidence every field needs for a tier 1 result to be used as-is.
+TIER1_CONFIDENCE_THRESHOLD = 0.6
+
+# Define keywords that signal the start of a section. Case-insensitive.
+SECTION_KEYWORDS = {
+    'summary': [r'summary', r'professional summary', r'objective', r'career objective', r'profile',
+                r'professional profile', r'about me', r'about'],
+    'skills': [r'skills', r'technical skills', r'key skills', r'core competencies', r'technologies',
+               r'tools & technologies', r'tools and technologies', r'expertise'],
+    'experience': [r'experience', r'work experience', r'professional experience', r'work history',
+                   r'employment', r'employment history', r'career history'],
+    'education': [r'education', r'academic background', r'academic qualifications', r'qualifications'],
+    'projects': [r'projects', r'personal projects', r'academic projects', r'key projects', r'portfolio'],
+    'certifications': [r'certifications', r'certificates', r'licenses & certifications',
+                       r'licenses and certifications', r'courses & certifications']
+}
+
+_HEADER_RE = re.compile(
+    r'^\s*(%s)\s*[:.\-]?\s*$' % '|'.join(kw for kws in SECTION_KEYWORDS.values() for kw in kws),
+    re.IGNORECASE | re.MULTILINE
+)
+
+_MONTH = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+_DATE = r'(?:%s\s+\d{4}|\d{1,2}/\d{4}|\d{4})' % _MONTH
+_PERIOD_RE = re.compile(
+    r'(%s\s*(?:-|–|—|to|till|until)\s*(?:%s|present|current|now|till date|date)|%s)' % (_DATE, _DATE, _DATE),
+    re.IGNORECASE
+)
+_BULLET_RE = re.compile(r'^\s*(?:[-•*▪●◦‣■►✓]|\d+[.)])\s+')
+_URL_RE = re.compile(r'(?:https?://|www\.)\S+|\b(?:linkedin\.com|github\.com)/\S+', re.IGNORECASE)
+_DEGREE_RE = re.compile(
+    r'\b(?:b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|m\.?\s?e\b|b\.?\s?sc|m\.?\s?sc|b\.?\s?s\b|m\.?\s?s\b|b\.?\s?a\b|'
+    r'm\.?\s?a\b|b\.?\s?com|m\.?\s?com|bca|mca|mba|ph\.?\s?d|bachelor|master|doctorate|diploma|'
+    r'associate|high school|secondary|higher secondary|ssc|hsc)',
+    re.IGNORECASE
+)
+_INSTITUTION_RE = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic|iit|nit)\b', re.IGNORECASE)
+_COMPANY_HINT_RE = re.compile(
+    r'\b(?:inc|llc|ltd|limited|corp|corporation|company|co\.|technologies|solutions|systems|services|'
+    r'labs|group|pvt|private|consulting|software|bank)\b',
+    re.IGNORECASE
+)
+_LOCATION_RE = re.compile(r'\b([A-Z][a-zA-Z .]+,\s*(?:[A-Z]{2}|[A-Z][a-zA-Z ]+))\b')
+_LABEL_RE = re.compile(r'^\s*(?:email|e-mail|phone|mobile|tel|contact|location|address|linkedin|github|website)\s*[:\-]', re.IGNORECASE)
+_HEADING_SEPARATORS = re.compile(r'\s+(?:\||–|—|-|@|at)\s+|\s*,\s*|\s*\|\s*')
+# Institution names contain commas ("University of California, Berkeley"), so
+# education lines are only split on these
+_EDUCATION_SEPARATORS = re.compile(r'\s+(?:\||–|—|-|@)\s+|\s*\|\s*')
+
 
 def find_email(text: str) -> Optional[str]:
     """Finds the first email address in a block of text."""
-    match = re.search(r'[\w\.-]+ @[\w\.-]+\.\w+', text)
+    match = re.search(r'[\w\.+-]+@[\w\.-]+\.\w+', text)
     return match.group(0) if match else ""
 
 def find_phone(text: str) -> Optional[str]:
     """Finds the first phone number in a block of text."""
     # This regex is designed to find common phone number formats
-    match = re.search(r'(\+?\d{1,3}[\s.-]?)?(\(?\d{3}\)?[\s.-]?)?[\d\s.-]{7,15}', text)
-    return match.group(0).strip() if match else ""
+    for match in re.finditer(r'(\+?\d{1,3}[\s.-]?)?(\(?\d{3}\)?[\s.-]?)?[\d\s.-]{7,15}', text):
+        candidate = match.group(0).strip()
+        # Skip years and date ranges, which the pattern also matches
+        if len(re.sub(r'\D', '', candidate)) >= 10:
+            return candidate
+    return ""
 
-def parse_tier1(text: str) -> Optional[Dict]:
-    """
-    Attempts to parse a resume using fast, rule-based methods.
-    Returns a dictionary if successful, otherwise returns None.
-    """
-    # Define keywords that signal the start of a section. Case-insensitive.
-    section_keywords = {
-        'summary': [r'summary', r'objective', r'profile'],
-        'skills': [r'skills', r'technical skills', r'technologies'],
-        'experience': [r'experience', r'work history', r'employment'],
-        'education': [r'education', r'academic background'],
-        'projects': [r'projects'],
-        'certifications': [r'certifications', r'licenses & certifications']
-    }
+def find_website(text: str) -> str:
+    """Finds the first URL (portfolio, LinkedIn, GitHub) in a block of text."""
+    match = _URL_RE.search(text)
+    return match.group(0).rstrip('.,;)') if match else ""
+
+def find_period(text: str) -> str:
+    """Finds a date or date range such as 'Jan 2020 - Present' or '2019-2021'."""
+    match = _PERIOD_RE.search(text)
+    return match.group(0).strip() if match else ""
 
-    # Build a master regex to find any of the section headers
-    all_keywords = [item for sublist in section_keywords.values() for item in sublist]
-    # Match whole lines that start with a keyword, are followed by optional characters, and end with a newline
-    pattern = re.compile(r'^(%s)[\s:.]*$' % '|'.join(all_keywords), re.IGNORECASE | re.MULTILINE)
-    
-    matches = list(pattern.finditer(text))
-    
-    # If we can't find at least 2 major sections, the resume is too unstructured.
-    # Fall back to the AI parser.
-    if len(matches) < 2:
-        return None
 
-    print("Tier 1 Parser: Structured resume detected. Parsing sections.")
-    
-    sections = {}
+def split_sections(text: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Splits resume text on recognised section headers.
+    Returns the header block (everything before the first section) and the
+    body of each section by canonical name.
+    """
+    matches = list(_HEADER_RE.finditer(text))
+    sections: Dict[str, str] = {}
     for i, match in enumerate(matches):
-        # Determine which section this keyword belongs to
-        section_name = ""
-        for name, kws in section_keywords.items():
-            if any(re.search(kw, match.group(0), re.IGNORECASE) for kw in kws):
-                section_name = name
-                break
-        
+        heading = match.group(1).lower()
+        section_name = next(
+            name for name, kws in SECTION_KEYWORDS.items()
+            if any(re.fullmatch(kw, heading, re.IGNORECASE) for kw in kws)
+        )
         # The content of the section is the text between this match and the next one
         start = match.end()
         end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        sections[section_name] = text[start:end].strip()
-
-    # The header is everything before the first section match
-    header_text = text[:matches[0].start()].strip()
-    
-    # Basic parsing of found data
-    # This is a simplified example; more complex regex could parse experience items
-    result = {
-        "name": header_text.split('\n')[0].strip(),
-        "title": header_text.split('\n')[1].strip() if len(header_text.split('\n')) > 1 else "",
-        "email": find_email(header_text),
-        "phone": find_phone(header_text),
-        "location": "", # Could be inferred from header
-        "website": "",
-        "summary": sections.get('summary', ""),
-        "skills": [s.strip() for s in sections.get('skills', "").split('\n') if s.strip()],
-        "experience": [], # Tier 1 can be extended to parse this, but for now we leave it to AI if needed
-        "education": [],
-        "projects": [],
-        "certifications": []
+        body = text[start:end].strip()
+        # A repeated heading (e.g. "Experience" twice) extends the section
+        sections[section_name] = f"{sections[section_name]}\n\n{body}" if section_name in sections else body
+
+    header_text = text[:matches[0].start()].strip() if matches else text.strip()
+    return header_text, sections
+
+
+# Schema fields that come from the header block rather than a section
+HEADER_FIELDS = ["name", "title", "location", "email", "phone", "website"]
+
+
+def _split_long_section(body: str, max_chars: int) -> List[str]:
+    """
+    Cuts a section body into pieces of at most ~max_chars, only at entry
+    boundaries: blank lines, or a heading line right after a detail line.
+    An entry longer than max_chars is kept whole.
+    """
+    units: List[List[str]] = [[]]
+    previous = ""
+    for raw in body.split('\n'):
+        line = raw.strip()
+        if not line:
+            if units[-1]:
+                units.append([])
+            previous = ""
+            continue
+        starts_entry = previous and not _is_bullet(line) and (_is_bullet(previous) or _looks_like_sentence(previous))
+        if starts_entry and units[-1]:
+            units.append([])
+        units[-1].append(raw)
+        previous = line
+
+    pieces: List[str] = []
+    current = ""
+    for unit in filter(None, units):
+        text = "\n".join(unit)
+        if current and len(current) + len(text) + 2 > max_chars:
+            pieces.append(current)
+            current = text
+        else:
+            current = f"{current}\n\n{text}" if current else text
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_into_chunks(
+    text: str,
+    max_chars: int = 6000,
+    fields: Optional[List[str]] = None
+) -> List[Tuple[List[str], str]]:
+    """
+    Splits a resume into independently parseable chunks at section
+    boundaries. Returns (schema fields, chunk text) pairs in document order;
+    long entry-based sections are split further between entries. Only
+    `fields` (default: the whole schema) are assigned, and those whose
+    section wasn't detected are asked of the whole text in a final chunk,
+    so every field is covered.
+    """
+    wanted = list(fields) if fields is not None else HEADER_FIELDS + list(SECTION_KEYWORDS)
+    header_text, sections = split_sections(text)
+    header_fields = list(HEADER_FIELDS)
+    if 'summary' not in sections:
+        # Untitled summaries usually sit right under the contact details
+        header_fields.append('summary')
+
+    chunks: List[Tuple[List[str], str]] = []
+    if header_text:
+        chunks.append((header_fields, header_text))
+    for name, body in sections.items():
+        if not body:
+            continue
+        if name in ('experience', 'projects', 'education', 'certifications'):
+            chunks.extend(([name], f"{name.upper()}\n{piece}") for piece in _split_long_section(body, max_chars))
+        else:
+            chunks.append(([name], f"{name.upper()}\n{body}"))
+
+    chunks = [([f for f in chunk_fields if f in wanted], chunk) for chunk_fields, chunk in chunks]
+    chunks = [(chunk_fields, chunk) for chunk_fields, chunk in chunks if chunk_fields]
+    covered = {f for chunk_fields, _ in chunks for f in chunk_fields}
+    uncovered = [f for f in wanted if f not in covered]
+    if chunks and uncovered:
+        chunks.append((uncovered, text))
+    return chunks
+
+
+def _is_bullet(line: str) -> bool:
+    return bool(_BULLET_RE.match(line))
+
+def _strip_bullet(line: str) -> str:
+    return _BULLET_RE.sub('', line).strip()
+
+def _looks_like_sentence(line: str) -> bool:
+    return len(line.split()) > 10 or line.rstrip().endswith('.')
+
+def _looks_like_heading(line: str) -> bool:
+    return len(line.split()) <= 8 and not line.rstrip().endswith('.') and line[0].isupper()
+
+
+def _group_entries(section_text: str) -> List[Dict[str, Any]]:
+    """
+    Groups the lines of an entry-based section (experience, projects, ...)
+    into entries of heading lines and detail lines.
+
+    A new entry starts at a non-bullet, heading-like line that follows the
+    previous entry's details, or at a second dated heading. Wrapped bullet
+    lines are joined back onto their bullet.
+    """
+    entries: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    last_blank = False
+
+    for raw in section_text.split('\n'):
+        line = raw.strip()
+        if not line:
+            last_blank = True
+            continue
+
+        if _is_bullet(line):
+            if current is None:
+                current = {"heading": [], "details": [], "bulleted": False}
+                entries.append(current)
+            current["details"].append(_strip_bullet(line))
+            current["bulleted"] = True
+        else:
+            dated = bool(find_period(line))
+            in_details = current is not None and bool(current["details"])
+            continuation = (
+                in_details and not last_blank and not dated
+                and current["bulleted"]
+                and (
+                    line[0].islower()
+                    or (not current["details"][-1].rstrip().endswith(('.', '!', '?')) and not _looks_like_heading(line))
+                )
+            )
+            if continuation:
+                current["details"][-1] = f"{current['details'][-1]} {line}"
+            elif current is not None and not in_details and not dated and not last_blank and len(current["heading"]) < 3 \
+                    and not _looks_like_sentence(line):
+                current["heading"].append(line)
+            elif current is not None and not dated and not last_blank and _looks_like_sentence(line) \
+                    and (in_details or current["heading"]):
+                # Paragraph-style details directly under the heading
+                current["details"].append(line)
+            elif current is not None and not in_details and dated and not any(find_period(h) for h in current["heading"]) \
+                    and len(current["heading"]) < 3:
+                current["heading"].append(line)
+            else:
+                current = {"heading": [line], "details": [], "bulleted": False}
+                entries.append(current)
+        last_blank = False
+
+    return entries
+
+
+def _split_heading(heading: List[str]) -> Tuple[List[str], str]:
+    """Pulls the period out of heading lines and splits the rest into parts."""
+    period = ""
+    parts: List[str] = []
+    for line in heading:
+        found = find_period(line)
+        if found and not period:
+            period = found
+            line = line.replace(found, ' ')
+        line = re.sub(r'[()\[\]]', ' ', line)
+        for part in _HEADING_SEPARATORS.split(line):
+            part = part.strip(' -–—|,:')
+            if part:
+                parts.append(part)
+    return parts, period
+
+
+def parse_experience_section(section_text: str) -> List[Dict[str, str]]:
+    """Parses an experience section into role/company/period/details entries."""
+    experience = []
+    for entry in _group_entries(section_text):
+        parts, period = _split_heading(entry["heading"])
+        role, company = "", ""
+        if len(parts) >= 2:
+            role, company = parts[0], parts[1]
+            # "Acme Corp | Senior Engineer" ordering
+            if _COMPANY_HINT_RE.search(role) and not _COMPANY_HINT_RE.search(company):
+                role, company = company, role
+        elif parts:
+            if _COMPANY_HINT_RE.search(parts[0]):
+                company = parts[0]
+            else:
+                role = parts[0]
+        if not (role or company or period) and not entry["details"]:
+            continue
+        experience.append({
+            "role": role,
+            "company": company,
+            "period": period,
+            "details": "\n".join(entry["details"])
+        })
+    return experience
+
+
+def _split_degree_institution(line: str) -> Tuple[str, str]:
+    """
+    Splits a comma-separated line holding both a degree and an institution.
+    The institution runs from the segment naming it to the end of the line,
+    or up to a degree that follows it, so its own commas are kept.
+    """
+    segments = [s.strip(' -–—|,:') for s in line.split(',')]
+    segments = [s for s in segments if s]
+    start = next((i for i, s in enumerate(segments) if _INSTITUTION_RE.search(s)), 0)
+    if start > 0:
+        return ", ".join(segments[:start]), ", ".join(segments[start:])
+    # "Stanford University, B.S. Computer Science"; "Cambridge, MA" is a state, not a degree
+    end = next(
+        (i for i in range(1, len(segments))
+         if _DEGREE_RE.search(segments[i]) and not re.fullmatch(r'[A-Z]{2}', segments[i])),
+        len(segments)
+    )
+    return ", ".join(segments[end:]), ", ".join(segments[:end])
+
+
+def parse_education_section(section_text: str) -> List[Dict[str, str]]:
+    """Parses an education section into degree/institution/period entries."""
+    education: List[Dict[str, str]] = []
+    current: Optional[Dict[str, str]] = None
+    for raw in section_text.split('\n'):
+        line = _strip_bullet(raw.strip()) if raw.strip() else ""
+        if not line:
+            continue
+        period = find_period(line)
+        remainder = line.replace(period, ' ') if period else line
+        parts = [p.strip(' -–—|,:') for p in _EDUCATION_SEPARATORS.split(remainder.replace('()', ' '))]
+        parts = [p for p in parts if p]
+        degree = next((p for p in parts if _DEGREE_RE.search(p)), "")
+        institution = next((p for p in parts if _INSTITUTION_RE.search(p) and p != degree), "")
+        if not institution and degree and _INSTITUTION_RE.search(degree):
+            # "B.Tech CSE from ABC College" on one line
+            split = re.split(r'\s+(?:from|at)\s+', degree, maxsplit=1, flags=re.IGNORECASE)
+            if len(split) == 2:
+                degree, institution = split[0].strip(), split[1].strip()
+            else:
+                degree, institution = _split_degree_institution(degree)
+
+        starts_new = current is None or (degree and current["degree"]) or (
+            institution and current["institution"] and not degree
+        )
+        if starts_new:
+            if not (degree or institution):
+                continue  # Grades, coursework and the like before any entry
+            current = {"degree": "", "institution": "", "period": ""}
+            education.append(current)
+        if degree and not current["degree"]:
+            current["degree"] = degree
+        if institution and not current["institution"]:
+            current["institution"] = institution
+        if period and not current["period"]:
+            current["period"] = period
+    return education
+
+
+def parse_projects_section(section_text: str) -> List[Dict[str, str]]:
+    """Parses a projects section into name/details/link entries."""
+    projects = []
+    for entry in _group_entries(section_text):
+        heading = " ".join(entry["heading"])
+        link = find_website(heading) or find_website(" ".join(entry["details"]))
+        name = heading.replace(link, ' ') if link else heading
+        period = find_period(name)
+        if period:
+            name = name.replace(period, ' ')
+        name = re.split(r'\s+[|–—-]\s+|:\s', name.strip(), maxsplit=1)[0].strip(' -–—|,:()')
+        if not name and entry["details"]:
+            # Bullet-only project list: first bullet names the project
+            name, *rest = re.split(r'\s+[–—-]\s+|:\s', entry["details"][0], maxsplit=1)
+            entry["details"] = rest + entry["details"][1:]
+        if not name:
+            continue
+        projects.append({"name": name, "details": "\n".join(entry["details"]), "link": link})
+    return projects
+
+
+def parse_certifications_section(section_text: str) -> List[Dict[str, str]]:
+    """Parses one certification per line into name/issuer/link entries."""
+    certifications = []
+    for raw in section_text.split('\n'):
+        line = _strip_bullet(raw.strip()) if raw.strip() else ""
+        if not line:
+            continue
+        link = find_website(line)
+        if link:
+            line = line.replace(link, ' ').strip()
+        period = find_period(line)
+        if period:
+            line = line.replace(period, ' ').strip()
+        parts = [p.strip(' -–—|,:()') for p in re.split(r'\s+[|–—-]\s+|\s*,\s*|\s+by\s+', line, maxsplit=1)]
+        parts = [p for p in parts if p]
+        if not parts:
+            continue
+        certifications.append({"name": parts[0], "issuer": parts[1] if len(parts) > 1 else "", "link": link})
+    return certifications
+
+
+def parse_skills_section(section_text: str) -> List[str]:
+    """Splits a skills section into individual skills, dropping category labels."""
+    skills: List[str] = []
+    seen = set()
+    for raw in section_text.split('\n'):
+        line = _strip_bullet(raw.strip()) if raw.strip() else ""
+        # "Languages: Python, Go" -> "Python, Go"
+        line = re.sub(r'^[A-Za-z &/]{2,30}:\s*', '', line)
+        for skill in re.split(r'\s*[,|;•·]\s*|\s{2,}', line):
+            skill = skill.strip(' .-')
+            if skill and len(skill) < 50 and skill.lower() not in seen:
+                seen.add(skill.lower())
+                skills.append(skill)
+    return skills
+
+
+def parse_header(header_text: str) -> Dict[str, str]:
+    """Extracts contact details from the lines above the first section."""
+    lines = [line.strip() for line in header_text.split('\n') if line.strip()]
+    email = find_email(header_text)
+    phone = find_phone(header_text)
+    website = find_website(header_text)
+
+    # Name and title are the first lines that aren't contact details
+    plain = []
+    for line in lines:
+        if _LABEL_RE.match(line):
+            continue
+        if (email and email in line) or (phone and phone in line) or (website and website in line):
+            # Contact lines such as "Jane Doe | jane@x.com" still start with the name
+            first = re.split(r'\s*[|,•]\s*', line)[0].strip()
+            if first and first not in (email, phone, website) and not find_email(first) and not find_phone(first):
+                plain.append(first)
+            continue
+        plain.append(line)
+
+    location = ""
+    label = re.search(r'^\s*(?:location|address)\s*[:\-]\s*(.+)$', header_text, re.IGNORECASE | re.MULTILINE)
+    if label:
+        location = label.group(1).strip()
+    else:
+        for line in lines:
+            match = _LOCATION_RE.search(line)
+            if match and not find_email(match.group(1)) and len(match.group(1).split()) <= 3:
+                location = match.group(1).strip()
+                break
+
+    # A bare "City, Country" line is the location, not the title
+    plain = [line for line in plain if not (location and line in location)]
+    name = plain[0] if plain else ""
+    title = plain[1] if len(plain) > 1 and plain[1] != location else ""
+    return {
+        "name": name,
+        "title": title,
+        "email": email,
+        "phone": phone,
+        "location": location,
+        "website": website,
     }
-    
-    # If the basic parsing is good enough, return the result
-    if result['name'] and result['email']:
-        return result
-        
-    return None # Fallback to AI if basic parsing fails to get key info
+
+
+def _entry_confidence(entries: List[Dict[str, str]], weights: Dict[str, float]) -> float:
+    if not entries:
+        return 0.0
+    scores = [sum(w for field, w in weights.items() if entry.get(field)) for entry in entries]
+    return round(sum(scores) / len(scores), 2)
+
+
+def score_confidence(result: Dict, sections: Dict[str, str]) -> Dict[str, float]:
+    """
+    Per-field confidence (0.0-1.0) that the rule-based value is right and
+    complete. A section that is missing from a resume with clear structure is
+    taken as genuinely absent rather than missed.
+    """
+    structured = len(sections) >= 3
+    absent = 0.7 if structured else 0.0
+    name_words = result["name"].split()
+
+    confidence = {
+        "name": 0.9 if 1 < len(name_words) <= 4 and all(w[0].isupper() for w in name_words if w[0].isalpha())
+        else (0.4 if result["name"] else 0.0),
+        "title": (0.7 if len(result["title"].split()) <= 8 else 0.3) if result["title"] else absent,
+        "email": 1.0 if result["email"] else absent,
+        "phone": 0.9 if result["phone"] else absent,
+        "location": 0.7 if result["location"] else absent,
+        "website": 0.9 if result["website"] else 0.7,
+        "summary": 0.9 if len(result["summary"]) > 20 else absent,
+        "skills": (0.9 if len(result["skills"]) >= 3 else 0.5) if 'skills' in sections else 0.0,
+    }
+    education = result["education"] if 'education' in sections else []
+    for field, weights in (
+        ("experience", {"role": 0.35, "company": 0.25, "period": 0.25, "details": 0.15}),
+        ("education", {"degree": 0.4, "institution": 0.4, "period": 0.2}),
+        ("projects", {"name": 0.6, "details": 0.4}),
+        ("certifications", {"name": 0.7, "issuer": 0.3}),
+    ):
+        if field in sections:
+            confidence[field] = _entry_confidence(result[field], weights)
+        else:
+            confidence[field] = absent
+    if any(not entry["institution"] and ',' in entry["degree"] for entry in education):
+        # "MSc CS, Politecnico di Milano": where the degree ends is a guess
+        confidence["education"] = min(confidence["education"], 0.5)
+    return confidence
+
+
+def parse_sections(text: str) -> Dict:
+    """
+    Full rule-based parse into the validate_parsed_resume schema plus a
+    "confidence" dict with a per-field score. Never calls the LLM.
+    """
+    header_text, sections = split_sections(text)
+    result = parse_header(header_text)
+    result.update({
+        "summary": re.sub(r'\s+', ' ', sections.get('summary', "")).strip(),
+        "skills": parse_skills_section(sections.get('skills', "")),
+        "experience": parse_experience_section(sections.get('experience', "")),
+        "education": parse_education_section(sections.get('education', "")),
+        "projects": parse_projects_section(sections.get('projects', "")),
+        "certifications": parse_certifications_section(sections.get('certifications', ""))
+    })
+    result["confidence"] = score_confidence(result, sections)
+    return result
+
+
+def is_confident(result: Dict, threshold: float = TIER1_CONFIDENCE_THRESHOLD) -> bool:
+    """True if every field of a parse_sections result meets the threshold."""
+    return all(score >= threshold for score in result["confidence"].values())
+
+
+def parse_tier1(text: str) -> Optional[Dict]:
+    """
+    Attempts to parse a resume using fast, rule-based methods.
+    Returns a dictionary (including per-field "confidence") if every field
+    was parsed confidently, otherwise returns None.
+    """
+    result = parse_sections(text)
+    if not (result['name'] and result['email']):
+        return None # Fallback to AI if basic parsing fails to get key info
+    if not is_confident(result):
+        return None
+
+    print("Tier 1 Parser: Structured resume detected. Parsed all sections locally.")
+    return result
@@ -0,0 +1,232 @@
+# app/utils/quality_model.py
+"""
+Local resume quality scorer: a linear model over cheap text features that
+stands in for the 0-30 LLM quality score in get_ai_quality_score.
+
+Calibrate it against logged LLM scores with
+
+    python -m app.utils.quality_model --log quality_scores.jsonl --output quality_model.json
+"""
+
+import argparse
+import asyncio
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config import settings
+from .corpus_stats import term_counts
+from .parser import split_sections
+
+QUALITY_SCORING_MODES = ("llm", "batch", "local")
+
+STRONG_VERBS = {
+    'achieved', 'architected', 'automated', 'built', 'created', 'delivered',
+    'deployed', 'designed', 'developed', 'drove', 'enabled', 'engineered',
+    'enhanced', 'established', 'executed', 'generated', 'implemented',
+    'improved', 'increased', 'launched', 'led', 'managed', 'optimized',
+    'orchestrated', 'pioneered', 'reduced', 'resolved', 'scaled',
+    'spearheaded', 'streamlined', 'transformed', 'accelerated', 'collaborated',
+    'coordinated', 'directed', 'facilitated', 'mentored', 'supervised'
+}
+
+METRIC_PATTERN = r'\d+[%$KMB+]|\d+\+|\d+x|\d+ [a-z]+'
+
+_METRIC_RE = re.compile(METRIC_PATTERN)
+_BULLET_RE = re.compile(r'^\s*(?:[-•*▪●◦‣■►✓]|\d+[.)])\s+')
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+_PHONE_RE = re.compile(r'\+?\d[\d\s().-]{8,}\d')
+
+_SCORED_SECTIONS = ("summary", "experience", "education", "skills", "projects")
+
+# Feature order of QualityModel weights; every feature is in [0, 1]
+QUALITY_FEATURES = (
+    "keyword_coverage",      # share of JD keywords found in the resume
+    "strong_verb_ratio",     # bullets opening with a strong action verb
+    "metric_density",        # bullets with a quantified result
+    "bullet_length",         # bullets of 8-30 words
+    "section_completeness",  # share of the core sections present
+    "contact_info",          # email and phone present
+    "length",                # word count, saturating at 600
+)
+
+# Uncalibrated weights: roughly the LLM prompt's relevance / achievements /
+# presentation split of the 30 points
+DEFAULT_WEIGHTS = (10.0, 4.0, 6.0, 2.0, 4.5, 1.5, 2.0)
+DEFAULT_BIAS = 0.0
+
+
+def _bullet_lines(text: str) -> List[str]:
+    """Bulleted lines with the marker removed; every non-trivial line if none are bulleted."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    bullets = [_BULLET_RE.sub('', line) for line in lines if _BULLET_RE.match(line)]
+    return bullets or [line for line in lines if len(line.split()) >= 5]
+
+
+def extract_quality_features(resume_text: str, jd_keywords: Optional[Iterable[str]] = None) -> List[float]:
+    """QUALITY_FEATURES for one resume; keyword_coverage is 0.5 without JD keywords."""
+    jd_keywords = set(jd_keywords or ())
+    if jd_keywords:
+        terms = term_counts(resume_text)
+        coverage = sum(1 for kw in jd_keywords if kw in terms) / len(jd_keywords)
+    else:
+        coverage = 0.5
+
+    bullets = _bullet_lines(resume_text)
+    n = len(bullets) or 1
+    verbs = sum(1 for b in bullets if b.split() and b.split()[0].lower() in STRONG_VERBS) / n
+    metrics = sum(1 for b in bullets if _METRIC_RE.search(b)) / n
+    lengths = sum(1 for b in bullets if 8 <= len(b.split()) <= 30) / n
+
+    _, sections = split_sections(resume_text)
+    completeness = sum(1 for name in _SCORED_SECTIONS if sections.get(name)) / len(_SCORED_SECTIONS)
+    contact = (bool(_EMAIL_RE.search(resume_text)) + bool(_PHONE_RE.search(resume_text))) / 2
+    length = min(len(resume_text.split()) / 600, 1.0)
+    return [coverage, verbs, metrics, lengths, completeness, contact, length]
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Gaussian elimination with partial pivoting for the small normal equations."""
+    n = len(vector)
+    rows = [row[:] + [value] for row, value in zip(matrix, vector)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if abs(rows[col][col]) < 1e-12:
+            continue
+        for r in range(n):
+            if r != col:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[i][n] / rows[i][i] if abs(rows[i][i]) >= 1e-12 else 0.0 for i in range(n)]
+
+
+class QualityModel:
+    """
+    Linear regression from QUALITY_FEATURES to the 0-30 quality score.
+    Prediction is a dot product, so it costs microseconds once features exist.
+    """
+
+    def __init__(self, weights: Sequence[float] = DEFAULT_WEIGHTS, bias: float = DEFAULT_BIAS, samples: int = 0):
+        if len(weights) != len(QUALITY_FEATURES):
+            raise ValueError(f"Expected {len(QUALITY_FEATURES)} weights, got {len(weights)}")
+        self.weights = list(weights)
+        self.bias = bias
+        self.samples = samples  # LLM scores the model was calibrated on; 0 means defaults
+
+    def predict(self, features: Sequence[float]) -> float:
+        score = self.bias + sum(w * x for w, x in zip(self.weights, features))
+        return round(min(30.0, max(0.0, score)), 1)
+
+    def score(self, resume_text: str, jd_keywords: Optional[Iterable[str]] = None) -> float:
+        return self.predict(extract_quality_features(resume_text, jd_keywords))
+
+    @classmethod
+    def fit(cls, samples: Iterable[Tuple[Sequence[float], float]], l2: float = 1.0) -> "QualityModel":
+        """
+        Ridge regression on (features, llm_score) pairs, shrunk towards the
+        default weights so a small log can't produce a wild model.
+        """
+        samples = list(samples)
+        if not samples:
+            raise ValueError("No samples to calibrate on")
+        prior = [DEFAULT_BIAS] + list(DEFAULT_WEIGHTS)
+        size = len(prior)
+        gram = [[0.0] * size for _ in range(size)]
+        target = [0.0] * size
+        for features, score in samples:
+            x = [1.0] + list(features)
+            for i in range(size):
+                target[i] += x[i] * score
+                for j in range(size):
+                    gram[i][j] += x[i] * x[j]
+        for i in range(1, size):  # the bias is not regularized
+            gram[i][i] += l2
+            target[i] += l2 * prior[i]
+        solution = _solve(gram, target)
+        return cls(solution[1:], solution[0], samples=len(samples))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "features": list(QUALITY_FEATURES),
+            "weights": self.weights,
+            "bias": self.bias,
+            "samples": self.samples,
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "QualityModel":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("features") != list(QUALITY_FEATURES):
+            raise ValueError(f"{path} was fitted on features {data.get('features')}")
+        return cls(data["weights"], data["bias"], data.get("samples", 0))
+
+
+def _append_score_log(path: str, lines: List[str]) -> None:
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+    except OSError as e:
+        print(f"Quality score log write failed: {str(e)}")
+
+
+async def log_llm_scores(samples: Iterable[Tuple[Sequence[float], float]]) -> None:
+    """
+    Appends LLM quality scores and their features to QUALITY_SCORE_LOG_PATH,
+    if set. The file is written in one go on a worker thread, off the event loop.
+    """
+    path = getattr(settings, "QUALITY_SCORE_LOG_PATH", None)
+    if not path:
+        return
+    lines = [
+        json.dumps({"features": [round(x, 4) for x in features], "score": score}) + "\n"
+        for features, score in samples
+    ]
+    if lines:
+        await asyncio.to_thread(_append_score_log, path, lines)
+
+
+def read_score_log(path: str) -> List[Tuple[List[float], float]]:
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                samples.append((record["features"], float(record["score"])))
+    return samples
+
+
+_quality_model: Optional[QualityModel] = None
+
+
+def get_quality_model() -> QualityModel:
+    """Returns the calibrated model at QUALITY_MODEL_PATH, or the default weights."""
+    global _quality_model
+    if _quality_model is None:
+        path = getattr(settings, "QUALITY_MODEL_PATH", None)
+        _quality_model = QualityModel.load(path) if path else QualityModel()
+    return _quality_model
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="Calibrate the local quality scorer on logged LLM scores")
+    cli.add_argument("--log", required=True, help="JSONL written via QUALITY_SCORE_LOG_PATH")
+    cli.add_argument("--output", required=True, help="Where to write the model (QUALITY_MODEL_PATH)")
+    cli.add_argument("--l2", type=float, default=1.0)
+    args = cli.parse_args()
+
+    samples = read_score_log(args.log)
+    model = QualityModel.fit(samples, l2=args.l2)
+    errors = [abs(model.predict(features) - score) for features, score in samples]
+    baseline = [abs(QualityModel().predict(features) - score) for features, score in samples]
+    model.save(args.output)
+    print(json.dumps({
+        **model.to_dict(),
+        "mean_abs_error": round(sum(errors) / len(errors), 2),
+        "default_mean_abs_error": round(sum(baseline) / len(baseline), 2),
+    }, indent=2))
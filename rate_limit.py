@@ -0,0 +1,251 @@
+# app/utils/rate_limit.py
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from ..config import settings
+
+# Statuses worth retrying: rate limiting and transient upstream failures.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _SlotOutcome:
+    """What happened to the request made while holding a limiter slot."""
+
+    def __init__(self):
+        self.status_code: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def record(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+        self.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+class AdaptiveRateLimiter:
+    """
+    Process-wide limiter for outgoing LLM requests.
+
+    - An AIMD concurrency limit grows by ~1 per window of successful requests
+      and is cut by `decrease_factor` when the provider throttles us, so it
+      settles near the provider's actual capacity.
+    - An optional token bucket also caps the request rate (`rate` per second,
+      `burst` deep), for a known quota; with `rate=None` only AIMD applies.
+    - A Retry-After from the provider pauses every caller, not just the one
+      that received it, unless it is too long to wait for.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 10,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        decrease_factor: float = 0.5,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_retry_after: float = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+        self.limit = float(initial_concurrency)
+        self.in_flight = 0
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.counters = {
+            "requests": 0,
+            "successes": 0,
+            "throttled": 0,
+            "server_errors": 0,
+            "transport_errors": 0,
+            "retries": 0,
+            "gave_up": 0,
+        }
+
+    # --- Concurrency gate ---
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def _acquire_slot(self) -> None:
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as we were cancelled; hand it on
+                self.in_flight -= 1
+                self._wake_waiters()
+            raise
+
+    def _release_slot(self, outcome: _SlotOutcome) -> None:
+        self.in_flight -= 1
+        status = outcome.status_code
+        if status is not None and status < 400:
+            self.counters["successes"] += 1
+            # Additive increase: about +1 per `limit` successful requests
+            self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+        elif status == 429:
+            self.counters["throttled"] += 1
+            now = time.monotonic()
+            # Multiplicative decrease, at most once per second so a burst of
+            # 429s from requests already in flight counts as one signal
+            if now - self._last_decrease >= 1.0:
+                self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+                self._last_decrease = now
+            # A longer wait abandons the request (see should_retry), so it
+            # shouldn't hold everyone else up either
+            if outcome.retry_after and outcome.retry_after <= self.max_retry_after:
+                self._blocked_until = max(self._blocked_until, now + outcome.retry_after)
+        elif status is not None and status >= 500:
+            self.counters["server_errors"] += 1
+        self._wake_waiters()
+
+    # --- Token bucket ---
+
+    async def _acquire_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            if self._blocked_until > now:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            if self.rate is None:
+                return
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_SlotOutcome]:
+        """Holds one concurrency slot (and a rate token, if rate-capped) for a single request."""
+        await self._acquire_slot()
+        outcome = _SlotOutcome()
+        try:
+            await self._acquire_token()
+            self.counters["requests"] += 1
+            yield outcome
+        finally:
+            self._release_slot(outcome)
+
+    # --- Retries ---
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry `attempt` (1-based)."""
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.base_delay)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def send(self, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Sends a request through the limiter, retrying throttled and transient
+        failures. Returns the last response; raises the last transport error
+        once retries are exhausted. Timeouts are not retried.
+        """
+        attempt = 0
+        while True:
+            response = None
+            async with self.slot() as outcome:
+                try:
+                    response = await request()
+                except httpx.TimeoutException:
+                    raise
+                except httpx.TransportError:
+                    self.counters["transport_errors"] += 1
+                    if attempt >= self.max_retries:
+                        self.counters["gave_up"] += 1
+                        raise
+                else:
+                    outcome.record(response)
+
+            if response is not None and not self.should_retry(attempt, outcome):
+                return response
+
+            attempt += 1
+            self.counters["retries"] += 1
+            await asyncio.sleep(self.backoff_delay(attempt, outcome.retry_after))
+
+    def should_retry(self, attempt: int, outcome: _SlotOutcome) -> bool:
+        """Whether a response recorded in `outcome` should be retried after `attempt` retries."""
+        if outcome.status_code not in RETRYABLE_STATUS_CODES:
+            return False
+        retry_after = outcome.retry_after
+        if attempt >= self.max_retries or (retry_after is not None and retry_after > self.max_retry_after):
+            # Out of retries, or the provider wants us gone for longer
+            # than is worth waiting (e.g. a daily quota)
+            self.counters["gave_up"] += 1
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "rate_per_sec": self.rate,
+            "paused_for": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+        }
+
+
+_rate_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Returns the process-wide OpenRouter limiter, built from settings on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = AdaptiveRateLimiter(
+            rate=getattr(settings, "OPENROUTER_RATE_LIMIT", None),
+            burst=getattr(settings, "OPENROUTER_RATE_BURST", 10),
+            initial_concurrency=getattr(settings, "OPENROUTER_INITIAL_CONCURRENCY", 4),
+            min_concurrency=getattr(settings, "OPENROUTER_MIN_CONCURRENCY", 1),
+            max_concurrency=getattr(settings, "OPENROUTER_MAX_CONCURRENCY", 32),
+            max_retries=getattr(settings, "OPENROUTER_MAX_RETRIES", 4),
+        )
+    return _rate_limiter
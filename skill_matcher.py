@@ -0,0 +1,269 @@
+# app/utils/skill_matcher.py
+
+import json
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from ..config import settings
+
+# Canonical skill -> aliases, ported from skillDatabase in utils/jd-matcher.js.
+# That map also lists related technologies as "variations" (django under
+# python, aws under dynamodb, ...); build_taxonomy() drops those so a mention
+# of one skill never counts as another. Aliases that are ordinary English
+# words there ("less", "shell", "api", "container", ...) are left out here.
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    # Programming Languages
+    'javascript': ['js', 'javascript', 'ecmascript', 'es6', 'es2015', 'node', 'nodejs'],
+    'python': ['python', 'py', 'python3', 'django', 'flask', 'fastapi'],
+    'java': ['java', 'jdk', 'jvm', 'spring', 'springboot', 'hibernate'],
+    'typescript': ['typescript', 'ts'],
+    'c++': ['c++', 'cpp', 'cplusplus'],
+    'c#': ['c#', 'csharp', '.net', 'dotnet', 'asp.net'],
+    'php': ['php', 'laravel', 'symfony', 'wordpress'],
+    'ruby': ['ruby', 'rails', 'ruby on rails'],
+    'go': ['go', 'golang'],
+    'rust': ['rust'],
+    'swift': ['swift'],
+    'kotlin': ['kotlin'],
+    'scala': ['scala'],
+    'r': ['r', 'r programming'],
+
+    # Frontend
+    'react': ['react', 'reactjs', 'react.js', 'react native'],
+    'angular': ['angular', 'angularjs', 'angular2'],
+    'vue': ['vue', 'vuejs', 'vue.js', 'nuxt'],
+    'html': ['html', 'html5'],
+    'css': ['css', 'css3', 'scss', 'sass'],
+    'jquery': ['jquery'],
+    'bootstrap': ['bootstrap'],
+    'tailwind': ['tailwind', 'tailwindcss'],
+
+    # Backend
+    'node': ['node', 'nodejs', 'node.js', 'express.js', 'expressjs'],
+    'django': ['django', 'python'],
+    'flask': ['flask', 'python'],
+    'spring': ['spring', 'springboot', 'spring boot', 'java'],
+    'asp.net': ['asp.net', '.net', 'dotnet', 'c#'],
+
+    # Databases
+    'sql': ['sql', 'mysql', 'postgresql', 'postgres', 'mssql', 'oracle db', 'oracle database', 'sqlite'],
+    'mongodb': ['mongodb', 'mongo', 'nosql'],
+    'redis': ['redis'],
+    'elasticsearch': ['elasticsearch', 'elastic stack'],
+    'cassandra': ['cassandra'],
+    'dynamodb': ['dynamodb', 'aws'],
+
+    # Cloud & DevOps
+    'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda', 'cloudformation'],
+    'azure': ['azure', 'microsoft azure'],
+    'gcp': ['gcp', 'google cloud', 'google cloud platform'],
+    'docker': ['docker', 'containerization'],
+    'kubernetes': ['kubernetes', 'k8s', 'container orchestration'],
+    'jenkins': ['jenkins', 'ci/cd'],
+    'terraform': ['terraform', 'infrastructure as code', 'iac'],
+    'ansible': ['ansible'],
+    'git': ['git', 'github', 'gitlab', 'bitbucket', 'version control'],
+
+    # Data Science & ML
+    'machine learning': ['machine learning', 'ml', 'artificial intelligence'],
+    'deep learning': ['deep learning', 'neural network', 'cnn', 'rnn'],
+    'tensorflow': ['tensorflow', 'tf'],
+    'pytorch': ['pytorch'],
+    'pandas': ['pandas', 'python'],
+    'numpy': ['numpy', 'python'],
+    'scikit-learn': ['scikit-learn', 'sklearn', 'python'],
+
+    # Testing
+    'jest': ['jest', 'testing'],
+    'mocha': ['mocha', 'testing'],
+    'junit': ['junit', 'testing', 'java'],
+    'selenium': ['selenium', 'automation testing'],
+    'cypress': ['cypress', 'e2e testing'],
+
+    # Other
+    'agile': ['agile', 'scrum', 'kanban'],
+    'rest': ['rest', 'restful', 'rest api', 'rest apis'],
+    'graphql': ['graphql', 'gql'],
+    'microservices': ['microservices', 'microservice architecture'],
+    'linux': ['linux', 'unix'],
+    'bash': ['bash', 'shell scripting']
+}
+
+# Aliases that are also everyday words only count when written exactly as
+# the technology is ("Go", not "go") and not as the first word of a
+# sentence or bullet, unless a list separator follows ("Go, Python").
+CASED_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'go': ('Go',),
+    'r': ('R',),
+    'swift': ('Swift',),
+    'rust': ('Rust',),
+    'rest': ('REST',),
+    'spring': ('Spring',),
+    'rails': ('Rails',),
+}
+
+_SENTENCE_ENDS = '\n.!?•*-–'
+_LIST_SEPARATORS = ',/|;('
+
+
+def build_taxonomy(raw: Dict[str, Iterable[str]]) -> Dict[str, Set[str]]:
+    """
+    Normalizes a skill -> aliases map: lowercases everything, always
+    includes the skill itself, and drops aliases that are another skill's
+    name or that several skills share, since those can't identify one skill.
+    """
+    canonical = {skill.lower().strip() for skill in raw}
+    owners: Dict[str, Set[str]] = {}
+    for skill, aliases in raw.items():
+        skill = skill.lower().strip()
+        for alias in aliases:
+            alias = alias.lower().strip()
+            if alias and (alias == skill or alias not in canonical):
+                owners.setdefault(alias, set()).add(skill)
+
+    taxonomy: Dict[str, Set[str]] = {skill: {skill} for skill in canonical}
+    for alias, skills in owners.items():
+        if len(skills) == 1:
+            taxonomy[next(iter(skills))].add(alias)
+    return taxonomy
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == '_'
+
+
+def _cased_match(text: str, start: int, end: int, spellings: Tuple[str, ...]) -> bool:
+    """True if text[start:end] is spelled as a technology name and placed like one."""
+    if text[start:end] not in spellings:
+        return False
+    before = text[max(0, start - 40):start].rstrip(' \t')
+    after = text[end:end + 40].lstrip(' \t')
+    if (before and before[-1] in "&'’") or (after and after[0] in "&'’"):
+        return False  # "R&D", "Go's"
+    if after[:4].isdigit():
+        return False  # "Spring 2021" the semester
+    sentence_start = not before or before[-1] in _SENTENCE_ENDS
+    return not sentence_start or (bool(after) and after[0] in _LIST_SEPARATORS)
+
+
+class SkillHit(NamedTuple):
+    skill: str
+    alias: str
+    start: int
+    end: int
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every alias of a skill taxonomy.
+
+    One linear pass over the lowercased text finds all alias occurrences.
+    A hit must sit on word boundaries wherever the alias itself starts or
+    ends with a word character (so "java" doesn't match inside "javascript",
+    but ".net" still matches in "asp.net"). Overlapping hits are resolved
+    leftmost-longest, so "google cloud platform" counts once. Aliases in
+    `cased` (alias -> accepted spellings) must also pass _cased_match.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]], cased: Optional[Dict[str, Tuple[str, ...]]] = None):
+        self._cased = dict(cased or {})
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]  # (alias, skill) ending at this state
+        self.alias_count = 0
+        for skill, aliases in taxonomy.items():
+            for alias in aliases:
+                self._add(alias, skill)
+        self._build_failure_links()
+
+    def _add(self, alias: str, skill: str) -> None:
+        state = 0
+        for c in alias:
+            next_state = self._goto[state].get(c)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][c] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((alias, skill))
+        self.alias_count += 1
+
+    def _build_failure_links(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:  # BFS; the list grows while iterating
+            for c, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(c, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str, overlapping: bool = False) -> List[SkillHit]:
+        """
+        Every non-overlapping skill hit in `text`, in order of position, or
+        with `overlapping` every hit including those nested in longer ones.
+        """
+        original = text
+        text = text.lower()
+        if len(text) != len(original):
+            original = text  # Offsets no longer line up; cased aliases can't match
+        goto, fail, output = self._goto, self._fail, self._output
+        candidates: List[SkillHit] = []
+        state = 0
+        for i, c in enumerate(text):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for alias, skill in output[state]:
+                start = i - len(alias) + 1
+                if _is_word_char(alias[0]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(alias[-1]) and i + 1 < len(text) and _is_word_char(text[i + 1]):
+                    continue
+                if alias in self._cased and not _cased_match(original, start, i + 1, self._cased[alias]):
+                    continue
+                candidates.append(SkillHit(skill, alias, start, i + 1))
+
+        candidates.sort(key=lambda hit: (hit.start, -(hit.end - hit.start)))
+        if overlapping:
+            return candidates
+        # Leftmost-longest: keep the longest hit at each start, drop hits inside an accepted one
+        hits: List[SkillHit] = []
+        covered = 0
+        for hit in candidates:
+            if hit.start >= covered:
+                hits.append(hit)
+                covered = hit.end
+        return hits
+
+    def count(self, text: str) -> Counter:
+        """Occurrences per canonical skill."""
+        return Counter(hit.skill for hit in self.find(text))
+
+    def skills(self, text: str) -> Set[str]:
+        """Canonical skills mentioned in `text`."""
+        return {hit.skill for hit in self.find(text)}
+
+
+_skill_matcher: Optional[SkillMatcher] = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Returns the process-wide matcher over SKILL_TAXONOMY, extended with the
+    JSON skill -> aliases map at SKILL_TAXONOMY_PATH if configured, with
+    CASED_ALIASES applied.
+    """
+    global _skill_matcher
+    if _skill_matcher is None:
+        raw: Dict[str, List[str]] = {skill: list(aliases) for skill, aliases in SKILL_TAXONOMY.items()}
+        path = getattr(settings, "SKILL_TAXONOMY_PATH", None)
+        if path:
+            with open(path, encoding="utf-8") as f:
+                for skill, aliases in json.load(f).items():
+                    raw.setdefault(skill, []).extend(aliases)
+        _skill_matcher = SkillMatcher(build_taxonomy(raw), CASED_ALIASES)
+    return _skill_matcher
@@ -0,0 +1,228 @@
+# app/utils/telemetry.py
+
+import asyncio
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..config import settings
+from .bullet_metrics import get_bullet_metrics
+from .circuit_breaker import get_breaker_states
+from .hedging import LatencyTracker, get_hedge_policy, get_latency_tracker
+from .llm_cache import get_response_cache
+from .parse_metrics import get_parse_metrics
+from .rate_limit import get_rate_limiter
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+UNTAGGED = "untagged"
+
+
+def error_class(exc: BaseException) -> str:
+    """Coarse, low-cardinality class of a failed LLM call for metrics labels."""
+    if isinstance(exc, asyncio.CancelledError):
+        return "cancelled"
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status == 429:
+            return "rate_limited"
+        return "server_error" if status >= 500 else "client_error"
+    if isinstance(exc, httpx.TransportError):
+        return "transport"
+    if isinstance(exc, (KeyError, IndexError, ValueError)):
+        return "bad_response"
+    return "other"
+
+
+class _Series:
+    """Counters and a latency histogram for one (task, model) pair."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.calls = 0
+        self.fallback_calls = 0
+        self.errors: Dict[str, int] = {}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.latency_sum += seconds
+
+
+class LLMTelemetry:
+    """
+    Per-task instrumentation of OpenRouter calls: latency histograms,
+    token usage and cost, fallback usage and error classes.
+
+    Every attempt against a model is one call, so a request that fell back
+    shows up once under the primary (with its error) and once under the
+    fallback model.
+    """
+
+    def __init__(self, pricing: Optional[Dict[str, Dict[str, float]]] = None):
+        # model -> {"prompt": USD per 1M tokens, "completion": USD per 1M tokens}
+        self.pricing = pricing or {}
+        self.latencies = LatencyTracker(window=500)
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self.cache_hits: Dict[str, int] = {}
+
+    def _get_series(self, task: Optional[str], model: str) -> _Series:
+        key = (task or UNTAGGED, model)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        return series
+
+    def record_call(
+        self,
+        task: Optional[str],
+        model: str,
+        seconds: float,
+        fallback: bool = False,
+        usage: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        series = self._get_series(task, model)
+        series.calls += 1
+        series.observe(seconds)
+        if fallback:
+            series.fallback_calls += 1
+        if error:
+            series.errors[error] = series.errors.get(error, 0) + 1
+        else:
+            self.latencies.record(task or UNTAGGED, seconds)
+        if usage:
+            prompt_tokens = int(usage.get("prompt_tokens") or 0)
+            completion_tokens = int(usage.get("completion_tokens") or 0)
+            series.prompt_tokens += prompt_tokens
+            series.completion_tokens += completion_tokens
+            if usage.get("cost") is not None:
+                # OpenRouter reports the charged cost when usage accounting is on
+                series.cost += float(usage["cost"])
+            elif model in self.pricing:
+                price = self.pricing[model]
+                series.cost += (prompt_tokens * price.get("prompt", 0.0)
+                                + completion_tokens * price.get("completion", 0.0)) / 1_000_000
+
+    def record_cache_hit(self, task: Optional[str]) -> None:
+        task = task or UNTAGGED
+        self.cache_hits[task] = self.cache_hits.get(task, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly per-task rollup plus the raw (task, model) series."""
+        tasks: Dict[str, Dict[str, Any]] = {}
+        series_list: List[Dict[str, Any]] = []
+        for (task, model), series in sorted(self._series.items()):
+            rollup = tasks.setdefault(task, {
+                "calls": 0, "fallback_calls": 0, "errors": {}, "prompt_tokens": 0,
+                "completion_tokens": 0, "cost_usd": 0.0, "models": [],
+            })
+            rollup["calls"] += series.calls
+            rollup["fallback_calls"] += series.fallback_calls
+            rollup["prompt_tokens"] += series.prompt_tokens
+            rollup["completion_tokens"] += series.completion_tokens
+            rollup["cost_usd"] = round(rollup["cost_usd"] + series.cost, 6)
+            rollup["models"].append(model)
+            for cls, count in series.errors.items():
+                rollup["errors"][cls] = rollup["errors"].get(cls, 0) + count
+            series_list.append({
+                "task": task,
+                "model": model,
+                "calls": series.calls,
+                "fallback_calls": series.fallback_calls,
+                "errors": dict(series.errors),
+                "prompt_tokens": series.prompt_tokens,
+                "completion_tokens": series.completion_tokens,
+                "cost_usd": round(series.cost, 6),
+                "latency_sum": round(series.latency_sum, 3),
+                "latency_buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], series.buckets)),
+            })
+
+        latency = self.latencies.stats()
+        for task, rollup in tasks.items():
+            rollup["cache_hits"] = self.cache_hits.get(task, 0)
+            rollup["latency"] = latency.get(task, {})
+            if task in latency:
+                rollup["latency"]["p99"] = round(self.latencies.percentile(task, 99), 3)
+        return {"tasks": tasks, "series": series_list}
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = [
+            "# HELP llm_request_duration_seconds Latency of OpenRouter calls.",
+            "# TYPE llm_request_duration_seconds histogram",
+        ]
+        for (task, model), series in sorted(self._series.items()):
+            labels = f'task="{task}",model="{_escape(model)}"'
+            cumulative = 0
+            for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], series.buckets):
+                cumulative += count
+                lines.append(f'llm_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"llm_request_duration_seconds_sum{{{labels}}} {series.latency_sum:.6f}")
+            lines.append(f"llm_request_duration_seconds_count{{{labels}}} {series.calls}")
+
+        def counter(name: str, help_text: str, rows: List[Tuple[str, Any]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{{{labels}}} {value}" for labels, value in rows)
+
+        items = sorted(self._series.items())
+        counter("llm_requests_total", "OpenRouter calls by outcome.", [
+            (f'task="{task}",model="{_escape(model)}",outcome="{outcome}"', count)
+            for (task, model), series in items
+            for outcome, count in [("ok", series.calls - sum(series.errors.values())), *sorted(series.errors.items())]
+        ])
+        counter("llm_fallback_requests_total", "Calls served by the fallback model.", [
+            (f'task="{task}",model="{_escape(model)}"', series.fallback_calls) for (task, model), series in items
+        ])
+        counter("llm_tokens_total", "Tokens reported in the usage block.", [
+            (f'task="{task}",model="{_escape(model)}",type="{kind}"', count)
+            for (task, model), series in items
+            for kind, count in (("prompt", series.prompt_tokens), ("completion", series.completion_tokens))
+        ])
+        counter("llm_cost_usd_total", "Reported or estimated spend in USD.", [
+            (f'task="{task}",model="{_escape(model)}"', f"{series.cost:.6f}") for (task, model), series in items
+        ])
+        counter("llm_cache_hits_total", "Responses served from the LLM cache.", [
+            (f'task="{task}"', count) for task, count in sorted(self.cache_hits.items())
+        ])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+_telemetry: Optional[LLMTelemetry] = None
+
+
+def get_telemetry() -> LLMTelemetry:
+    """Returns the process-wide telemetry, with LLM_PRICING from settings on first use."""
+    global _telemetry
+    if _telemetry is None:
+        _telemetry = LLMTelemetry(pricing=getattr(settings, "LLM_PRICING", None))
+    return _telemetry
+
+
+def telemetry_snapshot() -> Dict[str, Any]:
+    """
+    Everything the admin dashboard polls in one document: per-task LLM call
+    metrics plus the state of the cache, rate limiter, hedging, circuit
+    breakers, tiered parser and bullet candidate acceptance.
+    """
+    return {
+        "llm": get_telemetry().snapshot(),
+        "cache": get_response_cache().stats(),
+        "rate_limiter": get_rate_limiter().stats(),
+        "hedging": {**get_hedge_policy().stats(), "latency": get_latency_tracker().stats()},
+        "circuit_breakers": get_breaker_states(),
+        "parsing": get_parse_metrics().stats(),
+        "bullets": get_bullet_metrics().stats(),
+    }
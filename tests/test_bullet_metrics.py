@@ -0,0 +1,20 @@
+import asyncio
+
+from app.utils import ai, bullet_metrics
+from app.utils.ai import OpenRouterError
+from app.utils.bullet_metrics import BulletMetrics
+
+
+def test_failed_serial_call_counts_a_failed_candidate(monkeypatch):
+    metrics = BulletMetrics()
+    monkeypatch.setattr(bullet_metrics, "_bullet_metrics", metrics)
+
+    async def chat_text(messages, temperature=0.5, task=None, cache=None, hedge=None):
+        raise OpenRouterError("down")
+
+    monkeypatch.setattr(ai, "chat_text", chat_text)
+    bullets = asyncio.run(ai.generate_bullet_points_async("Built a billing service", ["python"], candidates=1))
+    assert bullets
+    assert metrics.counters["candidates_issued"] == 1
+    assert metrics.counters["candidates_failed"] == 1
+    assert metrics.counters["candidates_scored"] == 0
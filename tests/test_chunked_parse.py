@@ -0,0 +1,105 @@
+import asyncio
+import json
+from pathlib import Path
+
+from app.utils import ai
+from app.utils.ai import RESUME_SCHEMA, OpenRouterError, _ai_parse_fields
+from app.utils.parser import split_into_chunks
+
+SAMPLES = Path(__file__).parent.parent / "benchmarks" / "samples"
+
+
+def _sample(name: str) -> str:
+    return (SAMPLES / name).read_text(encoding="utf-8")
+
+
+def _fields(chunks):
+    return [f for chunk_fields, _ in chunks for f in chunk_fields]
+
+
+def test_chunks_cover_every_schema_field():
+    for path in sorted(SAMPLES.glob("*.txt")):
+        chunks = split_into_chunks(path.read_text(encoding="utf-8"), max_chars=400)
+        assert set(_fields(chunks)) == set(RESUME_SCHEMA), path.name
+
+
+def test_undetected_sections_go_to_whole_text_chunk():
+    text = _sample("academic_cv.txt")
+    chunks = split_into_chunks(text, max_chars=400)
+    fields, chunk = chunks[-1]
+    assert chunk == text
+    assert fields == ["experience", "projects", "certifications"]
+    # Detected sections each appear in exactly one chunk
+    assert _fields(chunks).count("education") == 1
+
+
+def test_only_requested_fields_are_assigned():
+    text = _sample("classic_bullets.txt")
+    chunks = split_into_chunks(text, max_chars=400, fields=["email", "experience", "projects"])
+    assert sorted(set(_fields(chunks))) == ["email", "experience", "projects"]
+    assert chunks[-1] == (["projects"], text)
+
+
+def test_long_sections_split_between_entries():
+    text = _sample("classic_bullets.txt")
+    experience = [chunk for fields, chunk in split_into_chunks(text, max_chars=300) if fields == ["experience"]]
+    assert len(experience) == 2
+    assert experience[0].startswith("EXPERIENCE\nSenior Backend Engineer")
+    assert experience[1].startswith("EXPERIENCE\nSoftware Engineer")
+
+
+def _fake_llm(monkeypatch, fail):
+    """
+    Stands in for the prompt builder and chat_json: the "prompt" is the list
+    of requested fields and the answer fills each of them, unless
+    `fail(fields)` is true. Returns the list of requested field lists.
+    """
+    calls = []
+
+    async def chat_json(messages, temperature=0.0, task=None):
+        fields = json.loads(messages[-1]["content"])
+        calls.append(fields)
+        if fail(fields):
+            raise OpenRouterError("provider down")
+        return {f: [f"{f} item"] if isinstance(RESUME_SCHEMA[f], list) else f"{f} value" for f in fields}
+
+    monkeypatch.setattr(ai, "chat_json", chat_json)
+    monkeypatch.setattr(
+        ai, "build_resume_parse_prompt",
+        lambda text, fields=None: json.dumps(list(fields) if fields is not None else list(RESUME_SCHEMA))
+    )
+    return calls
+
+
+def test_failed_chunk_is_retried(monkeypatch):
+    failures = {"skills": 1}
+
+    def fail(fields):
+        if fields == ["skills"] and failures["skills"]:
+            failures["skills"] -= 1
+            return True
+        return False
+
+    calls = _fake_llm(monkeypatch, fail)
+    result = asyncio.run(_ai_parse_fields(_sample("classic_bullets.txt"), chunked=True))
+    assert set(result) == set(RESUME_SCHEMA)
+    assert calls.count(["skills"]) == 2
+
+
+def test_persistently_failing_chunk_drops_only_its_fields(monkeypatch):
+    _fake_llm(monkeypatch, lambda fields: fields == ["experience"])
+    monkeypatch.setattr(ai.settings, "PARSE_CHUNK_CHARS", 300, raising=False)
+    result = asyncio.run(_ai_parse_fields(_sample("classic_bullets.txt"), chunked=True))
+    # Both experience pieces failed, so the field is left to the caller
+    assert "experience" not in result
+    assert result["email"] == "email value" and result["skills"] == ["skills item"]
+
+
+def test_all_chunks_failing_raises(monkeypatch):
+    _fake_llm(monkeypatch, lambda fields: True)
+    try:
+        asyncio.run(_ai_parse_fields(_sample("classic_bullets.txt"), chunked=True))
+    except OpenRouterError:
+        pass
+    else:
+        raise AssertionError("Expected the parse to fail")
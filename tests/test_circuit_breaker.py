@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from app.utils import ai, circuit_breaker
+from app.utils.ai import OpenRouterError
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def _open_breaker(**kwargs) -> CircuitBreaker:
+    breaker = CircuitBreaker("model", min_calls=4, **kwargs)
+    for _ in range(4):
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_opens_on_failure_rate_once_window_is_full():
+    breaker = CircuitBreaker("model", min_calls=4)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_success(0.1)
+    assert breaker.state == OPEN and breaker.counters["opened"] == 1
+
+
+def test_opens_on_slow_call_rate():
+    breaker = CircuitBreaker("model", min_calls=4, slow_call_threshold=1.0)
+    for _ in range(4):
+        breaker.record_success(2.0)
+    assert breaker.state == OPEN and breaker.counters["slow_calls"] == 4
+
+
+def test_open_refuses_until_duration_elapses():
+    breaker = _open_breaker(open_duration=60.0)
+    assert not breaker.allow_request()
+    assert breaker.counters["rejected"] == 1
+
+    breaker._opened_at -= 60.0
+    assert breaker.allow_request() and breaker.state == HALF_OPEN
+    assert not breaker.allow_request()  # one probe at a time
+
+
+def test_healthy_probes_close():
+    breaker = _open_breaker(open_duration=0.0)
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_success(0.1)
+    assert breaker.state == CLOSED and breaker.stats()["window_calls"] == 0
+
+
+def test_failed_probe_reopens():
+    breaker = _open_breaker(open_duration=0.0)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == OPEN and breaker.counters["opened"] == 2
+
+
+def test_cancelled_probe_frees_its_slot():
+    breaker = _open_breaker(open_duration=0.0)
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+
+def test_listeners_see_transitions():
+    seen = []
+    breaker = CircuitBreaker("model", min_calls=1, open_duration=0.0)
+    breaker.add_listener(lambda name, old, new, reason: seen.append((old, new)))
+    breaker.record_failure()
+    breaker.refresh_state()
+    assert seen == [(CLOSED, OPEN), (OPEN, HALF_OPEN)]
+
+
+def test_primary_probes_its_own_breaker_without_fallback(monkeypatch):
+    breaker = _open_breaker(open_duration=0.0)
+    monkeypatch.setitem(circuit_breaker._breakers, "primary/only", breaker)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_MODEL", "primary/only", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_API_KEY", "test", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_FALLBACK_MODEL", None, raising=False)
+    calls = []
+
+    async def call_openrouter(messages, model, response_format=None, temperature=0.1, task=None):
+        calls.append(model)
+        breaker.record_success(0.1)
+        return "ok"
+
+    monkeypatch.setattr(ai, "_call_openrouter", call_openrouter)
+    for _ in range(2):
+        assert asyncio.run(ai._call_with_fallback([], temperature=0.1)) == ("ok", "primary/only")
+    assert calls == ["primary/only"] * 2
+    assert breaker.state == CLOSED
+
+
+def test_open_primary_goes_straight_to_fallback(monkeypatch):
+    breaker = _open_breaker(open_duration=60.0)
+    monkeypatch.setitem(circuit_breaker._breakers, "primary/model", breaker)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_MODEL", "primary/model", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_API_KEY", "test", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_FALLBACK_MODEL", "fallback/model", raising=False)
+    calls = []
+
+    async def call_openrouter(messages, model, response_format=None, temperature=0.1, task=None):
+        calls.append(model)
+        if model == "primary/model":
+            raise OpenRouterError("down")
+        return "fallback answer"
+
+    monkeypatch.setattr(ai, "_call_openrouter", call_openrouter)
+    assert asyncio.run(ai._call_with_fallback([], temperature=0.1)) == ("fallback answer", "fallback/model")
+    assert calls == ["fallback/model"]
+
+
+def test_missing_api_key_does_not_take_a_probe_slot(monkeypatch):
+    breaker = _open_breaker(open_duration=0.0)
+    monkeypatch.setitem(circuit_breaker._breakers, "primary/model", breaker)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_MODEL", "primary/model", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_FALLBACK_MODEL", "fallback/model", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_API_KEY", None, raising=False)
+    for _ in range(3):
+        with pytest.raises(OpenRouterError, match="OPENROUTER_API_KEY"):
+            asyncio.run(ai._call_with_fallback([], temperature=0.1))
+    assert breaker.state == OPEN and breaker._probes_in_flight == 0
+
+    monkeypatch.setattr(ai.settings, "OPENROUTER_API_KEY", "test", raising=False)
+    assert breaker.allow_request() and breaker.state == HALF_OPEN
@@ -0,0 +1,60 @@
+from collections import Counter
+
+import pytest
+
+from app.utils.corpus_stats import CorpusStats
+
+
+def _corpus() -> CorpusStats:
+    corpus = CorpusStats()
+    corpus.add("a", "Python engineer building Django services on AWS")
+    corpus.add("b", "Java developer with Spring and Kubernetes experience")
+    corpus.add("c", "Data analyst using SQL and Tableau dashboards")
+    return corpus
+
+
+def test_bm25_rewards_repeats_with_saturation():
+    corpus = _corpus()
+    length = corpus.avg_length
+    weights = [corpus.term_weight(tf, length, "bm25") for tf in (1, 2, 5, 50)]
+    assert weights == sorted(weights) and len(set(weights)) == 4
+    assert weights[0] == pytest.approx(1.0)  # one mention in an average-length resume
+    assert weights[-1] < corpus.k1 + 1
+
+
+def test_bm25_discounts_long_resumes():
+    corpus = _corpus()
+    assert corpus.term_weight(2, 200, "bm25") < corpus.term_weight(2, 20, "bm25")
+
+
+def test_tfidf_counts_any_match_once():
+    corpus = _corpus()
+    assert corpus.term_weight(1, 10, "tfidf") == corpus.term_weight(9, 500, "tfidf") == 1.0
+    assert corpus.term_weight(0, 10, "bm25") == 0.0
+
+
+def test_percentage_is_coverage_and_repeats_only_raise_the_ranking_score():
+    corpus = _corpus()
+    keywords = {"python", "aws"}
+    length = round(corpus.avg_length)
+    once = corpus.score(keywords, Counter({"python": 1, "aws": 1}), length, "bm25")
+    often = corpus.score(keywords, Counter({"python": 6, "aws": 6}), length, "bm25")
+    tfidf = corpus.score(keywords, Counter({"python": 1, "aws": 1}), length, "tfidf")
+    assert once["total_matched"] == often["total_matched"] == 2
+    assert once["match_percentage"] == often["match_percentage"] == tfidf["match_percentage"] == 100.0
+    assert once["weighted_score"] < often["weighted_score"]
+    assert corpus.score(keywords, Counter({"python": 3}), length, "tfidf")["match_percentage"] < 100.0
+
+
+def test_single_mentions_in_a_long_resume_get_partial_credit():
+    corpus = _corpus()
+    keywords = {"python", "aws"}
+    long = corpus.score(keywords, Counter({"python": 1, "aws": 1}), 200, "bm25")
+    assert 0.0 < long["match_percentage"] < 100.0
+
+
+def test_missing_keywords_ranked_by_idf():
+    corpus = _corpus()
+    result = corpus.score_text("Python", {"python", "kubernetes", "engineer"}, "tfidf")
+    assert result["matched_keywords"] == ["python"]
+    assert set(result["missing_keywords"]) == {"kubernetes", "engineer"}
@@ -0,0 +1,129 @@
+import asyncio
+from pathlib import Path
+
+from app.utils import dedupe
+from app.utils.dedupe import DedupeIndex, jaccard, lsh_params, parse_resume_deduped, shingles
+
+SAMPLE = (Path(__file__).parent.parent / "benchmarks" / "samples" / "classic_bullets.txt").read_text(encoding="utf-8")
+OTHER_HEADER = (
+    "Rahul Verma\n"
+    "Senior Backend Engineer\n"
+    "rahul.verma@example.com | +91 99887 76655 | Chennai, India\n"
+)
+
+
+# The short sample shares ~0.8 of its shingles with _other_candidate()
+THRESHOLD = 0.7
+
+
+def _other_candidate() -> str:
+    """Same body as SAMPLE under a different candidate's header."""
+    return OTHER_HEADER + SAMPLE.split("\n", 4)[4]
+
+
+def _fake_parse(calls):
+    async def parse(text):
+        calls.append(text)
+        return {"name": "parsed", "email": "parsed@example.com", "experience": [{"role": "from llm"}]}
+    return parse
+
+
+def test_lsh_params_meets_recall():
+    bands, rows = lsh_params(0.85, 128)
+    assert bands * rows <= 128
+    assert 1 - (1 - 0.85 ** rows) ** bands >= 0.95
+
+
+def test_signature_estimates_jaccard():
+    index = DedupeIndex()
+    a, b = SAMPLE, _other_candidate()
+    estimate = index.similarity(index.signature(a), index.signature(b))
+    assert abs(estimate - jaccard(shingles(a), shingles(b))) < 0.1
+
+
+def test_signature_is_deterministic_per_seed():
+    assert (DedupeIndex(seed=7).signature(SAMPLE) == DedupeIndex(seed=7).signature(SAMPLE)).all()
+
+
+def test_find_exact_and_near_duplicates():
+    index = DedupeIndex(threshold=THRESHOLD)
+    index.add("priya", SAMPLE, parsed={"name": "Priya Sharma"})
+
+    exact = index.find(SAMPLE.upper().replace("\n", "  \n"))
+    assert exact.doc_id == "priya" and exact.exact and exact.similarity == 1.0
+
+    near = index.find(_other_candidate())
+    assert near.doc_id == "priya" and not near.exact and near.similarity >= index.threshold
+
+    assert index.find("Completely unrelated text about gardening and tomatoes") is None
+
+
+def test_remove_keeps_other_exact_copy():
+    index = DedupeIndex()
+    index.add("a", SAMPLE)
+    index.add("b", SAMPLE)
+    assert index.remove("a")
+    assert index.find(SAMPLE).doc_id == "b"
+    assert index.remove("b") and index.find(SAMPLE) is None
+    assert len(index) == 0
+
+
+def test_persists_and_rejects_other_config(tmp_path):
+    path = str(tmp_path / "dedupe.db")
+    index = DedupeIndex(db_path=path, threshold=THRESHOLD)
+    index.add("priya", SAMPLE, parsed={"name": "Priya Sharma"})
+
+    reloaded = DedupeIndex(db_path=path, threshold=THRESHOLD)
+    match = reloaded.find(_other_candidate())
+    assert match.doc_id == "priya" and match.parsed == {"name": "Priya Sharma"}
+
+    try:
+        DedupeIndex(db_path=path, num_perm=64)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected a config mismatch")
+
+
+def test_exact_duplicate_reuses_stored_parse(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dedupe, "parse_resume", _fake_parse(calls))
+    index = DedupeIndex()
+    stored = {"name": "Priya Sharma", "email": "priya.sharma@example.com", "experience": [{"role": "stored"}]}
+    index.add("priya", SAMPLE, parsed=stored)
+
+    parsed, match = asyncio.run(parse_resume_deduped("copy", SAMPLE, index))
+    assert match.exact and parsed == stored and not calls
+
+
+def test_near_duplicate_does_not_reuse_contact_fields(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dedupe, "parse_resume", _fake_parse(calls))
+    index = DedupeIndex(threshold=THRESHOLD)
+    stored = {
+        "name": "Priya Sharma", "title": "Senior Backend Engineer", "email": "priya.sharma@example.com",
+        "phone": "+91 98765 43210", "location": "Bengaluru, India", "website": "linkedin.com/in/priyasharma",
+        "experience": [{"role": "stored"}],
+    }
+    index.add("priya", SAMPLE, parsed=stored)
+
+    parsed, match = asyncio.run(parse_resume_deduped("rahul", _other_candidate(), index))
+    assert match is not None and not match.exact and not calls
+    assert parsed["name"] == "Rahul Verma"
+    assert parsed["email"] == "rahul.verma@example.com"
+    assert parsed["phone"] == "+91 99887 76655"
+    assert parsed["website"] == ""
+    assert parsed["experience"] == [{"role": "stored"}]
+    # The stored parse of the original is untouched
+    assert index.find(SAMPLE).parsed["name"] == "Priya Sharma"
+
+
+def test_near_duplicate_without_contact_details_is_parsed(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dedupe, "parse_resume", _fake_parse(calls))
+    index = DedupeIndex(threshold=THRESHOLD)
+    index.add("priya", SAMPLE, parsed={"name": "Priya Sharma", "email": "priya.sharma@example.com"})
+
+    anonymous = "Senior Backend Engineer\n" + SAMPLE.split("\n", 4)[4]
+    parsed, match = asyncio.run(parse_resume_deduped("anon", anonymous, index))
+    assert match is not None and len(calls) == 1 and parsed["name"] == "parsed"
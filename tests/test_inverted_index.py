@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from app.utils.inverted_index import InvertedIndex
+from app.utils.jd_profiles import JDProfile
+
+TERMS = [f"term{i}" for i in range(40)]
+
+
+def _corpus(seed=7, resumes=300):
+    rng = random.Random(seed)
+    # A skewed vocabulary, so some posting lists are long and others short
+    return {
+        f"r{i}": {term for term in TERMS if rng.random() < 0.6 / (1 + TERMS.index(term) / 8)}
+        for i in range(resumes)
+    }
+
+
+def _brute_force(corpus, keywords, weights, top_k):
+    """Weighted matches for every resume; ties go to the earlier upload."""
+    scored = [
+        (sum(weights.get(k, 1.0) for k in keywords & terms), order, resume_id)
+        for order, (resume_id, terms) in enumerate(corpus.items())
+    ]
+    scored = [entry for entry in scored if entry[0] > 0]
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [(resume_id, score) for score, _, resume_id in scored[:top_k]]
+
+
+def _query(seed):
+    rng = random.Random(seed)
+    keywords = set(rng.sample(TERMS, rng.randint(1, 12)))
+    weights = {k: rng.choice([0.5, 1.0, 2.0]) for k in keywords}
+    return JDProfile(jd_hash=str(seed), text="", keywords=keywords, weights=weights)
+
+
+def _ids_and_scores(results, profile):
+    return [(r["id"], sum(profile.weight(k) for k in r["matched_keywords"])) for r in results]
+
+
+def _apply_edits(index, corpus):
+    """Deletes a few resumes and re-uploads others, mirroring it in the corpus dict."""
+    for resume_id in ["r3", "r50", "r51", "r299"]:
+        index.delete(resume_id)
+        del corpus[resume_id]
+    for resume_id in ["r10", "r200"]:
+        terms = set(TERMS[::3])
+        index.add_keywords(resume_id, terms)
+        corpus.pop(resume_id)
+        corpus[resume_id] = terms
+
+
+@pytest.mark.parametrize("top_k", [1, 5, 40])
+def test_wand_matches_brute_force(tmp_path, top_k):
+    corpus = _corpus()
+    index = InvertedIndex(block_size=4)
+    for resume_id, terms in list(corpus.items())[:200]:
+        index.add_keywords(resume_id, terms)
+    index.save(str(tmp_path / "postings.bin"))
+    # The rest stay in memory, so search merges file and memory postings
+    for resume_id, terms in list(corpus.items())[200:]:
+        index.add_keywords(resume_id, terms)
+    _apply_edits(index, corpus)
+
+    for seed in range(30):
+        profile = _query(seed)
+        expected = _brute_force(corpus, profile.keywords, profile.weights, top_k)
+        got = _ids_and_scores(index.search(profile, top_k=top_k), profile)
+        assert got == expected
+
+
+def test_saved_index_reloads_with_the_same_results(tmp_path):
+    corpus = _corpus(seed=2, resumes=120)
+    index = InvertedIndex(block_size=8)
+    for resume_id, terms in corpus.items():
+        index.add_keywords(resume_id, terms)
+    index.delete("r7")
+    path = str(tmp_path / "postings.bin")
+    index.save(path)
+    profile = _query(3)
+    before = index.search(profile, top_k=10)
+    index.close()
+
+    reloaded = InvertedIndex.load(path, block_size=8)
+    assert reloaded.search(profile, top_k=10) == before
+    assert all(r["id"] != "r7" for r in before)
+    reloaded.close()
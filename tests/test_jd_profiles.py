@@ -0,0 +1,59 @@
+import asyncio
+
+from app.utils import jd_profiles
+from app.utils.jd_profiles import JDProfile, JDProfileRegistry, jd_hash
+
+JD = "Backend engineer: Python, AWS"
+
+
+def _builder(calls, delay=0.05):
+    async def build(text):
+        calls.append(text)
+        await asyncio.sleep(delay)
+        return JDProfile(jd_hash=jd_hash(text), text=text, keywords={"python", "aws"})
+    return build
+
+
+def test_concurrent_requests_share_one_build():
+    registry = JDProfileRegistry()
+    calls = []
+
+    async def main():
+        return await asyncio.gather(*(registry.get_or_create(JD, _builder(calls)) for _ in range(5)))
+
+    profiles = asyncio.run(main())
+    assert calls == [JD]
+    assert all(profile is profiles[0] for profile in profiles)
+
+
+def test_cancelled_builder_does_not_cancel_the_waiters():
+    registry = JDProfileRegistry()
+    calls = []
+
+    async def main():
+        builder = asyncio.create_task(registry.get_or_create(JD, _builder(calls)))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(registry.get_or_create(JD, _builder(calls))) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        builder.cancel()
+        results = await asyncio.gather(*waiters)
+        return builder, results
+
+    builder, results = asyncio.run(main())
+    assert builder.cancelled()
+    assert all(profile.keywords == {"python", "aws"} for profile in results)
+    # One rebuild after the cancelled attempt, shared by every waiter
+    assert calls == [JD, JD]
+    assert registry.counters["builds"] == 1
+
+
+def test_changing_the_keyword_mode_rebuilds_the_profile(monkeypatch):
+    registry = JDProfileRegistry()
+    calls = []
+    monkeypatch.setattr(jd_profiles.settings, "JD_KEYWORD_MODE", "llm", raising=False)
+    asyncio.run(registry.get_or_create(JD, _builder(calls, delay=0)))
+    asyncio.run(registry.get_or_create(JD, _builder(calls, delay=0)))
+    monkeypatch.setattr(jd_profiles.settings, "JD_KEYWORD_MODE", "local", raising=False)
+    asyncio.run(registry.get_or_create(JD, _builder(calls, delay=0)))
+    assert calls == [JD, JD]
+    assert jd_hash(JD, "llm") != jd_hash(JD, "local") == jd_hash(JD)
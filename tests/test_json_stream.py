@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from app.utils.json_stream import JSONObjectStream
+
+DOCUMENT = {
+    "name": "Jane \"JD\" Doe, {Ph.D.}",
+    "email": "jane@example.com",
+    "skills": ["Python", "C++, Rust", "[SQL]"],
+    "experience": [
+        {"title": "Engineer", "bullets": ["Built {things}", "Cut cost 30%"]},
+        {"title": "Intern", "bullets": []},
+    ],
+    "summary": None,
+    "years": 6,
+}
+
+
+def _stream(text, size):
+    stream = JSONObjectStream()
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(stream.feed(text[i:i + size]))
+    return stream, events
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+def test_any_chunking_rebuilds_the_object(size):
+    text = "```json\n" + json.dumps(DOCUMENT, indent=2) + "\n```"
+    stream, events = _stream(text, size)
+    assert stream.done
+    assert stream.result == DOCUMENT
+    assert [e["key"] for e in events if e["type"] == "field"] == list(DOCUMENT)
+    items = [(e["key"], e["index"], e["value"]) for e in events if e["type"] == "item"]
+    assert items == [
+        ("skills", 0, "Python"), ("skills", 1, "C++, Rust"), ("skills", 2, "[SQL]"),
+        ("experience", 0, DOCUMENT["experience"][0]), ("experience", 1, DOCUMENT["experience"][1]),
+    ]
+
+
+def test_fields_are_emitted_before_the_object_closes():
+    stream = JSONObjectStream()
+    assert stream.feed('{"name": "Jane", "email": "ja') == [{"type": "field", "key": "name", "value": "Jane"}]
+    assert stream.feed('ne@example.com", "skills": ["Go", ') == [
+        {"type": "field", "key": "email", "value": "jane@example.com"},
+        {"type": "item", "key": "skills", "index": 0, "value": "Go"},
+    ]
+    assert not stream.done
+
+
+def test_text_after_the_object_is_ignored():
+    stream = JSONObjectStream()
+    stream.feed('{"a": 1}')
+    assert stream.feed(' trailing {"b": 2}') == []
+    assert stream.result == {"a": 1}
+
+
+def test_empty_object():
+    stream, events = _stream("{}", 1)
+    assert stream.done and stream.result == {} and events == []
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from app.utils.jd_profiles import JDProfile
+from app.utils.keyword_index import KeywordIndex
+
+TERMS = [f"term{i}" for i in range(40)]
+
+
+def _corpus(seed=7, resumes=300):
+    rng = random.Random(seed)
+    # A skewed vocabulary, so some posting lists are long and others short
+    return {
+        f"r{i}": {term for term in TERMS if rng.random() < 0.6 / (1 + TERMS.index(term) / 8)}
+        for i in range(resumes)
+    }
+
+
+def _brute_force(corpus, keywords, weights, top_k):
+    """Weighted matches for every resume; ties go to the earlier upload."""
+    scored = [
+        (sum(weights.get(k, 1.0) for k in keywords & terms), order, resume_id)
+        for order, (resume_id, terms) in enumerate(corpus.items())
+    ]
+    scored = [entry for entry in scored if entry[0] > 0]
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [(resume_id, score) for score, _, resume_id in scored[:top_k]]
+
+
+def _query(seed):
+    rng = random.Random(seed)
+    keywords = set(rng.sample(TERMS, rng.randint(1, 12)))
+    weights = {k: rng.choice([0.5, 1.0, 2.0]) for k in keywords}
+    return JDProfile(jd_hash=str(seed), text="", keywords=keywords, weights=weights)
+
+
+def _ids_and_scores(results, profile):
+    return [(r["id"], sum(profile.weight(k) for k in r["matched_keywords"])) for r in results]
+
+
+def _apply_edits(index, corpus):
+    """Deletes a few resumes and re-uploads others, mirroring it in the corpus dict."""
+    for resume_id in ["r3", "r50", "r51", "r299"]:
+        index.remove(resume_id)
+        del corpus[resume_id]
+    for resume_id in ["r10", "r200"]:
+        terms = set(TERMS[::3])
+        index.add_keywords(resume_id, terms)
+        corpus.pop(resume_id)
+        corpus[resume_id] = terms
+
+
+@pytest.mark.parametrize("top_k", [1, 5, 40])
+def test_keyword_index_matches_brute_force(top_k):
+    corpus = _corpus()
+    index = KeywordIndex(compact_ratio=0.01)
+    for resume_id, terms in corpus.items():
+        index.add_keywords(resume_id, terms)
+    index.score({"term0"})  # flush, so the edits below land in a second pending batch
+    _apply_edits(index, corpus)
+
+    for seed in range(30):
+        profile = _query(seed)
+        expected = _brute_force(corpus, profile.keywords, profile.weights, top_k)
+        got = _ids_and_scores(index.score(profile, top_k=top_k), profile)
+        # KeywordIndex returns top_k rows even when they match nothing
+        assert [entry for entry in got if entry[1] > 0] == expected
+
+
+def test_keyword_index_reports_matched_and_missing_terms():
+    index = KeywordIndex()
+    index.add_keywords("a", {"python", "aws", "docker"})
+    index.add_keywords("b", {"python"})
+    [best] = index.score({"python", "aws", "kubernetes"}, top_k=1)
+    assert best["id"] == "a"
+    assert best["matched_keywords"] == ["aws", "python"]
+    assert best["missing_keywords"] == ["kubernetes"]
+    assert best["match_percentage"] == 66.7
@@ -0,0 +1,78 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from app.utils import ai, llm_cache
+from app.utils.llm_cache import ResponseCache, should_cache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    response_cache = ResponseCache()
+    monkeypatch.setattr(llm_cache, "_response_cache", response_cache)
+    monkeypatch.setattr(ai.settings, "LLM_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_MODEL", "primary/model", raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_FALLBACK_MODEL", "fallback/model", raising=False)
+    return response_cache
+
+
+def test_batch_tasks_follow_their_single_call_policy(monkeypatch):
+    monkeypatch.setattr(ai.settings, "LLM_CACHE_ENABLED", True, raising=False)
+    assert should_cache("quality_score_batch", 0.1) is should_cache("quality_score", 0.1) is True
+    assert should_cache("bullets_multi", 0.35) is should_cache("bullets", 0.35) is False
+
+
+def test_primary_answer_is_cached(monkeypatch, cache):
+    calls = []
+
+    async def call_with_fallback(messages, temperature=0.1, response_format=None, hedge=None, task=None):
+        calls.append(task)
+        return '{"score": 80}', "primary/model"
+
+    monkeypatch.setattr(ai, "_call_with_fallback", call_with_fallback)
+    messages = [{"role": "user", "content": "score this"}]
+    for _ in range(2):
+        assert asyncio.run(ai.chat_json(messages, task="quality_score")) == {"score": 80}
+    assert calls == ["quality_score"]
+
+
+@pytest.mark.parametrize("chat", ["chat_json", "chat_text"])
+def test_fallback_answer_is_not_cached_under_the_primary_key(monkeypatch, cache, chat):
+    answers = iter([('{"score": 40}', "fallback/model"), ('{"score": 80}', "primary/model")])
+
+    async def call_with_fallback(messages, temperature=0.1, response_format=None, hedge=None, task=None):
+        return next(answers)
+
+    monkeypatch.setattr(ai, "_call_with_fallback", call_with_fallback)
+    messages = [{"role": "user", "content": "score this"}]
+    first = asyncio.run(getattr(ai, chat)(messages, task="quality_score"))
+    second = asyncio.run(getattr(ai, chat)(messages, task="quality_score"))
+    assert first != second
+    assert cache.counters["writes"] == 1
+
+
+def test_disk_tier_closes_its_connections_and_counts_expirations(monkeypatch, tmp_path):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    path = str(tmp_path / "cache.db")
+    writer = ResponseCache(db_path=path)
+    asyncio.run(writer.set("live", "a"))
+    asyncio.run(writer.set("stale", "b", ttl=-1))
+
+    reader = ResponseCache(db_path=path)
+    assert asyncio.run(reader.get("live")) == "a"
+    assert asyncio.run(reader.get("stale")) is None
+    assert reader.counters["disk_hits"] == 1
+    assert reader.counters["expirations"] == 1
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.utils import ai, hedging, rate_limit
+from app.utils.hedging import LatencyTracker
+from app.utils.rate_limit import AdaptiveRateLimiter
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """
+    Mock OpenRouter that throttles the first request (Retry-After 0.2s) and
+    answers later ones after 0.05s. Returns the latency tracker in use.
+    """
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        await asyncio.sleep(0.05)
+        if json.loads(request.content).get("stream"):
+            body = 'data: {"choices": [{"delta": {"content": "hello"}}]}\n\ndata: [DONE]\n\n'
+            return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+        return httpx.Response(200, json={"choices": [{"message": {"content": "hello"}}]})
+
+    tracker = LatencyTracker()
+    monkeypatch.setattr(ai, "get_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limit, "_rate_limiter", AdaptiveRateLimiter(base_delay=0.01))
+    monkeypatch.setattr(hedging, "_latency_tracker", tracker)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_API_KEY", "test", raising=False)
+    return tracker
+
+
+def _timed(coro_fn):
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await coro_fn()
+        return result, loop.time() - start
+    return asyncio.run(run())
+
+
+def test_latency_excludes_retry_backoff(provider):
+    content, total = _timed(lambda: ai._call_openrouter(MESSAGES, model="latency/model"))
+    assert content == "hello"
+    assert total >= 0.25
+    assert provider.count("latency/model") == 1
+    assert 0.05 <= provider.percentile("latency/model", 50) < 0.15
+
+
+def test_stream_latency_excludes_retry_backoff(provider):
+    async def consume():
+        return "".join([delta async for delta in ai._stream_openrouter(MESSAGES, model="latency/stream")])
+
+    content, total = _timed(consume)
+    assert content == "hello"
+    assert total >= 0.25
+    assert 0.05 <= provider.percentile("latency/stream", 50) < 0.15
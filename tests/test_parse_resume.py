@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.utils import ai, parse_metrics
+from app.utils.ai import RESUME_SCHEMA, OpenRouterError, parse_resume
+from app.utils.parse_metrics import ParseMetrics
+
+SAMPLES = Path(__file__).parent.parent / "benchmarks" / "samples"
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    fresh = ParseMetrics()
+    monkeypatch.setattr(parse_metrics, "_parse_metrics", fresh)
+    return fresh
+
+
+def _llm(monkeypatch, answer):
+    escalated = []
+
+    async def ai_parse_fields(text, fields=None, chunked=None):
+        escalated.append(list(fields))
+        if isinstance(answer, Exception):
+            raise answer
+        return {field: value for field, value in answer.items() if field in fields}
+
+    monkeypatch.setattr(ai, "_ai_parse_fields", ai_parse_fields)
+    return escalated
+
+
+def test_confident_resume_skips_the_llm(monkeypatch, metrics):
+    escalated = _llm(monkeypatch, {})
+    result = asyncio.run(parse_resume((SAMPLES / "classic_bullets.txt").read_text(encoding="utf-8")))
+    assert result["name"] == "Priya Sharma" and not escalated
+    assert metrics.counters["rules"] == 1 and metrics.counters["fields_from_rules"] == len(RESUME_SCHEMA)
+
+
+def test_low_confidence_fields_are_escalated(monkeypatch, metrics):
+    escalated = _llm(monkeypatch, {"projects": [{"name": "Parser", "details": "", "link": ""}]})
+    result = asyncio.run(parse_resume((SAMPLES / "academic_cv.txt").read_text(encoding="utf-8")))
+    fields = escalated[0]
+    assert "education" in fields and "name" not in fields
+    assert result["projects"][0]["name"] == "Parser"
+    stats = metrics.stats()
+    assert stats["hybrid"] == 1
+    assert stats["fields_from_llm"] == 1
+    # Escalated fields the LLM left out keep their rule values but count as failed
+    assert stats["fields_failed"] == len(fields) - 1
+
+
+def test_llm_outage_degrades_to_rules_and_is_recorded(monkeypatch, metrics):
+    escalated = _llm(monkeypatch, OpenRouterError("provider down"))
+    result = asyncio.run(parse_resume((SAMPLES / "academic_cv.txt").read_text(encoding="utf-8")))
+    assert "error" not in result and result["email"] == "elena.rossi@example.edu"
+    stats = metrics.stats()
+    assert stats["calls"] == 1 and stats["rules"] == 1 and stats["llm_failed"] == 1
+    assert stats["fields_failed"] == len(escalated[0])
+    assert stats["fields_from_rules"] == len(RESUME_SCHEMA) - len(escalated[0])
+    assert stats["field_coverage"] < 1.0
+
+
+def test_llm_outage_without_contact_details_fails(monkeypatch, metrics):
+    _llm(monkeypatch, OpenRouterError("provider down"))
+    result = asyncio.run(parse_resume("just some words without any structure"))
+    assert "error" in result
+    assert metrics.counters["failed"] == 1 and metrics.counters["fields_failed"] == len(RESUME_SCHEMA)
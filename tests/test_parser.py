@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from app.utils.parser import TIER1_CONFIDENCE_THRESHOLD, parse_education_section, parse_sections
+
+SAMPLES = Path(__file__).parent.parent / "benchmarks" / "samples"
+
+
+def test_institution_commas_are_kept():
+    assert parse_education_section("B.S. Computer Science, University of California, Berkeley, 2015 - 2019") == [
+        {"degree": "B.S. Computer Science", "institution": "University of California, Berkeley", "period": "2015 - 2019"}
+    ]
+    assert parse_education_section("B.Tech | National Institute of Technology, Trichy | 2013 - 2017")[0][
+        "institution"] == "National Institute of Technology, Trichy"
+
+
+def test_institution_first_lines():
+    assert parse_education_section("Stanford University, MBA, 2012") == [
+        {"degree": "MBA", "institution": "Stanford University", "period": "2012"}
+    ]
+    # A state code is not a degree
+    assert parse_education_section("Harvard University, Cambridge, MA\nMaster of Business Administration") == [
+        {"degree": "Master of Business Administration", "institution": "Harvard University, Cambridge, MA", "period": ""}
+    ]
+
+
+def test_degree_from_institution():
+    assert parse_education_section("B.Tech CSE from ABC College, 2019") == [
+        {"degree": "B.Tech CSE", "institution": "ABC College", "period": "2019"}
+    ]
+
+
+def test_unsplittable_education_line_is_escalated():
+    result = parse_sections((SAMPLES / "academic_cv.txt").read_text(encoding="utf-8"))
+    assert result["education"][1] == {
+        "degree": "MSc Computer Science, Politecnico di Milano", "institution": "", "period": "2014 - 2016"
+    }
+    assert result["confidence"]["education"] < TIER1_CONFIDENCE_THRESHOLD
+
+
+def test_structured_resume_is_confident():
+    result = parse_sections((SAMPLES / "classic_bullets.txt").read_text(encoding="utf-8"))
+    assert result["name"] == "Priya Sharma"
+    assert result["email"] == "priya.sharma@example.com"
+    assert result["education"][0]["institution"] == "National Institute of Technology, Trichy"
+    assert result["confidence"]["education"] >= TIER1_CONFIDENCE_THRESHOLD
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from app.utils.ai import _parse_quality_batch, build_quality_batch_prompt, estimate_tokens, pack_quality_batches
+
+JOB = "Backend engineer: Python, PostgreSQL, AWS, Kubernetes. " * 5
+
+
+def _resumes(seed=1, count=60):
+    rng = random.Random(seed)
+    return ["x" * rng.choice([200, 800, 1500, 3000, 9000]) for _ in range(count)]
+
+
+@pytest.mark.parametrize("budget,max_batch", [(1500, 8), (3000, 4), (6000, 8), (20000, 3)])
+def test_batches_cover_every_resume_in_order_within_limits(budget, max_batch):
+    resumes = _resumes()
+    batches = pack_quality_batches(resumes, JOB, token_budget=budget, max_batch=max_batch)
+    assert [i for batch in batches for i in batch] == list(range(len(resumes)))
+    for batch in batches:
+        assert 1 <= len(batch) <= max_batch
+        if len(batch) > 1:
+            prompt = build_quality_batch_prompt(JOB, [(f"r{n + 1}", resumes[i]) for n, i in enumerate(batch)])
+            assert estimate_tokens(prompt) <= budget
+
+
+def test_short_resumes_pack_more_per_call():
+    short = pack_quality_batches(["x" * 200] * 16, JOB, token_budget=3000, max_batch=16)
+    long = pack_quality_batches(["x" * 2000] * 16, JOB, token_budget=3000, max_batch=16)
+    assert len(short) < len(long)
+
+
+def test_resume_over_budget_gets_its_own_batch():
+    resumes = ["x" * 400, "x" * 100_000, "x" * 400]
+    assert pack_quality_batches(resumes, JOB, token_budget=700, max_batch=8) == [[0], [1], [2]]
+
+
+def test_parse_keeps_only_valid_known_scores():
+    result = {"scores": [
+        {"id": "r1", "total": 21},
+        {"id": "r2", "total": "17.5"},
+        {"id": "r3", "total": 45},
+        {"id": "r4", "total": None},
+        {"id": "r9", "total": 10},
+        {"total": 12},
+        "r5",
+    ]}
+    assert _parse_quality_batch(result, {"r1", "r2", "r3", "r4", "r5"}) == {"r1": 21.0, "r2": 17.5}
+    assert _parse_quality_batch({"scores": "none"}, {"r1"}) == {}
+    assert _parse_quality_batch([], {"r1"}) == {}
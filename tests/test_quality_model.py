@@ -0,0 +1,19 @@
+import asyncio
+
+from app.utils import quality_model
+from app.utils.quality_model import log_llm_scores, read_score_log
+
+
+def test_scores_are_appended_to_the_log(monkeypatch, tmp_path):
+    path = tmp_path / "scores.jsonl"
+    monkeypatch.setattr(quality_model.settings, "QUALITY_SCORE_LOG_PATH", str(path), raising=False)
+    asyncio.run(log_llm_scores([([0.5, 1.0], 21.0)]))
+    asyncio.run(log_llm_scores(iter([([0.1, 0.2], 12.0), ([0.3, 0.4], 18.0)])))
+    assert read_score_log(str(path)) == [([0.5, 1.0], 21.0), ([0.1, 0.2], 12.0), ([0.3, 0.4], 18.0)]
+
+
+def test_nothing_is_written_without_a_log_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(quality_model.settings, "QUALITY_SCORE_LOG_PATH", None, raising=False)
+    monkeypatch.chdir(tmp_path)
+    asyncio.run(log_llm_scores([([0.5], 21.0)]))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from app.utils import ai, llm_cache
+from app.utils.llm_cache import ResponseCache
+from app.utils.quality_model import read_score_log
+
+RESUME = "Jane Doe\nBuilt Python services on AWS, cutting latency 30%."
+JOB = "Backend engineer: Python, AWS"
+
+
+@pytest.fixture
+def setup(monkeypatch, tmp_path):
+    log = tmp_path / "scores.jsonl"
+    monkeypatch.setattr(llm_cache, "_response_cache", ResponseCache())
+    monkeypatch.setattr(ai.settings, "LLM_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(ai.settings, "OPENROUTER_MODEL", "primary/model", raising=False)
+    monkeypatch.setattr(ai.settings, "QUALITY_SCORE_LOG_PATH", str(log), raising=False)
+    calls = []
+
+    async def call_with_fallback(messages, temperature=0.1, response_format=None, hedge=None, task=None):
+        calls.append(task)
+        return '{"total": 24}', "primary/model"
+
+    monkeypatch.setattr(ai, "_call_with_fallback", call_with_fallback)
+    return log, calls
+
+
+def test_cached_scores_are_not_logged_again(setup):
+    log, calls = setup
+    for _ in range(3):
+        assert asyncio.run(ai.get_ai_quality_score(RESUME, JOB, mode="llm")) == 24.0
+    assert calls == ["quality_score"]
+    assert len(read_score_log(str(log))) == 1
+
+
+def test_llm_mode_skips_jd_keyword_extraction_when_features_are_unused(setup, monkeypatch):
+    monkeypatch.setattr(ai.settings, "QUALITY_SCORE_LOG_PATH", None, raising=False)
+
+    def extract(text):
+        raise AssertionError("JD keywords extracted for an LLM answer")
+
+    monkeypatch.setattr(ai, "_extract_jd_keywords_basic", extract)
+    assert asyncio.run(ai.get_ai_quality_score(RESUME, JOB, mode="llm")) == 24.0
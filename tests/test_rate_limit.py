@@ -0,0 +1,122 @@
+import asyncio
+
+import httpx
+
+from app.utils.rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+
+def _response(status: int, retry_after: str = None) -> httpx.Response:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(status, headers=headers, request=httpx.Request("POST", "http://stub"))
+
+
+def _sender(*responses):
+    queue = list(responses)
+
+    async def request():
+        return queue.pop(0)
+    return request
+
+
+async def _hold(limiter: AdaptiveRateLimiter, response: httpx.Response) -> None:
+    async with limiter.slot() as outcome:
+        outcome.record(response)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_additive_increase_per_window_of_successes():
+    limiter = AdaptiveRateLimiter(initial_concurrency=4)
+    for _ in range(4):
+        asyncio.run(_hold(limiter, _response(200)))
+    assert 4.9 < limiter.limit < 5.0
+    assert limiter.counters["successes"] == 4
+
+
+def test_multiplicative_decrease_once_per_burst_of_429s():
+    limiter = AdaptiveRateLimiter(initial_concurrency=8, min_concurrency=3)
+    for _ in range(3):
+        asyncio.run(_hold(limiter, _response(429)))
+    assert limiter.limit == 4.0
+    assert limiter.counters["throttled"] == 3
+
+    limiter._last_decrease -= 1.0
+    asyncio.run(_hold(limiter, _response(429)))
+    assert limiter.limit == 3.0  # floored at min_concurrency
+
+
+def test_increase_is_capped():
+    limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=2)
+    asyncio.run(_hold(limiter, _response(200)))
+    assert limiter.limit == 2.0
+
+
+def test_retry_after_pauses_everyone():
+    limiter = AdaptiveRateLimiter(max_retry_after=60.0)
+    asyncio.run(_hold(limiter, _response(429, "30")))
+    assert 29.0 < limiter.stats()["paused_for"] <= 30.0
+
+
+def test_retry_after_beyond_limit_gives_up_without_pausing():
+    limiter = AdaptiveRateLimiter(max_retry_after=60.0)
+    response = asyncio.run(limiter.send(_sender(_response(429, "3600"))))
+    assert response.status_code == 429
+    assert limiter.counters["gave_up"] == 1 and limiter.counters["retries"] == 0
+    assert limiter.stats()["paused_for"] == 0.0
+
+
+def test_send_retries_transient_errors():
+    limiter = AdaptiveRateLimiter(base_delay=0.001)
+    response = asyncio.run(limiter.send(_sender(_response(503), _response(502), _response(200))))
+    assert response.status_code == 200
+    assert limiter.counters["retries"] == 2 and limiter.counters["server_errors"] == 2
+
+
+def test_send_stops_after_max_retries():
+    limiter = AdaptiveRateLimiter(base_delay=0.001, max_retries=1)
+    response = asyncio.run(limiter.send(_sender(_response(503), _response(503), _response(200))))
+    assert response.status_code == 503
+    assert limiter.counters["gave_up"] == 1
+
+
+def test_client_errors_are_not_retried():
+    limiter = AdaptiveRateLimiter()
+    response = asyncio.run(limiter.send(_sender(_response(400), _response(200))))
+    assert response.status_code == 400 and limiter.counters["retries"] == 0
+
+
+def test_concurrency_limit_queues_callers():
+    async def run():
+        limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=2)
+        peak = 0
+
+        async def one():
+            nonlocal peak
+            async with limiter.slot() as outcome:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+                outcome.record(_response(200))
+
+        await asyncio.gather(*(one() for _ in range(6)))
+        return peak, limiter.in_flight
+
+    assert asyncio.run(run()) == (2, 0)
+
+
+def test_unlimited_rate_by_default_and_token_bucket_when_set():
+    async def elapsed(limiter, total):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(total):
+            await _hold(limiter, _response(200))
+        return loop.time() - start
+
+    assert asyncio.run(elapsed(AdaptiveRateLimiter(), 50)) < 0.05
+    # 2 from the burst, then 20 per second
+    assert asyncio.run(elapsed(AdaptiveRateLimiter(rate=20.0, burst=2), 4)) >= 0.09
@@ -0,0 +1,51 @@
+from app.utils.ai import count_keyword_usage
+from app.utils.skill_matcher import SkillMatcher, build_taxonomy, get_skill_matcher
+
+PLAIN_ENGLISH = (
+    "We should go home and rest less. The swift river runs past the shell of an old oracle "
+    "container. Ask the AI for an API. Go to the store before the rails rust. R&D was fun in "
+    "Spring 2021, and the express lane was open."
+)
+
+
+def test_plain_english_has_no_skills():
+    assert get_skill_matcher().skills(PLAIN_ENGLISH) == set()
+
+
+def test_ambiguous_skills_match_in_technical_context():
+    text = (
+        "Languages: Python, Go, R, Rust\n"
+        "Go, Java\n"
+        "Built REST APIs in Go and Swift with Spring Boot; analysis in R."
+    )
+    assert get_skill_matcher().skills(text) == {"python", "go", "r", "rust", "java", "rest", "swift", "spring"}
+
+
+def test_aliases_map_to_canonical_skills():
+    assert get_skill_matcher().skills("Deployed on k8s with golang and PostgreSQL") == {"kubernetes", "go", "sql"}
+
+
+def test_word_boundaries():
+    matcher = SkillMatcher(build_taxonomy({"java": ["java"], ".net": [".net"]}))
+    assert matcher.skills("javascript only") == set()
+    assert matcher.skills("asp.net and Java") == {".net", "java"}
+
+
+def test_leftmost_longest_and_overlapping():
+    matcher = SkillMatcher(build_taxonomy({"gcp": ["google cloud platform"], "cloud": ["cloud", "google cloud"]}))
+    hits = matcher.find("Google Cloud Platform")
+    assert [(hit.skill, hit.alias) for hit in hits] == [("gcp", "google cloud platform")]
+    nested = {hit.alias for hit in matcher.find("Google Cloud Platform", overlapping=True)}
+    assert nested == {"google cloud platform", "google cloud", "cloud"}
+
+
+def test_build_taxonomy_drops_shared_and_canonical_aliases():
+    taxonomy = build_taxonomy({"Django": ["django", "python"], "python": ["py"], "jest": ["testing"], "mocha": ["testing"]})
+    assert taxonomy == {"django": {"django"}, "python": {"python", "py"}, "jest": {"jest"}, "mocha": {"mocha"}}
+
+
+def test_count_keyword_usage_counts_each_listed_keyword():
+    text = "Python developer who ships AWS services"
+    assert count_keyword_usage(text, ["python", "python developer", "aws", "aws", "java"]) == 4
+    assert count_keyword_usage("javascript", ["java"]) == 0
+    assert count_keyword_usage(text, []) == 0